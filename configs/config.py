@@ -49,7 +49,200 @@ CONFIG = {
             "artificial", "singularity", "LocalLLaMA", "MachineLearning"
         ],
         "post_limit": 15,
-        "time_filter": "week"
+        "time_filter": "week",
+        "multireddit_size": 4,      # 한 번의 top 리스팅으로 묶어 조회할 서브레딧 수
+        "multireddit_overfetch": 2, # 묶음 리스팅을 서브레딧별 상한 합계의 몇 배까지 받을지
+        "max_concurrency": 3,       # 동시에 조회할 묶음 수
+    },
+
+    "HN_CONFIG": {
+        "enabled": True,
+        "max_stories": 100,         # 검토할 topstories 상위 개수
+        "story_limit": 30,          # 이만큼 관련 스토리를 찾으면 중단
+        "min_score": 50,
+        "batch_size": 10,
+        "item_ttl": 3600,           # 로컬 저장소의 아이템 재사용 시간(초)
+        "store_max_age": 7 * 24 * 3600,
+        "time_budget": 45,
+    },
+
+    "GITHUB_CONFIG": {
+        "enabled": True,
+        "languages": ["javascript", "typescript", "css", "html", "python"],
+        "languages_per_query": 5,   # 한 번의 OR 검색으로 묶을 언어 수
+        "per_page": 30,
+        "max_pages": 3,             # 관련 리포지토리가 부족할 때 더 볼 최대 페이지 수
+        "days": 7,                  # 최근 며칠 안에 생성된 리포지토리를 볼지
+        "cache_ttl": 6 * 3600,      # 같은 날 같은 검색은 이 시간 동안 캐시된 응답 사용
+        "time_budget": 60,
+    },
+
+    # 선택 소스 (scrapper/sources.py의 LobstersSource)
+    "LOBSTERS_CONFIG": {
+        "enabled": False,
+        "min_score": 5,
+        "limit": 15,
+    },
+
+    # X(Twitter) oEmbed 수집 (scrapper/x_embed_collector.py)
+    "X_CONFIG": {
+        "max_urls": 300,            # 한 번에 조회할 최대 트윗 URL 수
+        "max_concurrency": 8,       # 동시에 조회할 URL 수
+        "cache_ttl": 7 * 24 * 3600, # oEmbed 응답 캐시 시간(초)
+    },
+
+    # --- 수집 실행 제어 ---
+    "COLLECTION_CONFIG": {
+        "global_deadline": 120,     # 전체 수집 마감 시간(초), 넘기면 끝난 소스의 결과만 사용
+        "plugin_modules": [],       # 추가 소스 플러그인 모듈 (예: "my_sources.npm_trends")
+    },
+    
+    # --- 공유 HTTP 클라이언트 (커넥션 풀) ---
+    "HTTP_CLIENT_CONFIG": {
+        "limit": 100,               # 전체 동시 연결 수
+        "limit_per_host": 10,       # 호스트별 동시 연결 수
+        "ttl_dns_cache": 300,       # DNS 캐시 유지 시간(초)
+        "keepalive_timeout": 30,    # 유휴 연결 유지 시간(초)
+        "default_timeout": 10,      # 기본 요청 타임아웃(초)
+        "sources": {
+            "github": {"headers": {"Accept": "application/vnd.github.v3+json"}, "timeout": 15},
+            "x_embed": {"timeout": 5},
+            "gemini": {"timeout": 30},             # 한도 확인(모델 목록) 요청
+            "gemini_generate": {"timeout": 120},   # 분석/이메일/코드 리뷰 생성 요청
+        },
+    },
+    
+    # --- HTTP 캐시 설정 (조건부 GET) ---
+    "HTTP_CACHE_CONFIG": {
+        "enabled": True,
+        "default_ttl": 600,     # Cache-Control 헤더가 없을 때의 만료 시간(초)
+        "max_size_mb": 50,      # 디스크 캐시 최대 크기, 초과 시 LRU 제거
+    },
+    
+    # --- 호스트별 요청 속도 제한 ---
+    # max_concurrency: 동시 요청 수, rate: 초당 요청 수, burst: 순간 허용량
+    "RATE_LIMIT_CONFIG": {
+        "default": {"max_concurrency": 8, "rate": 10, "burst": 10},
+        "hosts": {
+            # Hacker News (Firebase API)
+            "hacker-news.firebaseio.com": {"max_concurrency": 10, "rate": 20, "burst": 20},
+            # GitHub 검색 API (비인증 분당 10회)
+            "api.github.com": {"max_concurrency": 2, "rate": 0.16, "burst": 5},
+            # X(Twitter) oEmbed
+            "publish.twitter.com": {"max_concurrency": 8, "rate": 5, "burst": 10},
+        },
+    },
+
+    # --- 소스별 재시도 정책 (지터 지수 백오프) ---
+    # max_attempts: 첫 시도 포함 최대 시도 횟수, retry_budget: 실행당 소스별 재시도 총량
+    "RETRY_CONFIG": {
+        "default": {"max_attempts": 3, "base_delay": 0.5, "max_delay": 8.0, "retry_budget": 20},
+        "sources": {
+            "github": {"max_attempts": 2, "retry_budget": 3},
+        },
+    },
+
+    # --- 서킷 브레이커 (연속 실패 소스/피드 건너뛰기) ---
+    "CIRCUIT_BREAKER_CONFIG": {
+        "enabled": True,
+        "failure_threshold": 3,     # 이 횟수만큼 연속 실행에서 실패하면 서킷을 엶
+        "cooldown_hours": 24,       # 이 시간이 지나면 half-open으로 한 번 다시 시도
+    },
+
+    # --- 파싱 작업 풀 (feedparser) ---
+    "PARSE_EXECUTOR_CONFIG": {
+        "max_workers": 4,
+        "use_processes": False,     # True면 프로세스 풀 사용 (GIL 회피, 직렬화 비용 발생)
+    },
+    
+    # --- 수집 장부 (이미 필터에 올린/리포트한 항목 제외, 리포트 발송 후에만 기록) ---
+    "SEEN_LEDGER_CONFIG": {
+        "enabled": True,
+        "resurface_after_days": 30,     # 필터 후보였던 항목을 이 기간 뒤에 다시 전달
+        "report_cooldown_days": 90,     # 리포트된 항목은 이 기간 동안 다시 전달하지 않음
+    },
+    
+    # --- 소스 간 유사 중복 제거 (제목 SimHash + URL) ---
+    "DEDUP_CONFIG": {
+        "enabled": True,
+        "max_hamming_distance": 3,      # 64비트 지문 기준, 이 거리 이하면 같은 항목으로 병합
+    },
+    
+    # --- LLM 필터 전 로컬 사전 순위화 (BM25) ---
+    "PRERANK_CONFIG": {
+        "enabled": True,
+        "top_k": 40,                # LLM 필터 프롬프트에 넣을 최대 후보 수
+        "max_per_source": 12,       # 한 소스가 차지할 수 있는 최대 후보 수
+        "history_weight": 0.5,      # 과거에 선별된 제목 단어의 질의 가중치
+        "signal_weight": 0.2,       # 점수/별 수(인기도)의 반영 비율
+        "max_history": 500,         # 보관할 과거 선별 제목 수
+    },
+    
+    # --- LLM 응답 캐시 설정 ---
+    # (제공자, 모델, 생성 설정, 정규화된 프롬프트)가 같으면 저장된 응답을 재사용합니다.
+    # LLM_CACHE_BYPASS=1 환경 변수로도 캐시 조회를 건너뛸 수 있습니다.
+    "LLM_CACHE_CONFIG": {
+        "enabled": True,
+        "ttl_hours": 168,           # 응답 보관 기간
+        "max_entries": 2000,        # 초과 시 가장 오래 사용되지 않은 응답부터 제거
+        "bypass": False,            # True면 캐시를 읽지 않고 항상 새로 생성 (결과는 저장)
+    },
+    
+    # --- 프롬프트 토큰 예산 설정 ---
+    # 예산을 넘는 입력은 잘라내지 않고 나눠서 병렬 분석한 뒤 결과를 합칩니다.
+    "TOKEN_BUDGET_CONFIG": {
+        "analyzer_max_prompt_tokens": 8000,     # AnalyzerAgent 프롬프트 1개의 최대 토큰
+        "smart_agent_max_prompt_tokens": 1500,  # SmartAIAgent 프롬프트 1개의 최대 토큰
+        "max_concurrency": 4,                   # 조각 분석 동시 요청 수
+    },
+    
+    # --- 에이전트 오케스트레이터 설정 ---
+    # 단계별 시간 제한(초). 제한을 넘긴 단계는 취소되고, 그 결과에 의존하는 단계만 건너뜁니다.
+    "ORCHESTRATOR_CONFIG": {
+        "stage_timeouts": {
+            "collect": 900,
+            "filter": 300,
+            "analyze": 600,
+            "email": 300,
+            "code_review": 600,
+        },
+    },
+    
+    # --- 단계 체크포인트 설정 ---
+    # 단계가 끝날 때마다 결과를 outputs/checkpoints/<run-id>/ 에 저장합니다. (python run.py --resume <run-id>)
+    "CHECKPOINT_CONFIG": {
+        "enabled": True,
+        "keep_runs": 10,            # 보관할 최근 실행 수
+    },
+    
+    # --- 헤지 요청 설정 (SmartAIAgent) ---
+    # 먼저 호출한 제공자가 최근 응답 시간의 percentile 분위수 안에 답하지 않으면 다음 제공자를 함께 호출합니다.
+    "HEDGING_CONFIG": {
+        "enabled": True,
+        "percentile": 0.95,
+        "window": 100,              # 제공자별로 보관할 최근 응답 시간 수
+        "min_samples": 10,          # 이보다 표본이 적으면 initial_delay 사용
+        "initial_delay": 8.0,       # 초
+        "min_delay": 1.0,
+        "max_delay": 30.0,
+    },
+    
+    # --- Hugging Face 로컬 모델 설정 (SmartAIAgent 폴백) ---
+    # 모델은 처음 쓸 때 로드하고, 상주 모델의 메모리 합계가 상한을 넘으면 가장 오래 쓰지 않은 모델부터 내립니다.
+    "HF_MODELS_CONFIG": {
+        "preload": [],              # 시작 시 미리 로드할 모델 (summarize, classify, sentiment)
+        "max_memory_mb": 3072,      # 상주 모델 메모리 상한 (None이면 제한 없음)
+        "idle_seconds": 600,        # 이 시간 동안 쓰지 않은 모델은 내림 (None이면 내리지 않음)
+    },
+    
+    # --- Gemini 키 풀 설정 ---
+    # API_KEYS의 모든 Gemini 키를 함께 쓰고, 요청마다 남은 한도가 가장 많은 키로 보냅니다.
+    "KEY_POOL_CONFIG": {
+        "enabled": True,
+        "rpm_limit": 15,            # 키당 분당 요청 수
+        "daily_limit": 1500,        # 키당 일일 요청 수 (한도 관리자에 값이 있으면 그 값을 사용)
+        "cooldown_seconds": 60,     # 429를 받은 키를 쉬게 하는 시간
+        "max_wait_seconds": 120,    # 모든 키가 한도에 걸렸을 때 기다리는 최대 시간
     },
     
     # --- AI 에이전트 API 키 ---
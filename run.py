@@ -1,3 +1,5 @@
+import argparse
+import asyncio
 import sys
 import os
 
@@ -19,8 +21,17 @@ def print_banner():
     """
     print(banner)
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="웹개발 & AI 트렌드 멀티 에이전트 시스템")
+    parser.add_argument(
+        "--resume", metavar="RUN_ID",
+        help="체크포인트에서 해당 실행을 재개합니다. ('latest'는 가장 최근 실행)"
+    )
+    return parser.parse_args()
+
 def main():
     """메인 함수"""
+    args = parse_args()
     print_banner()
     logger.info("프로그램 시작.")
     
@@ -28,6 +39,9 @@ def main():
     from scrapper.main import WebDevTrendsAgent
     
     agent = WebDevTrendsAgent()
+    if args.resume:
+        succeeded = asyncio.run(agent.run_analysis(resume_run_id=args.resume))
+        sys.exit(0 if succeeded else 1)
     agent.interactive_mode()
 
 if __name__ == "__main__":
@@ -7,6 +7,7 @@ __version__ = "3.0.0"
 __author__ = "ChanwooChae"
 
 from .collectors import DataCollector
+from .sources import Source, register_source
 from .x_embed_collector import XEmbedCollector
 from .ai_quota_manager import AIQuotaManager
 # 새로운 에이전트 클래스들을 가져오도록 수정합니다.
@@ -23,6 +24,8 @@ from .main import WebDevTrendsAgent
 # 외부에서 사용할 수 있는 클래스 목록을 새로운 이름으로 업데이트합니다.
 __all__ = [
     "DataCollector",
+    "Source",
+    "register_source",
     "XEmbedCollector",
     "AIQuotaManager",
     "CollectorAgent",
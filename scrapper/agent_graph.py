@@ -0,0 +1,133 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+from scrapper.utils.logger import logger
+
+
+class Stage:
+    """
+    오케스트레이터의 실행 단위입니다.
+    - inputs: 실행 전에 채워져 있어야 하는 AgentOutput 필드
+    - outputs: 이 단계가 채우는 AgentOutput 필드
+    - timeout: 초 단위 시간 제한 (None이면 제한 없음)
+    """
+
+    def __init__(self, name: str, run: Callable[[Any], Awaitable[Any]], inputs: Iterable[str] = (),
+                 outputs: Iterable[str] = (), timeout: Optional[float] = None):
+        self.name = name
+        self.run = run
+        self.inputs: Tuple[str, ...] = tuple(inputs)
+        self.outputs: Tuple[str, ...] = tuple(outputs)
+        self.timeout = timeout
+
+
+class AgentGraph:
+    """
+    단계들을 선언된 입력/출력으로 연결한 DAG로 실행합니다.
+    - 어떤 단계의 입력을 출력하는 단계가 그 단계의 선행 단계가 되며, 선행 단계가 끝난 단계부터 동시에 실행합니다.
+    - 한 단계의 예외/시간 초과는 그 단계와 후행 단계(skipped)에만 영향을 주고, 독립적인 단계는 계속 실행합니다.
+    - 실행이 취소되면 진행 중인 모든 단계를 취소합니다.
+    """
+
+    def __init__(self, stages: List[Stage]):
+        self.stages = {stage.name: stage for stage in stages}
+        producers: Dict[str, str] = {}
+        for stage in stages:
+            for field in stage.outputs:
+                if field in producers:
+                    raise ValueError(f"'{field}' 필드를 '{producers[field]}'와 '{stage.name}' 단계가 모두 출력합니다.")
+                producers[field] = stage.name
+        self.dependencies: Dict[str, List[str]] = {
+            stage.name: sorted({producers[field] for field in stage.inputs if field in producers})
+            for stage in stages
+        }
+        self._check_acyclic()
+        self.last_run_status: Dict[str, Dict[str, Any]] = {}
+
+    def _check_acyclic(self) -> None:
+        visiting, done = set(), set()
+
+        def visit(name: str, path: List[str]) -> None:
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"단계 의존성에 순환이 있습니다: {' → '.join(path + [name])}")
+            visiting.add(name)
+            for dependency in self.dependencies[name]:
+                visit(dependency, path + [name])
+            visiting.discard(name)
+            done.add(name)
+
+        for name in self.stages:
+            visit(name, [])
+
+    async def run(self, output: Any, completed: Iterable[str] = (),
+                  on_complete: Optional[Callable[[Stage], None]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        모든 단계를 실행하고 단계별 상태(status, elapsed)를 반환합니다.
+        - completed: 이미 끝난(체크포인트에서 복원한) 단계. 실행하지 않고 'restored'로 표시합니다.
+        - on_complete: 단계가 성공할 때마다 호출됩니다. (체크포인트 저장 등)
+        """
+        self.last_run_status = {}
+        completed = self.resumable(completed)
+        tasks: Dict[str, asyncio.Task] = {}
+
+        async def run_stage(name: str) -> bool:
+            stage = self.stages[name]
+            if name in completed:
+                self.last_run_status[name] = {"status": "restored"}
+                return True
+            if not all(await asyncio.gather(*(tasks[dependency] for dependency in self.dependencies[name]))):
+                failed = [d for d in self.dependencies[name] if self.last_run_status[d]["status"] not in ("ok", "restored")]
+                self.last_run_status[name] = {"status": "skipped", "error": f"선행 단계 실패: {', '.join(failed)}"}
+                return False
+            started = time.perf_counter()
+            try:
+                await asyncio.wait_for(stage.run(output), timeout=stage.timeout)
+                status = {"status": "ok"}
+            except asyncio.TimeoutError:
+                status = {"status": "timeout", "error": f"{stage.timeout}초 시간 제한 초과"}
+            except Exception as e:
+                logger.error(f"❌ '{name}' 단계 실행 중 오류 발생 - {e}", exc_info=True)
+                status = {"status": "error", "error": str(e)}
+            status["elapsed"] = round(time.perf_counter() - started, 3)
+            self.last_run_status[name] = status
+            if status["status"] == "ok" and on_complete:
+                on_complete(stage)
+            return status["status"] == "ok"
+
+        # 선행 단계가 먼저 생성되도록 위상 순서대로 작업을 만듭니다.
+        for name in self._topological_order():
+            tasks[name] = asyncio.create_task(run_stage(name), name=f"stage:{name}")
+        try:
+            await asyncio.gather(*tasks.values())
+        finally:
+            for task in tasks.values():
+                task.cancel()
+        self._log_run_status()
+        return self.last_run_status
+
+    def resumable(self, completed: Iterable[str]) -> set:
+        """완료 표시된 단계 중 선행 단계도 모두 완료된 단계만 반환합니다. 다시 실행하는 단계의 후행 단계는 함께 다시 실행합니다."""
+        completed = set(completed)
+        resumable = set()
+        for name in self._topological_order():
+            if name in completed and all(d in resumable for d in self.dependencies[name]):
+                resumable.add(name)
+        return resumable
+
+    def _topological_order(self) -> List[str]:
+        order: List[str] = []
+        while len(order) < len(self.stages):
+            for name in self.stages:
+                if name not in order and all(d in order for d in self.dependencies[name]):
+                    order.append(name)
+        return order
+
+    def _log_run_status(self) -> None:
+        """단계별 실행 상태를 한 줄씩 로그로 남깁니다."""
+        for name, status in self.last_run_status.items():
+            elapsed = f", {status['elapsed']:.2f}초" if "elapsed" in status else ""
+            error = f" - {status['error']}" if "error" in status else ""
+            logger.info(f"📋 단계 {name}: {status['status']}{elapsed}{error}")
@@ -1,16 +1,35 @@
-import google.generativeai as genai
-from anthropic import Anthropic
-from transformers import pipeline
+import asyncio
 import os
 from typing import List, Dict, Optional
 from datetime import datetime, timedelta
 import json
 
+from scrapper.hedging import LatencyHistogram, hedged_call
+from scrapper.hf_models import HuggingFaceModelManager
+from scrapper.http_client import HttpClientManager, get_http_client
+from scrapper.llm_cache import get_llm_cache
+from scrapper.llm_clients import ClaudeClient, GeminiClient, HuggingFaceClient
+from scrapper.token_budget import estimate_tokens, split_text
+
+GEMINI_MODEL = 'gemini-2.5-flash'
+CLAUDE_MODEL = "claude-3-haiku-20240307"
+
 class SmartAIAgent:
-    """Gemini → Claude → Hugging Face 계층적 AI 시스템"""
+    """
+    Gemini → Claude → Hugging Face 계층적 AI 시스템
+    Gemini가 최근 p95 응답 시간 안에 답하지 않으면 Claude를 함께 호출(hedging)하고 먼저 성공한 응답을 씁니다.
+    """
     
-    def __init__(self, config):
+    def __init__(self, config, http_client: Optional[HttpClientManager] = None):
         self.config = config
+        self.llm_cache = get_llm_cache(config)
+        budget_config = config.get("TOKEN_BUDGET_CONFIG", {})
+        self.max_prompt_tokens = budget_config.get("smart_agent_max_prompt_tokens", 1500)
+        self.max_concurrency = budget_config.get("max_concurrency", 4)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self.hedging_enabled = config.get("HEDGING_CONFIG", {}).get("enabled", True)
+        self.latency = {provider: LatencyHistogram.from_config(config) for provider in ("gemini", "claude")}
         
         # API 사용량 추적
         self.usage_tracker = {
@@ -22,83 +41,141 @@ class SmartAIAgent:
         # Gemini 설정
         self.gemini_available = False
         if config.get("AI_CONFIG", {}).get("gemini", {}).get("api_key"):
-            genai.configure(api_key=config["AI_CONFIG"]["gemini"]["api_key"])
-            self.gemini_model = genai.GenerativeModel('gemini-2.5-flash')
+            self.gemini = GeminiClient(
+                config["AI_CONFIG"]["gemini"]["api_key"], GEMINI_MODEL, http_client or get_http_client(config)
+            )
             self.gemini_available = True
             print("✅ Gemini AI 활성화")
         
         # Claude 설정
         self.claude_available = False
         if config.get("AI_CONFIG", {}).get("claude", {}).get("api_key"):
-            self.anthropic = Anthropic(api_key=config["AI_CONFIG"]["claude"]["api_key"])
+            self.claude = ClaudeClient(config["AI_CONFIG"]["claude"]["api_key"], CLAUDE_MODEL, max_tokens=1000)
             self.claude_available = True
             print("✅ Claude AI 활성화")
         
-        # Hugging Face 로컬 모델
+        # Hugging Face 로컬 모델 (처음 쓸 때 로드)
         self.load_huggingface_models()
     
     def load_huggingface_models(self):
-        """Hugging Face 무료 모델 로드"""
-        print("🤗 Hugging Face 모델 로딩 중...")
-        
-        try:
-            self.hf_summarizer = pipeline(
-                "summarization",
-                model="sshleifer/distilbart-cnn-12-6",
-                device=-1  # CPU
-            )
-            
-            self.hf_classifier = pipeline(
-                "zero-shot-classification",
-                model="MoritzLaurer/DeBERTa-v3-base-mnli-fever-anli",
-                device=-1
-            )
-            
-            self.hf_sentiment = pipeline(
-                "sentiment-analysis",
-                model="cardiffnlp/twitter-roberta-base-sentiment-latest",
-                device=-1
-            )
-            
-            print("✅ Hugging Face 모델 준비 완료")
-            
-        except Exception as e:
-            print(f"⚠️ Hugging Face 모델 로드 실패: {e}")
-            self.hf_summarizer = None
-            self.hf_classifier = None
-            self.hf_sentiment = None
+        """Hugging Face 무료 모델 등록. 처음 쓸 때 로드하며, HF_MODELS_CONFIG["preload"]의 모델만 미리 로드합니다."""
+        self.hf_models = HuggingFaceModelManager.from_config(self.config)
+        self.hf_models.register("summarize", HuggingFaceClient(
+            "summarization",
+            "sshleifer/distilbart-cnn-12-6",
+            device=-1  # CPU
+        ))
+        self.hf_models.register("classify", HuggingFaceClient(
+            "zero-shot-classification",
+            "MoritzLaurer/DeBERTa-v3-base-mnli-fever-anli",
+            device=-1
+        ))
+        self.hf_models.register("sentiment", HuggingFaceClient(
+            "sentiment-analysis",
+            "cardiffnlp/twitter-roberta-base-sentiment-latest",
+            device=-1
+        ))
+        
+        preload = self.config.get("HF_MODELS_CONFIG", {}).get("preload", [])
+        if preload:
+            print(f"🤗 Hugging Face 모델 미리 로드 중: {', '.join(preload)}")
+            try:
+                self.hf_models.preload(preload)
+                print("✅ Hugging Face 모델 준비 완료")
+            except Exception as e:
+                print(f"⚠️ Hugging Face 모델 로드 실패: {e}")
     
     async def analyze_content(self, content: str, task: str = "summarize") -> str:
         """계층적 AI 분석"""
         
         print(f"\n🔍 AI 분석 시작 (작업: {task})")
         
-        # 1. Gemini 시도
+        # 내용이 토큰 예산을 넘으면 잘라내지 않고 나눠서 병렬 분석(map)한 뒤, 결과를 다시 분석(reduce)합니다.
+        budget = self.max_prompt_tokens - estimate_tokens(self._create_prompt("", task))
+        if estimate_tokens(content) > budget:
+            chunks = split_text(content, budget)
+            print(f"  🧩 {len(chunks)}개 조각으로 나눠 분석")
+            partials = "\n".join(await asyncio.gather(*(self._analyze_bounded(chunk, task) for chunk in chunks)))
+            if estimate_tokens(partials) >= estimate_tokens(content):
+                return partials  # 조각 결과가 줄어들지 않으면 더 합치지 않습니다.
+            return await self.analyze_content(partials, task)
+        
+        # 0. 같은 작업/내용의 캐시된 LLM 응답 재사용
+        cached = self._cached_result(content, task, ("gemini", "claude"))
+        if cached:
+            print("  🗃️ 캐시된 응답 사용")
+            return cached
+        
+        # 1~2. Gemini → Claude (응답이 늦으면 다음 제공자를 함께 호출하고, 먼저 성공한 응답을 사용)
+        calls = []
         if self.gemini_available and self.check_usage_limit("gemini"):
-            result = await self.analyze_with_gemini(content, task)
-            if result:
-                return result
-        
-        # 2. Claude 시도
+            calls.append(("gemini", lambda: self.analyze_with_gemini(content, task)))
         if self.claude_available and self.check_usage_limit("claude"):
-            result = await self.analyze_with_claude(content, task)
-            if result:
-                return result
+            calls.append(("claude", lambda: self.analyze_with_claude(content, task)))
+        result = await hedged_call(calls, self.latency if self.hedging_enabled else {})
+        if result:
+            return result
         
         # 3. Hugging Face 폴백
-        return self.analyze_with_huggingface(content, task)
+        cached = self._cached_result(content, task, ("huggingface",))
+        if cached:
+            return cached
+        result = await self.analyze_with_huggingface(content, task)
+        if result != "분석 실패":
+            self._store_result("huggingface", content, task, result)
+        return result
+    
+    def _concurrency_limit(self) -> asyncio.Semaphore:
+        """현재 이벤트 루프의 조각 분석 세마포어 (실행마다 루프가 바뀌므로 루프별로 만듭니다)"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+    
+    async def _analyze_bounded(self, content: str, task: str) -> str:
+        async with self._concurrency_limit():
+            return await self.analyze_content(content, task)
+    
+    def _cache_keys(self, content: str, task: str) -> List[tuple]:
+        """제공자별 (provider, model, prompt, generation_config) 캐시 키 구성 요소"""
+        prompt = self._create_prompt(content, task)
+        return [
+            ("gemini", GEMINI_MODEL, prompt, None),
+            ("claude", CLAUDE_MODEL, prompt, {"max_tokens": 1000}),
+            ("huggingface", task, content, None),
+        ]
+    
+    def _cached_result(self, content: str, task: str, providers: tuple) -> Optional[str]:
+        if not self.llm_cache:
+            return None
+        for provider, model, prompt, generation_config in self._cache_keys(content, task):
+            if provider not in providers:
+                continue
+            cached = self.llm_cache.get(provider, model, prompt, generation_config)
+            if cached:
+                return cached
+        return None
+    
+    def _store_result(self, provider: str, content: str, task: str, result: str):
+        if not self.llm_cache:
+            return
+        for key in self._cache_keys(content, task):
+            if key[0] == provider:
+                self.llm_cache.put(key[0], key[1], key[2], result, key[3])
     
     async def analyze_with_gemini(self, content: str, task: str) -> Optional[str]:
         """Gemini로 분석"""
         
         try:
             prompt = self._create_prompt(content, task)
-            response = self.gemini_model.generate_content(prompt)
+            text = await self.gemini.generate(prompt)
             
             self.increment_usage("gemini")
             print(f"  ✨ Gemini 사용 ({self.usage_tracker['gemini']['count']}/60)")
             
-            return response.text
+            self._store_result("gemini", content, task, text)
+            return text
             
         except Exception as e:
             print(f"  ⚠️ Gemini 오류: {e}")
@@ -110,47 +187,45 @@ class SmartAIAgent:
         try:
             prompt = self._create_prompt(content, task)
             
-            message = self.anthropic.messages.create(
-                model="claude-3-haiku-20240307",
-                max_tokens=1000,
-                messages=[{"role": "user", "content": prompt}]
-            )
+            text = await self.claude.generate(prompt)
             
             self.increment_usage("claude")
             print(f"  🤖 Claude 사용 ({self.usage_tracker['claude']['count']}/1000)")
             
-            return message.content[0].text
+            self._store_result("claude", content, task, text)
+            return text
             
         except Exception as e:
             print(f"  ⚠️ Claude 오류: {e}")
             return None
     
-    def analyze_with_huggingface(self, content: str, task: str) -> str:
+    async def analyze_with_huggingface(self, content: str, task: str) -> str:
         """Hugging Face로 분석"""
         
         print("  🤗 Hugging Face 폴백 모드")
         
         try:
-            if task == "summarize" and self.hf_summarizer:
-                result = self.hf_summarizer(
+            if task == "summarize":
+                result = await self.hf_models.run(
+                    "summarize",
                     content[:1024],
                     max_length=150,
                     min_length=50
                 )
                 return result[0]['summary_text']
                 
-            elif task == "classify" and self.hf_classifier:
+            elif task == "classify":
                 labels = [
                     "AI and Machine Learning",
                     "CSS and Design",
                     "JavaScript Frameworks",
                     "Web Performance"
                 ]
-                result = self.hf_classifier(content[:512], labels)
+                result = await self.hf_models.run("classify", content[:512], labels)
                 return f"Category: {result['labels'][0]} ({result['scores'][0]:.2f})"
                 
-            elif task == "sentiment" and self.hf_sentiment:
-                result = self.hf_sentiment(content[:512])
+            elif task == "sentiment":
+                result = await self.hf_models.run("sentiment", content[:512])
                 return f"Sentiment: {result[0]['label']} ({result[0]['score']:.2f})"
             
             return "분석 실패"
@@ -235,6 +310,7 @@ class SmartAIAgent:
             all_content, "predict"
         )
         
+        self.hf_models.log_report()
         return insights
     
     def _create_prompt(self, content: str, task: str) -> str:
@@ -245,26 +321,26 @@ class SmartAIAgent:
                 다음 웹개발 및 AI 트렌드 내용을 한국어로 요약해주세요.
                 핵심 포인트 3-5개로 정리해주세요.
                 
-                내용: {content[:3000]}
+                내용: {content}
             """,
             
             "analyze_trends": f"""
                 다음 데이터에서 가장 중요한 웹개발/AI 트렌드 5개를 추출해주세요.
                 각 트렌드에 대해 이유와 함께 설명해주세요.
                 
-                데이터: {content[:3000]}
+                데이터: {content}
             """,
             
             "recommend": f"""
                 다음 트렌드를 기반으로 개발자가 학습해야 할 기술 3가지를 추천해주세요.
                 
-                트렌드: {content[:2000]}
+                트렌드: {content}
             """,
             
             "predict": f"""
                 현재 트렌드를 기반으로 향후 3-6개월 내 변화를 예측해주세요.
                 
-                현재 트렌드: {content[:2000]}
+                현재 트렌드: {content}
             """
         }
         
@@ -278,19 +354,19 @@ class SmartAIAgent:
         # Reddit 인기 포스트
         for item in data.get("reddit", [])[:10]:
             content_parts.append(
-                f"Reddit: {item.get('title', '')} (Score: {item.get('score', 0)})"
+                f"Reddit: {item.title} (Score: {item.score})"
             )
         
         # Hacker News
         for item in data.get("hackernews", [])[:10]:
             content_parts.append(
-                f"HN: {item.get('title', '')} (Score: {item.get('score', 0)})"
+                f"HN: {item.title} (Score: {item.score})"
             )
         
         # GitHub
         for item in data.get("github", [])[:5]:
             content_parts.append(
-                f"GitHub: {item.get('name', '')} - {item.get('description', '')}"
+                f"GitHub: {item.title} - {item.description}"
             )
         
         return "\n".join(content_parts)
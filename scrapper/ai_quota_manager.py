@@ -2,19 +2,24 @@
 
 import asyncio
 import aiohttp
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 import json
 import os
 from typing import Dict, Optional, Tuple
 import smtplib
 from email.mime.text import MIMEText
-import google.generativeai as genai
+
+from scrapper.http_client import HttpClientManager, get_http_client
+from scrapper.llm_clients import GEMINI_API_URL
 
 class AIQuotaManager:
     """AI API 한도 실시간 모니터링 & 자동 관리"""
     
-    def __init__(self, config):
+    GEMINI_MODELS_URL = f"{GEMINI_API_URL}/models"
+
+    def __init__(self, config, http_client: Optional[HttpClientManager] = None):
         self.config = config
+        self.http_client = http_client or get_http_client(config)
         
         # 각 Gemini 키에 대한 상태를 저장할 구조로 변경
         self.quota_status = {
@@ -34,7 +39,7 @@ class AIQuotaManager:
             if "gemini" in agent_name.lower() or agent_name in ["collector", "analyzer", "emailer", "code_reviewer"]:
                  self.quota_status["gemini"][agent_name] = {
                     "available": False, "api_key_valid": False, "usage_today": 0,
-                    "limit": 1500, "last_checked": None
+                    "usage_date": date.today().isoformat(), "limit": 1500, "last_checked": None
                 }
 
         self.warning_thresholds = {"critical": 0.05, "warning": 0.20}
@@ -64,10 +69,16 @@ class AIQuotaManager:
         """개별 Gemini API 키의 유효성을 테스트"""
         status = self.quota_status["gemini"][agent_name]
         try:
-            # 가장 가벼운 API 호출로 키 유효성 검사
-            genai.configure(api_key=api_key)
-            models = genai.list_models()
-            is_valid = any('generateContent' in m.supported_generation_methods for m in models)
+            # 가장 가벼운 API 호출(모델 목록 조회)로 키 유효성 검사
+            # 전역 genai.configure를 바꾸지 않도록 공유 HTTP 세션으로 REST API를 직접 호출합니다.
+            session = await self.http_client.get_session()
+            async with session.get(
+                self.GEMINI_MODELS_URL,
+                headers={**self.http_client.headers_for("gemini"), "x-goog-api-key": api_key},
+                timeout=self.http_client.timeout_for("gemini"),
+            ) as response:
+                models = (await response.json()).get("models", []) if response.status == 200 else []
+            is_valid = any('generateContent' in m.get("supportedGenerationMethods", []) for m in models)
             
             status["api_key_valid"] = is_valid
             status["available"] = is_valid
@@ -78,7 +89,8 @@ class AIQuotaManager:
         
         status["last_checked"] = datetime.now().isoformat()
         # 로컬 사용량 기반 남은 횟수 추정
-        status["remaining_daily"] = status["limit"] - status.get("usage_today", 0)
+        usage, limit = self.get_gemini_usage(agent_name)
+        status["remaining_daily"] = limit - usage
 
     async def check_claude_quota(self) -> Tuple[bool, Dict]:
         """Claude API 한도 체크 (기존과 유사)"""
@@ -118,10 +130,20 @@ class AIQuotaManager:
         # ... (기존과 동일) ...
         pass
     
+    def get_gemini_usage(self, agent_name: str) -> Tuple[int, int]:
+        """Gemini 키의 (오늘 사용량, 일일 한도). 날짜가 바뀌었으면 사용량을 0으로 되돌립니다."""
+        status = self.quota_status["gemini"][agent_name]
+        today = date.today().isoformat()
+        if status.get("usage_date") != today:
+            status["usage_today"] = 0
+            status["usage_date"] = today
+        return status.get("usage_today", 0), status.get("limit", 1500)
+
     def update_usage(self, service: str, agent_name: str = "default", tokens_used: int = 0):
         """사용량 업데이트"""
         if service == "gemini":
             if agent_name in self.quota_status["gemini"]:
+                self.get_gemini_usage(agent_name)
                 self.quota_status["gemini"][agent_name]["usage_today"] += 1
         # ... (Claude 사용량 업데이트는 동일) ...
 
@@ -142,15 +164,14 @@ class AIQuotaManager:
             with open(cache_file, "r") as f:
                 cached_data = json.load(f)
             
-            timestamp = cached_data.get("gemini", {}).get("collector", {}).get("last_checked")
-            if not timestamp: return
-
-            cached_date = datetime.fromisoformat(timestamp).date()
-            if cached_date == datetime.now().date():
-                # 오늘 캐시라면 사용량만 복원
-                for agent, status in self.quota_status["gemini"].items():
-                    usage = cached_data.get("gemini", {}).get(agent, {}).get("usage_today", 0)
-                    status["usage_today"] = usage
+            # 키마다 사용량 날짜가 오늘이면 사용량만 복원합니다. (한도 확인 여부와 무관)
+            today = date.today().isoformat()
+            for agent, status in self.quota_status["gemini"].items():
+                cached = cached_data.get("gemini", {}).get(agent, {})
+                usage_date = cached.get("usage_date") or (cached.get("last_checked") or "")[:10]
+                if usage_date == today:
+                    status["usage_today"] = cached.get("usage_today", 0)
+                    status["usage_date"] = today
         except Exception:
             pass # 캐시 로드 실패 시 무시
 
@@ -0,0 +1,160 @@
+"""
+수집 파이프라인 처리량 벤치마크
+
+로컬 스탠드인 서버(또는 녹화된 카세트)를 상대로 DataCollector.collect_all()을 반복 실행하고
+실행 시간, 초당 요청 수, 최대 메모리 사용량, 소스별 요청 지연 백분위수를 보고합니다.
+
+    python -m scrapper.benchmark --runs 3 --latency 0.05 --error-rate 0.02
+    python -m scrapper.benchmark --record outputs/cassettes/collect.json
+    python -m scrapper.benchmark --replay outputs/cassettes/collect.json
+"""
+import argparse
+import asyncio
+import json
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from scrapper.collectors import DataCollector
+from scrapper.http_client import HttpClientManager
+from scrapper.replay import ReplayHttpClient
+from scrapper.stand_in_servers import StandInProfile, StandInServers
+
+DEFAULT_PORT = 18765
+PERCENTILES = (50, 90, 99)
+
+
+def benchmark_config(base_config: Dict[str, Any], servers: StandInServers, rss_feeds: int, output_dir: str) -> Dict[str, Any]:
+    """
+    실행 간 결과가 비교 가능하도록 캐시/장부/서킷 브레이커를 끄고,
+    모든 소스가 한 호스트(스탠드인 서버)를 쓰므로 호스트별 속도 제한을 넉넉하게 둔 설정을 만듭니다.
+    """
+    config = servers.config_for(base_config, rss_feeds=rss_feeds)
+    config.update({
+        "OUTPUT_DIR": output_dir,
+        "HTTP_CACHE_CONFIG": {"enabled": False},
+        "SEEN_LEDGER_CONFIG": {"enabled": False},
+        "CIRCUIT_BREAKER_CONFIG": {"enabled": False},
+        "RATE_LIMIT_CONFIG": {"default": {"max_concurrency": 16, "rate": 1000, "burst": 1000}},
+    })
+    return config
+
+
+def summarize_latencies(latencies: Dict[str, List[float]]) -> Dict[str, Dict[str, float]]:
+    """소스별 요청 지연(초) 목록을 요청 수와 백분위수(ms)로 요약합니다."""
+    summary = {}
+    for source, values in sorted(latencies.items()):
+        points = np.percentile(np.array(values) * 1000, PERCENTILES)
+        summary[source] = {"requests": len(values), **{f"p{p}_ms": round(float(v), 2) for p, v in zip(PERCENTILES, points)}}
+    return summary
+
+
+async def run_once(config: Dict[str, Any], http_client: HttpClientManager) -> Dict[str, Any]:
+    """collect_all()을 한 번 실행하고 측정값을 반환합니다."""
+    collector = DataCollector(config, http_client=http_client)
+    tracemalloc.start()
+    started = time.perf_counter()
+    try:
+        result = await collector.collect_all()
+        wall = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        if collector.hn_store:
+            collector.hn_store.close()
+
+    requests = sum(len(values) for values in collector.request_latencies.values())
+    return {
+        "wall_seconds": round(wall, 3),
+        "requests": requests,
+        "requests_per_second": round(requests / wall, 1) if wall else 0.0,
+        "peak_memory_mb": round(peak / (1024 * 1024), 2),
+        "items": {source: len(items) for source, items in result.items()},
+        "source_status": collector.last_run_status,
+        "latency": summarize_latencies(collector.request_latencies),
+    }
+
+
+async def run_benchmark(base_config: Dict[str, Any], runs: int = 3, rss_feeds: int = 10,
+                        profile: Optional[StandInProfile] = None, port: int = DEFAULT_PORT, seed: int = 0,
+                        record: Optional[str] = None, replay: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    벤치마크를 runs번 실행합니다.
+    - replay가 주어지면 서버 없이 카세트로 재생하고, record가 주어지면 스탠드인 서버 응답을 카세트로 녹화합니다.
+    - 녹화와 재생은 같은 port를 써야 요청 URL이 일치합니다.
+    """
+    servers = StandInServers({service: profile or StandInProfile() for service in StandInServers.SERVICES}, seed=seed, port=port)
+    if not replay:
+        await servers.start()
+    reports = []
+    try:
+        for _ in range(runs):
+            with tempfile.TemporaryDirectory() as output_dir:
+                config = benchmark_config(base_config, servers, rss_feeds, output_dir)
+                if replay:
+                    http_client = ReplayHttpClient(config, "replay", replay)
+                elif record:
+                    http_client = ReplayHttpClient(config, "record", record)
+                else:
+                    http_client = HttpClientManager(config)
+                async with http_client:
+                    reports.append(await run_once(config, http_client))
+    finally:
+        await servers.stop()
+    return reports
+
+
+def format_report(reports: List[Dict[str, Any]]) -> str:
+    """실행별 측정값과 마지막 실행의 소스별 지연 백분위수를 표로 만듭니다."""
+    lines = ["run   wall(s)   req   req/s   peak(MB)   items"]
+    for index, report in enumerate(reports, 1):
+        lines.append(
+            f"{index:<5} {report['wall_seconds']:<9} {report['requests']:<5} {report['requests_per_second']:<7} "
+            f"{report['peak_memory_mb']:<10} {sum(report['items'].values())}"
+        )
+    walls = [report["wall_seconds"] for report in reports]
+    lines.append(f"wall time: median {np.median(walls):.3f}s, min {min(walls):.3f}s, max {max(walls):.3f}s")
+    lines.append("")
+    lines.append("source        requests   " + "   ".join(f"p{p}(ms)" for p in PERCENTILES) + "   status")
+    last = reports[-1]
+    for source, stats in last["latency"].items():
+        status = last["source_status"].get(source, {}).get("status", "-")
+        percentiles = "   ".join(f"{stats[f'p{p}_ms']:<7}" for p in PERCENTILES)
+        lines.append(f"{source:<13} {stats['requests']:<10} {percentiles}   {status}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="수집 파이프라인 처리량 벤치마크")
+    parser.add_argument("--runs", type=int, default=3, help="반복 실행 횟수")
+    parser.add_argument("--rss-feeds", type=int, default=10, help="스탠드인 RSS 피드 수")
+    parser.add_argument("--latency", type=float, default=0.02, help="응답 기본 지연(초)")
+    parser.add_argument("--jitter", type=float, default=0.01, help="추가 무작위 지연 최댓값(초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="503 응답 확률")
+    parser.add_argument("--items", type=int, default=30, help="응답당 항목 수")
+    parser.add_argument("--payload-bytes", type=int, default=0, help="항목마다 덧붙일 바이트 수")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="스탠드인 서버 포트 (녹화/재생 시 동일해야 함)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--record", metavar="CASSETTE", help="스탠드인 응답을 카세트 파일로 녹화")
+    parser.add_argument("--replay", metavar="CASSETTE", help="서버 없이 카세트 파일로 재생")
+    parser.add_argument("--json", metavar="PATH", help="측정값을 JSON 파일로 저장")
+    args = parser.parse_args(argv)
+
+    from configs.config import CONFIG
+
+    profile = StandInProfile(args.latency, args.jitter, args.error_rate, args.items, args.payload_bytes)
+    reports = asyncio.run(run_benchmark(
+        CONFIG, runs=args.runs, rss_feeds=args.rss_feeds, profile=profile, port=args.port,
+        seed=args.seed, record=args.record, replay=args.replay,
+    ))
+    print(format_report(reports))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(reports, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+import gzip
+import os
+import shutil
+import uuid
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from scrapper import items
+from scrapper.utils.logger import logger
+
+
+class CheckpointStore:
+    """
+    실행(run id)별로 단계가 끝날 때마다 AgentOutput 필드를 gzip 압축 JSON(orjson)으로 저장합니다.
+    - CollectedItem은 스키마 dict로 저장되며, 읽을 때는 dict로 돌아옵니다.
+    - 경로: {directory}/{run_id}/{stage}.json.gz
+    - 임시 파일에 쓴 뒤 교체하므로, 저장 도중 중단되어도 이전 체크포인트가 깨지지 않습니다.
+    - keep_runs개보다 오래된 실행의 체크포인트는 새 실행을 시작할 때 지웁니다.
+    """
+
+    def __init__(self, directory: str, keep_runs: int = 10):
+        self.directory = directory
+        self.keep_runs = keep_runs
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> Optional["CheckpointStore"]:
+        checkpoint_config = config.get("CHECKPOINT_CONFIG", {})
+        if not checkpoint_config.get("enabled"):
+            return None
+        return cls(
+            directory=checkpoint_config.get("directory") or os.path.join(config.get("OUTPUT_DIR", "outputs"), "checkpoints"),
+            keep_runs=checkpoint_config.get("keep_runs", 10),
+        )
+
+    def new_run_id(self) -> str:
+        """시간순으로 정렬되는 새 run id를 만들고 오래된 실행을 정리합니다."""
+        run_id = f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
+        self._prune()
+        return run_id
+
+    def list_runs(self) -> List[str]:
+        try:
+            return sorted(name for name in os.listdir(self.directory) if os.path.isdir(os.path.join(self.directory, name)))
+        except OSError:
+            return []
+
+    def latest_run_id(self) -> Optional[str]:
+        runs = self.list_runs()
+        return runs[-1] if runs else None
+
+    def save(self, run_id: str, stage: str, fields: Dict[str, Any], complete: bool = True) -> None:
+        """단계의 출력 필드를 저장합니다. complete=False면 재개 시 이 단계를 다시 실행합니다."""
+        run_dir = os.path.join(self.directory, run_id)
+        os.makedirs(run_dir, exist_ok=True)
+        path = os.path.join(run_dir, f"{stage}.json.gz")
+        tmp_path = f"{path}.tmp"
+        payload = {"stage": stage, "complete": complete, "saved_at": datetime.now().isoformat(), "fields": fields}
+        try:
+            with gzip.open(tmp_path, "wb") as f:
+                f.write(items.dumps(payload))
+            os.replace(tmp_path, path)
+        except (OSError, TypeError) as e:
+            logger.warning(f"체크포인트 저장 실패 ({run_id}/{stage}): {e}")
+
+    def load(self, run_id: str) -> Dict[str, Dict[str, Any]]:
+        """run id의 단계별 체크포인트({stage: {"complete", "fields", ...}})를 읽습니다."""
+        run_dir = os.path.join(self.directory, run_id)
+        if not os.path.isdir(run_dir):
+            raise FileNotFoundError(f"체크포인트를 찾을 수 없습니다: {run_id}")
+        checkpoints = {}
+        for filename in sorted(os.listdir(run_dir)):
+            if not filename.endswith(".json.gz"):
+                continue
+            try:
+                with gzip.open(os.path.join(run_dir, filename), "rb") as f:
+                    payload = items.loads(f.read())
+            except (OSError, ValueError) as e:
+                logger.warning(f"체크포인트 읽기 실패 ({run_id}/{filename}): {e}")
+                continue
+            checkpoints[payload["stage"]] = payload
+        return checkpoints
+
+    def _prune(self) -> None:
+        """새 실행을 포함해 keep_runs개만 남도록 오래된 실행부터 지웁니다."""
+        runs = self.list_runs()
+        for run_id in runs[:max(len(runs) - max(self.keep_runs - 1, 0), 0)]:
+            shutil.rmtree(os.path.join(self.directory, run_id), ignore_errors=True)
@@ -1,4 +1,5 @@
 import asyncio
+import calendar
 import feedparser
 import asyncpraw
 import aiohttp
@@ -6,12 +7,52 @@ import os
 from bs4 import BeautifulSoup
 from datetime import datetime, timedelta
 import re
-from typing import List, Dict, Any, Optional
+import time
+from typing import AsyncIterator, List, Dict, Any, Optional, Tuple
 import json
 
+from scrapper.hn_store import HNItemStore
+from scrapper.http_cache import HttpCache
+from scrapper.http_client import HttpClientManager, get_http_client
+from scrapper.items import CollectedItem
+from scrapper.keyword_matcher import ContentMatch, KeywordMatcher
+from scrapper.parse_executor import get_parse_executor
+from scrapper.rate_limiter import RateLimiter
+from scrapper.resilience import CircuitBreaker, RetryPolicies
+from scrapper.seen_ledger import SeenLedger
+from scrapper.sources import SOURCE_REGISTRY, Source, load_plugin_modules
+
 import logging
 logger = logging.getLogger(__name__)
 
+HN_API_URL = "https://hacker-news.firebaseio.com/v0"
+GITHUB_API_URL = "https://api.github.com"
+
+
+def parse_feed_entries(xml_content: str, limit: int = 10) -> Tuple[Optional[str], List[Dict[str, Any]]]:
+    """RSS/Atom 문서를 파싱하여 (피드 제목, 상위 항목 목록)을 반환합니다. 파싱 풀에서 실행됩니다."""
+    feed = feedparser.parse(xml_content)
+    entries = []
+    for entry in feed.entries[:limit]:
+        published = entry.get("published_parsed") or entry.get("updated_parsed")
+        entries.append({
+            "title": entry.get("title", ""),
+            "link": entry.get("link", ""),
+            "summary": entry.get("summary", ""),
+            "published": calendar.timegm(published) if published else None,
+        })
+    return feed.feed.get("title"), entries
+
+
+def _parse_timestamp(value: Optional[str]) -> Optional[float]:
+    """GitHub API의 ISO 8601 시각(예: 2024-05-01T12:00:00Z)을 epoch 초로 변환합니다."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
 
 class DataCollector:
     """
@@ -20,9 +61,17 @@ class DataCollector:
     - 각 수집 메서드는 독립적으로 실행되며, 오류 발생 시 다른 수집에 영향을 주지 않습니다.
     """
 
-    def __init__(self, config: Dict[str, Any]):
-        """DataCollector를 초기화합니다."""
+    CATEGORIES = {
+        "AI & Machine Learning": ["gpt", "claude", "llm", "ai", "machine learning"],
+        "CSS & Design": ["css", "style", "animation", "design", "ui", "ux"],
+        "Frontend Frameworks": ["react", "vue", "svelte", "angular", "next.js"],
+        "JavaScript & TypeScript": ["javascript", "typescript", "node.js", "deno", "bun"],
+    }
+
+    def __init__(self, config: Dict[str, Any], http_client: Optional[HttpClientManager] = None):
+        """DataCollector를 초기화합니다. http_client를 주지 않으면 프로세스 공유 클라이언트를 사용합니다."""
         self.config = config
+        self.http_client = http_client or get_http_client(config)
         self.rss_feeds = config.get("RSS_FEEDS", [])
         self.reddit_config = config.get("REDDIT_CONFIG", {})
         self.hn_config = config.get("HN_CONFIG", {})
@@ -30,39 +79,137 @@ class DataCollector:
         self.filter_keywords = config.get("FILTER_KEYWORDS", {})
         self.report_config = config.get("REPORT_CONFIG", {})
         self.github_token = os.getenv("GITHUB_TOKEN")
+        self.http_cache = HttpCache.from_config(config)
+        self.rate_limiter = RateLimiter(config.get("RATE_LIMIT_CONFIG"))
+        self.retry_policies = RetryPolicies(config.get("RETRY_CONFIG"))
+        self.circuit_breaker = CircuitBreaker.from_config(config)
+        self.parse_executor = get_parse_executor(config)
+        self.seen_ledger = SeenLedger.from_config(config)
+        self.hn_store = HNItemStore(
+            self.hn_config.get("store_path") or os.path.join(config.get("OUTPUT_DIR", "outputs"), "hn_items.sqlite3")
+        ) if self.hn_config.get("enabled") else None
+        self._matcher: Optional[KeywordMatcher] = None
+        self._matcher_signature: Optional[tuple] = None
+
+        self.collection_config = config.get("COLLECTION_CONFIG", {})
+        load_plugin_modules(self.collection_config.get("plugin_modules", []))
+        self.sources: List[Source] = [source_class(self, config) for source_class in SOURCE_REGISTRY.values()]
+        for source in self.sources:
+            for host, limits in source.rate_limits.items():
+                self.rate_limiter.host_configs.setdefault(host, limits)
+        # 마지막 수집 실행의 소스별 상태 (status, items, elapsed, error)와 요청별 지연 시간(초)
+        self.last_run_status: Dict[str, Dict[str, Any]] = {}
+        self.request_latencies: Dict[str, List[float]] = {}
 
-    async def collect_all(self) -> Dict[str, List[Dict]]:
-        """모든 데이터 소스에서 병렬로 정보를 수집합니다."""
+    async def collect_all(self) -> Dict[str, List[CollectedItem]]:
+        """모든 데이터 소스에서 병렬로 정보를 수집합니다. (stream_all의 결과를 모아 반환하는 래퍼)"""
+        collected_data: Dict[str, List[CollectedItem]] = {}
+        async for source, items in self.stream_all():
+            collected_data[source] = items
+        # 완료 순서와 무관하게 항상 같은 순서로 반환합니다.
+        return dict(sorted(collected_data.items()))
+
+    async def stream_all(self) -> AsyncIterator[Tuple[str, List[CollectedItem]]]:
+        """
+        등록된 모든 데이터 소스를 병렬로 수집하면서, 먼저 끝난 소스부터 (소스 이름, 항목 목록)을 내보냅니다.
+        - 실패하거나 시간 예산(time_budget)을 넘긴 소스는 빈 목록으로 내보내므로 다른 소스의 처리에 영향을 주지 않습니다.
+        - 전체 마감 시간(global_deadline)이 지나면 끝나지 않은 소스를 취소하고 빈 목록으로 내보냅니다.
+        - 소비자가 도중에 중단하면 아직 진행 중인 수집 작업은 취소됩니다.
+        - 수집 장부(SeenLedger)가 켜져 있으면 새 항목과 다시 떠오른 항목만 내보냅니다.
+        - 실행이 끝나면 소스별 성공/실패를 서킷 브레이커에 반영하고, 소스별 상태를 last_run_status에 남깁니다.
+        """
         logger.info("🚀 데이터 수집 시작...")
-        headers = {"Accept": "application/vnd.github.v3+json"}
-        if self.github_token:
-            headers["Authorization"] = f"token {self.github_token}"
+        self.retry_policies.reset_budgets()
+        self.parse_executor.reset_stats()
+        self.last_run_status = {}
+        self.request_latencies = {}
+        session = await self.http_client.get_session()
+        tasks: Dict[asyncio.Task, str] = {}
+        for source in self.sources:
+            if not source.enabled:
+                self.last_run_status[source.name] = {"status": "disabled", "items": 0}
+                continue
+            missing = source.validate()
+            if missing:
+                logger.warning(f"⚠️ {source.name}: 필수 설정 {', '.join(missing)}이(가) 없어 건너뜁니다.")
+                self.last_run_status[source.name] = {"status": "misconfigured", "items": 0, "error": f"missing {missing}"}
+                continue
+            tasks[asyncio.create_task(self._run_source(source, session))] = source.name
 
-        async with aiohttp.ClientSession(headers=headers) as session:
-            tasks = {
-                "rss": self._collect_rss_feeds(session),
-                "reddit": self._collect_reddit(),
-                "hackernews": self._collect_hackernews(session),
-                "github": self._collect_github_trending(session),
-            }
-
-            results = await asyncio.gather(*tasks.values(), return_exceptions=True)
-            
-            collected_data: Dict[str, List[Dict]] = {}
-            for source, result in zip(tasks.keys(), results):
-                if isinstance(result, Exception):
-                    logger.error(f"⚠️ {source} 수집 중 심각한 오류 발생: {result}")
-                    collected_data[source] = []
-                else:
-                    logger.info(f"✅ {source} 수집 완료: {len(result)}개 항목")
-                    collected_data[source] = result
-        
+        yielded = set()
+        try:
+            try:
+                for next_done in asyncio.as_completed(tasks, timeout=self.collection_config.get("global_deadline", 120)):
+                    source, result, error = await next_done
+                    yielded.add(source)
+                    yield self._finish_source(source, result, error)
+            except asyncio.TimeoutError:
+                # 소비자가 앞선 결과를 처리하는 동안 끝난 소스는 취소하기 전에 결과를 거둬 그대로 내보냅니다.
+                remaining = [(task, source) for task, source in tasks.items() if source not in yielded]
+                finished = [task.result() for task, _ in remaining if task.done() and not task.cancelled()]
+                for task, source in remaining:
+                    if not task.done():
+                        task.cancel()
+                for source, result, error in finished:
+                    yielded.add(source)
+                    yield self._finish_source(source, result, error)
+                for _, source in remaining:
+                    if source not in yielded:
+                        logger.error(f"⏰ {source}: 전체 수집 마감 시간을 넘겨 결과 없이 종료합니다.")
+                        self.last_run_status[source] = {"status": "deadline_exceeded", "items": 0}
+                        yield source, []
+        finally:
+            for task in tasks:
+                task.cancel()
+            if self.http_cache:
+                self.http_cache.save()
+            if self.circuit_breaker:
+                self.circuit_breaker.commit_run()
+
+        self.parse_executor.log_stats()
+        self._log_run_status()
         logger.info("✅ 전체 데이터 수집 완료!")
-        return collected_data
+
+    def _finish_source(self, source: str, result: List[Dict],
+                       error: Optional[BaseException]) -> Tuple[str, List[CollectedItem]]:
+        if error is not None:
+            logger.error(f"⚠️ {source} 수집 중 심각한 오류 발생: {error}")
+        else:
+            logger.info(f"✅ {source} 수집 완료: {len(result)}개 항목")
+        return source, self._filter_seen(source, [CollectedItem.coerce(item, source) for item in result])
+
+    async def _run_source(self, source: Source, session: aiohttp.ClientSession) -> Tuple[str, List[Dict], Optional[BaseException]]:
+        """소스 하나를 시간 예산 안에서 실행하고 (소스 이름, 결과, 오류)를 반환합니다."""
+        started = time.perf_counter()
+        try:
+            result = await asyncio.wait_for(source.collect(session), timeout=source.budget)
+            status, error = {"status": "ok", "items": len(result)}, None
+        except asyncio.TimeoutError as e:
+            result, error = [], e
+            status = {"status": "timeout", "items": 0, "error": f"{source.budget}초 시간 예산 초과"}
+        except Exception as e:
+            result, error = [], e
+            status = {"status": "error", "items": 0, "error": str(e)}
+        status["elapsed"] = round(time.perf_counter() - started, 3)
+        self.last_run_status[source.name] = status
+        return source.name, result, error
+
+    def _filter_seen(self, source: str, items: List[CollectedItem]) -> List[CollectedItem]:
+        if not self.seen_ledger or not items:
+            return items
+        new_items = self.seen_ledger.filter_new(items)
+        logger.info(f"   {source}: 이미 본 항목 {len(items) - len(new_items)}개 제외")
+        return new_items
+
+    def _log_run_status(self) -> None:
+        """소스별 수집 상태를 한 줄씩 로그로 남깁니다."""
+        for source, status in sorted(self.last_run_status.items()):
+            elapsed = f", {status['elapsed']:.2f}초" if "elapsed" in status else ""
+            logger.info(f"📋 {source}: {status['status']} ({status['items']}개{elapsed})")
 
     # --- 데이터 소스별 수집 메서드 ---
 
-    async def _collect_rss_feeds(self, session: aiohttp.ClientSession) -> List[Dict]:
+    async def _collect_rss_feeds(self, session: aiohttp.ClientSession) -> List[CollectedItem]:
         """설정된 모든 RSS 피드에서 게시글을 비동기적으로 수집합니다."""
         tasks = [self._fetch_and_parse_rss(session, url) for url in self.rss_feeds]
         results = await asyncio.gather(*tasks)
@@ -70,176 +217,403 @@ class DataCollector:
         articles = [item for sublist in results for item in sublist]
         return articles
 
-    async def _collect_reddit(self) -> List[Dict]:
-        """Reddit에서 인기 포스트를 비동기적으로 수집합니다."""
+    async def _collect_reddit(self) -> List[CollectedItem]:
+        """
+        Reddit에서 인기 포스트를 비동기적으로 수집합니다.
+        - multireddit_size개씩 서브레딧을 묶어(webdev+css+...) 하나의 top 리스팅으로 조회합니다.
+          묶음 리스팅은 절대 점수순이라 큰 서브레딧이 상위를 채울 수 있으므로, 서브레딧마다 post_limit개까지만 쓰고
+          후보가 모자란 서브레딧은 따로 조회해, 서브레딧별로 조회하던 때와 같은 후보를 확보합니다.
+        - 묶음들은 max_concurrency개까지 동시에 조회합니다.
+        - OAuth 토큰은 프로세스 안에서 실행 간에 재사용합니다.
+        """
         if not self.reddit_config.get("enabled"):
             return []
+        if not self._circuit_allows("reddit"):
+            return []
         
         posts = []
         try:
+            # 공유 세션을 쓰므로 클라이언트를 닫지 않습니다. (세션 정리는 HttpClientManager가 담당)
             reddit = asyncpraw.Reddit(
                 client_id=self.reddit_config["client_id"],
                 client_secret=self.reddit_config["client_secret"],
                 user_agent=self.reddit_config["user_agent"],
+                # 로컬 스탠드인 서버/재생 환경에서는 API 주소를 바꿔 씁니다.
+                **{key: self.reddit_config[key] for key in ("oauth_url", "reddit_url") if self.reddit_config.get(key)},
+                requestor_kwargs={"session": await self.http_client.get_session()},
             )
-            async with reddit:
-                for subreddit_name in self.reddit_config["subreddits"]:
-                    try:
-                        subreddit = await reddit.subreddit(subreddit_name)
-                        async for post in subreddit.top(time_filter=self.reddit_config["time_filter"], limit=self.reddit_config["post_limit"]):
-                            content_text = post.title + " " + post.selftext
-                            if self._is_relevant_content(content_text):
-                                posts.append({
-                                    "title": post.title,
-                                    "url": f"https://reddit.com{post.permalink}",
-                                    "score": post.score,
-                                    "source": f"r/{subreddit_name}",
-                                    "category": self._categorize_content(content_text),
-                                })
-                    except Exception as e:
-                        logger.warning(f"r/{subreddit_name} 서브레딧 수집 중 오류: {e}")
+            self._restore_reddit_token(reddit)
+            semaphore = asyncio.Semaphore(self.reddit_config.get("max_concurrency", 4))
+            results = await asyncio.gather(*(
+                self._fetch_subreddit_group(reddit, group, semaphore) for group in self._subreddit_groups()
+            ))
+            posts = [post for group_posts in results for post in group_posts]
+            self._save_reddit_token(reddit)
         except Exception as e:
             logger.error(f"Reddit API 연결 오류: {e}")
         
         posts.sort(key=lambda x: x["score"], reverse=True)
         return posts[:self.report_config.get("max_items_per_source", 15)]
 
-    async def _collect_hackernews(self, session: aiohttp.ClientSession) -> List[Dict]:
-        """Hacker News에서 인기 스토리를 비동기적으로 수집합니다."""
+    def _subreddit_groups(self) -> List[List[str]]:
+        """서브레딧 목록을 multireddit_size개씩 묶습니다."""
+        subreddits = self.reddit_config.get("subreddits", [])
+        size = max(1, self.reddit_config.get("multireddit_size", 1))
+        return [subreddits[i:i + size] for i in range(0, len(subreddits), size)]
+
+    async def _fetch_subreddit_group(self, reddit: asyncpraw.Reddit, group: List[str], semaphore: asyncio.Semaphore) -> List[CollectedItem]:
+        """
+        서브레딧 묶음의 top 리스팅을 가져와 관련 포스트만 반환합니다.
+        - 리스팅은 post_limit × 묶음 크기 × multireddit_overfetch개까지 받고, 서브레딧마다 상위 post_limit개만 후보로 씁니다.
+        - 리스팅이 상한까지 찼는데 post_limit개를 채우지 못한 서브레딧은 큰 서브레딧에 밀렸을 수 있으므로 따로 조회합니다.
+        """
+        multireddit_name = "+".join(group)
+        post_limit = self.reddit_config["post_limit"]
+        posts: List[CollectedItem] = []
+        counts: Dict[str, int] = {}
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                subreddit = await reddit.subreddit(multireddit_name)
+                limit = post_limit * len(group) * max(1, self.reddit_config.get("multireddit_overfetch", 2))
+                fetched = 0
+                async for post in subreddit.top(time_filter=self.reddit_config["time_filter"], limit=limit):
+                    fetched += 1
+                    name = self._post_subreddit(post, multireddit_name)
+                    if counts.get(name, 0) < post_limit:
+                        counts[name] = counts.get(name, 0) + 1
+                        self._append_relevant_post(posts, post, multireddit_name)
+                if len(group) > 1 and fetched >= limit:
+                    for name in group:
+                        if counts.get(name.lower(), 0) < post_limit:
+                            await self._fetch_crowded_out(reddit, name, posts)
+                self._record_outcome("reddit", True)
+                self._record_latency("reddit", time.perf_counter() - started)
+            except Exception as e:
+                logger.warning(f"r/{multireddit_name} 서브레딧 수집 중 오류: {e}")
+                self._record_outcome("reddit", False)
+        return posts
+
+    async def _fetch_crowded_out(self, reddit: asyncpraw.Reddit, name: str, posts: List[CollectedItem]) -> None:
+        """묶음 리스팅에서 밀려난 서브레딧의 top post_limit개를 따로 받아, 아직 없는 포스트만 추가합니다."""
+        seen = {post.url for post in posts}
+        subreddit = await reddit.subreddit(name)
+        async for post in subreddit.top(time_filter=self.reddit_config["time_filter"], limit=self.reddit_config["post_limit"]):
+            if f"https://reddit.com{post.permalink}" not in seen:
+                self._append_relevant_post(posts, post, name)
+
+    @staticmethod
+    def _post_subreddit(post: Any, default: str) -> str:
+        prefixed = getattr(post, "subreddit_name_prefixed", None) or f"r/{default}"
+        return prefixed[2:].lower()
+
+    def _append_relevant_post(self, posts: List[CollectedItem], post: Any, subreddit_name: str) -> None:
+        match = self._match_content(post.title + " " + post.selftext)
+        if match.relevant:
+            posts.append(CollectedItem(
+                title=post.title,
+                url=f"https://reddit.com{post.permalink}",
+                score=post.score,
+                source=getattr(post, "subreddit_name_prefixed", f"r/{subreddit_name}"),
+                category=match.category,
+                published_at=getattr(post, "created_utc", None),
+            ))
+
+    # 프로세스 전체에서 공유하는 Reddit OAuth 토큰 캐시 (client_id 기준)
+    _reddit_tokens: Dict[str, Dict[str, Any]] = {}
+    _REDDIT_TOKEN_ATTRS = ("access_token", "scopes", "_expiration_timestamp_ns", "_expiration_timestamp")
+
+    @staticmethod
+    def _reddit_authorizer(reddit: asyncpraw.Reddit) -> Any:
+        return getattr(getattr(reddit, "_read_only_core", None), "_authorizer", None)
+
+    def _restore_reddit_token(self, reddit: asyncpraw.Reddit) -> None:
+        """이전 실행에서 받은 OAuth 토큰을 새 클라이언트에 넣어 토큰 재발급을 생략합니다."""
+        token = self._reddit_tokens.get(self.reddit_config.get("client_id"))
+        authorizer = self._reddit_authorizer(reddit)
+        if token and authorizer is not None:
+            for attr, value in token.items():
+                setattr(authorizer, attr, value)
+
+    def _save_reddit_token(self, reddit: asyncpraw.Reddit) -> None:
+        """유효한 OAuth 토큰을 다음 실행을 위해 보관합니다."""
+        authorizer = self._reddit_authorizer(reddit)
+        if authorizer is None or not getattr(authorizer, "access_token", None):
+            return
+        self._reddit_tokens[self.reddit_config.get("client_id")] = {
+            attr: getattr(authorizer, attr) for attr in self._REDDIT_TOKEN_ATTRS if hasattr(authorizer, attr)
+        }
+
+    async def _collect_hackernews(self, session: aiohttp.ClientSession) -> List[CollectedItem]:
+        """
+        Hacker News에서 인기 스토리를 비동기적으로 수집합니다.
+        - 순위 순서대로 batch_size개씩 처리하고, story_limit개의 관련 스토리를 찾으면 중단합니다.
+        - 로컬 저장소에 item_ttl 이내로 저장된 아이템은 다시 요청하지 않습니다.
+        """
         if not self.hn_config.get("enabled"):
             return []
 
-        top_stories_url = "https://hacker-news.firebaseio.com/v0/topstories.json"
-        story_ids_json = await self._fetch_json(session, top_stories_url)
+        top_stories_url = f"{self.hn_config.get('base_url', HN_API_URL)}/topstories.json"
+        story_ids_json = await self._fetch_json(session, top_stories_url, source="hackernews")
         if not story_ids_json:
             return []
         
-        story_ids = story_ids_json[:100]
-        tasks = [self._fetch_and_parse_story(session, story_id) for story_id in story_ids]
-        stories = await asyncio.gather(*tasks)
+        story_ids = story_ids_json[:self.hn_config.get("max_stories", 100)]
+        story_limit = self.hn_config.get("story_limit", 30)
+        min_score = self.hn_config.get("min_score", 50)
+        batch_size = self.hn_config.get("batch_size", 10)
+        stored = self.hn_store.get_fresh(story_ids, self.hn_config.get("item_ttl", 3600)) if self.hn_store else {}
+
+        relevant_stories = []
+        fetched_count = 0
+        for start in range(0, len(story_ids), batch_size):
+            batch = story_ids[start:start + batch_size]
+            to_fetch = [story_id for story_id in batch if story_id not in stored]
+            fetched = await asyncio.gather(*(self._fetch_story_data(session, story_id) for story_id in to_fetch))
+            new_items = {story_id: data for story_id, data in zip(to_fetch, fetched) if data}
+            if self.hn_store:
+                self.hn_store.put_many(new_items)
+            stored.update(new_items)
+            fetched_count += len(to_fetch)
+
+            for story_id in batch:
+                story = self._parse_story(story_id, stored.get(story_id))
+                if story and story.score >= min_score:
+                    relevant_stories.append(story)
+            if len(relevant_stories) >= story_limit:
+                break
 
-        relevant_stories = [s for s in stories if s and self._is_relevant_content(s['title']) and s['score'] >= self.hn_config.get("min_score", 50)]
-        return relevant_stories[:self.hn_config.get("story_limit", 30)]
+        if self.hn_store:
+            self.hn_store.prune(self.hn_config.get("store_max_age", 7 * 24 * 3600))
+        logger.info(f"Hacker News: {fetched_count}개 아이템 요청, 나머지는 로컬 저장소 사용")
+        return relevant_stories[:story_limit]
 
-    async def _collect_github_trending(self, session: aiohttp.ClientSession) -> List[Dict]:
-        """GitHub에서 트렌딩 리포지토리를 언어별로 수집합니다."""
+    async def _collect_github_trending(self, session: aiohttp.ClientSession) -> List[CollectedItem]:
+        """
+        GitHub에서 최근 생성된 인기 리포지토리를 수집합니다.
+        - 언어를 languages_per_query개씩 묶어 `language:a language:b` OR 검색 한 번으로 조회합니다.
+        - 결과는 별 수 내림차순이므로, 묶음마다 필요한 개수만큼만 다음 페이지를 가져옵니다.
+        """
         if not self.github_config.get("enabled"):
             return []
 
-        tasks = [self._fetch_github_repos_by_lang(session, lang) for lang in self.github_config.get("languages", [])]
-        results = await asyncio.gather(*tasks)
+        languages = self.github_config.get("languages", [])
+        size = max(1, self.github_config.get("languages_per_query", 5))
+        groups = [languages[i:i + size] for i in range(0, len(languages), size)]
+        results = await asyncio.gather(*(self._fetch_github_repos(session, group) for group in groups))
         repos = [item for sublist in results for item in sublist]
 
-        repos.sort(key=lambda x: x["stars"], reverse=True)
+        repos.sort(key=lambda x: x.score, reverse=True)
         return repos[:self.report_config.get("max_items_per_source", 15)]
 
     # --- 헬퍼(Helper) 메서드 ---
 
-    async def _fetch_and_parse_rss(self, session: aiohttp.ClientSession, url: str) -> List[Dict]:
+    async def _fetch_and_parse_rss(self, session: aiohttp.ClientSession, url: str) -> List[CollectedItem]:
         """단일 RSS 피드를 가져와 파싱합니다."""
         articles = []
-        xml_content = await self._fetch_text(session, url)
+        xml_content = await self._fetch_text(session, url, source="rss", breaker_key=f"rss:{url}")
         if not xml_content:
             return []
 
-        feed = feedparser.parse(xml_content)
-        for entry in feed.entries[:10]:
-            content_text = entry.title + " " + entry.get("summary", "")
-            if self._is_relevant_content(content_text):
-                articles.append({
-                    "title": entry.title,
-                    "link": entry.link,
-                    "source": feed.feed.title if hasattr(feed.feed, 'title') else url,
-                    "category": self._categorize_content(content_text),
-                })
+        feed_title, entries = await self.parse_executor.run("rss", parse_feed_entries, xml_content)
+        for entry in entries:
+            match = self._match_content(entry["title"] + " " + entry["summary"])
+            if match.relevant:
+                articles.append(CollectedItem(
+                    title=entry["title"],
+                    url=entry["link"],
+                    source=feed_title or url,
+                    category=match.category,
+                    published_at=entry["published"],
+                ))
         return articles
 
-    async def _fetch_and_parse_story(self, session: aiohttp.ClientSession, story_id: int) -> Optional[Dict]:
-        """Hacker News 스토리 ID로 상세 정보를 가져옵니다."""
-        story_url = f"https://hacker-news.firebaseio.com/v0/item/{story_id}.json"
-        story_data = await self._fetch_json(session, story_url)
+    async def _fetch_story_data(self, session: aiohttp.ClientSession, story_id: int) -> Optional[Dict]:
+        """Hacker News 아이템 원본 JSON을 가져옵니다."""
+        story_url = f"{self.hn_config.get('base_url', HN_API_URL)}/item/{story_id}.json"
+        return await self._fetch_json(session, story_url, source="hackernews")
+
+    def _parse_story(self, story_id: int, story_data: Optional[Dict]) -> Optional[CollectedItem]:
+        """Hacker News 아이템을 스토리 항목으로 변환합니다. 스토리가 아니거나 관련 없으면 None을 반환합니다."""
         if not story_data or story_data.get("type") != "story":
             return None
-        
-        return {
-            "title": story_data.get("title", ""),
-            "url": story_data.get("url", f"https://news.ycombinator.com/item?id={story_id}"),
-            "score": story_data.get("score", 0),
-            "source": "Hacker News",
-            "category": self._categorize_content(story_data.get("title", "")),
-        }
 
-    async def _fetch_github_repos_by_lang(self, session: aiohttp.ClientSession, language: str) -> List[Dict]:
-        """특정 프로그래밍 언어의 GitHub 트렌딩 리포지토리를 가져옵니다."""
+        match = self._match_content(story_data.get("title", ""))
+        if not match.relevant:
+            return None
+        return CollectedItem(
+            title=story_data.get("title", ""),
+            url=story_data.get("url", f"https://news.ycombinator.com/item?id={story_id}"),
+            score=story_data.get("score", 0),
+            source="Hacker News",
+            category=match.category,
+            published_at=story_data.get("time"),
+        )
+
+    async def _fetch_github_repos(self, session: aiohttp.ClientSession, languages: List[str]) -> List[CollectedItem]:
+        """
+        언어 묶음의 검색 결과를 페이지 단위로 가져와 관련 리포지토리를 반환합니다.
+        - 관련 리포지토리가 max_items_per_source개 모이거나 결과가 끝나면 더 요청하지 않습니다.
+        - 검색 조건에 날짜가 들어가므로 응답은 쿼리+날짜별로 cache_ttl 동안 HTTP 캐시에 보관됩니다.
+        """
         repos = []
-        date_since = (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")
-        url = "https://api.github.com/search/repositories"
-        params = {"q": f"language:{language} created:>{date_since}", "sort": "stars", "order": "desc", "per_page": 10}
-        
-        data = await self._fetch_json(session, url, params=params)
-        if not data or "items" not in data:
-            return []
+        date_since = (datetime.now() - timedelta(days=self.github_config.get("days", 7))).strftime("%Y-%m-%d")
+        url = f"{self.github_config.get('api_url', GITHUB_API_URL)}/search/repositories"
+        query = " ".join(f"language:{language}" for language in languages) + f" created:>{date_since}"
+        per_page = self.github_config.get("per_page", 30)
+        needed = self.report_config.get("max_items_per_source", 15)
 
-        for repo in data["items"]:
-            description = repo.get("description") or ""
-            content_text = repo["name"] + " " + description
-            if self._is_relevant_content(content_text):
-                repos.append({
-                    "name": repo["name"],
-                    "url": repo["html_url"],
-                    "stars": repo["stargazers_count"],
-                    "description": description,
-                    "language": repo.get("language", ""),
-                    "source": "GitHub",
-                    "category": self._categorize_content(content_text),
-                })
+        for page in range(1, self.github_config.get("max_pages", 3) + 1):
+            params = {"q": query, "sort": "stars", "order": "desc", "per_page": per_page, "page": page}
+            data = await self._fetch_json(session, url, params=params, source="github", ttl=self.github_config.get("cache_ttl"))
+            if not data or "items" not in data:
+                break
+
+            for repo in data["items"]:
+                description = repo.get("description") or ""
+                match = self._match_content(repo["name"] + " " + description)
+                if match.relevant:
+                    repos.append(CollectedItem(
+                        title=repo["name"],
+                        url=repo["html_url"],
+                        score=repo["stargazers_count"],
+                        description=description,
+                        language=repo.get("language") or "",
+                        source="GitHub",
+                        category=match.category,
+                        published_at=_parse_timestamp(repo.get("created_at")),
+                    ))
+            # 검색 API는 최대 1000개까지만 결과를 돌려줍니다.
+            total = min(data.get("total_count", 0), 1000)
+            if len(repos) >= needed or len(data["items"]) < per_page or page * per_page >= total:
+                break
         return repos
 
-    async def _fetch_text(self, session: aiohttp.ClientSession, url: str) -> Optional[str]:
-        """aiohttp를 사용하여 텍스트를 안전하게 가져옵니다."""
+    async def _fetch(self, session: aiohttp.ClientSession, url: str, params: Optional[Dict] = None,
+                     source: Optional[str] = None, breaker_key: Optional[str] = None,
+                     ttl: Optional[int] = None) -> Optional[str]:
+        """
+        HTTP 캐시를 거쳐 응답 본문을 텍스트로 가져옵니다.
+        - 만료 전 캐시 항목은 요청 없이 디스크에서 반환합니다.
+        - 만료된 항목은 조건부 GET으로 재검증하고, 304 응답이면 캐시된 본문을 사용합니다.
+        - 실제 요청은 호스트별 동시성/속도 제한(RateLimiter)을 거칩니다.
+        - source별 기본 헤더와 타임아웃은 공유 HTTP 클라이언트 설정을 따릅니다.
+        - 연결 오류/타임아웃, 429, 5xx 응답은 소스별 재시도 정책(백오프 + 재시도 예산)에 따라 다시 시도합니다.
+        - 서킷이 열린 소스(breaker_key, 기본값은 source)는 요청하지 않고 캐시된 본문이 있으면 그것을 반환합니다.
+        - ttl을 주면 응답의 Cache-Control 대신 그 시간(초) 동안 캐시합니다.
+        """
+        entry = self.http_cache.lookup(url, params) if self.http_cache else None
+        if entry and self.http_cache.is_fresh(entry):
+            body = self.http_cache.read_body(entry)
+            if body is not None:
+                return body
+            entry = None
+
+        breaker_key = breaker_key or source
+        if breaker_key and not self._circuit_allows(breaker_key):
+            return self.http_cache.read_body(entry) if entry else None
+
+        policy = self.retry_policies.for_source(source)
+        body = None
+        for attempt in range(policy.max_attempts):
+            body, retryable = await self._fetch_once(session, url, params, source, entry, ttl)
+            if body is not None or not retryable:
+                break
+            if attempt + 1 >= policy.max_attempts or not self.retry_policies.try_spend(source):
+                break
+            delay = policy.delay(attempt)
+            logger.info(f"URL {url} 재시도 {attempt + 1}/{policy.max_attempts - 1} ({delay:.2f}초 후)")
+            await asyncio.sleep(delay)
+
+        if breaker_key:
+            self._record_outcome(breaker_key, body is not None)
+        return body
+
+    async def _fetch_once(self, session: aiohttp.ClientSession, url: str, params: Optional[Dict],
+                          source: Optional[str], entry: Optional[Dict], ttl: Optional[int] = None) -> Tuple[Optional[str], bool]:
+        """요청을 한 번 보내고 (본문, 재시도 가능 여부)를 반환합니다."""
+        headers = self._request_headers(source)
+        if self.http_cache:
+            headers.update(self.http_cache.conditional_headers(entry))
         try:
-            async with session.get(url, timeout=10) as response:
-                if response.status == 200:
-                    return await response.text()
-                logger.warning(f"URL {url}에서 비정상 응답: {response.status}")
-                return None
+            async with self.rate_limiter.limit(url):
+                started = time.perf_counter()
+                async with session.get(url, params=params, headers=headers, timeout=self.http_client.timeout_for(source)) as response:
+                    self._record_latency(source or "other", time.perf_counter() - started)
+                    self.rate_limiter.observe(url, response.status, response.headers)
+                    if response.status == 304 and entry:
+                        self.http_cache.revalidate(entry, response.headers, ttl)
+                        return self.http_cache.read_body(entry), False
+                    if response.status == 200:
+                        body = await response.text()
+                        if self.http_cache:
+                            self.http_cache.store(url, params, response.headers, body, ttl)
+                        return body, False
+                    logger.warning(f"URL {url}에서 비정상 응답: {response.status}")
+                    return None, response.status == 429 or response.status >= 500
         except Exception as e:
             logger.warning(f"URL {url} 요청 중 오류: {e}")
-            return None
+            return None, True
+
+    def _circuit_allows(self, key: str) -> bool:
+        """서킷 브레이커가 꺼져 있거나 해당 키의 서킷이 닫혀/반열림 상태면 True를 반환합니다."""
+        if self.circuit_breaker is None or self.circuit_breaker.allow(key):
+            return True
+        logger.info(f"🔌 {key}: 서킷이 열려 있어 이번 실행에서는 건너뜁니다.")
+        return False
+
+    def _record_latency(self, source: str, seconds: float) -> None:
+        self.request_latencies.setdefault(source, []).append(seconds)
+
+    def _record_outcome(self, key: str, success: bool) -> None:
+        if self.circuit_breaker:
+            self.circuit_breaker.record(key, success)
+
+    def _request_headers(self, source: Optional[str]) -> Dict[str, str]:
+        """소스별 기본 헤더에 인증 헤더를 더해 반환합니다."""
+        headers = self.http_client.headers_for(source)
+        if source == "github" and self.github_token:
+            headers["Authorization"] = f"token {self.github_token}"
+        return headers
+
+    async def _fetch_text(self, session: aiohttp.ClientSession, url: str, source: Optional[str] = None,
+                          breaker_key: Optional[str] = None) -> Optional[str]:
+        """aiohttp를 사용하여 텍스트를 안전하게 가져옵니다."""
+        return await self._fetch(session, url, source=source, breaker_key=breaker_key)
 
-    async def _fetch_json(self, session: aiohttp.ClientSession, url: str, params: Optional[Dict] = None) -> Optional[Dict]:
+    async def _fetch_json(self, session: aiohttp.ClientSession, url: str, params: Optional[Dict] = None,
+                          source: Optional[str] = None, ttl: Optional[int] = None) -> Optional[Dict]:
         """aiohttp를 사용하여 JSON을 안전하게 가져옵니다."""
+        body = await self._fetch(session, url, params=params, source=source, ttl=ttl)
+        if body is None:
+            return None
         try:
-            async with session.get(url, params=params, timeout=10) as response:
-                if response.status == 200:
-                    return await response.json()
-                logger.warning(f"URL {url}에서 비정상 응답: {response.status}")
-                return None
-        except Exception as e:
-            logger.warning(f"URL {url} 요청 중 오류: {e}")
+            return json.loads(body)
+        except ValueError as e:
+            logger.warning(f"URL {url}의 JSON 파싱 오류: {e}")
             return None
 
     # --- 콘텐츠 필터링 및 분류 ---
 
+    def _get_matcher(self) -> KeywordMatcher:
+        """현재 키워드 목록으로 컴파일된 매처를 반환합니다. 키워드가 바뀌면 다시 빌드합니다."""
+        signature = (
+            tuple(self.filter_keywords.get("must_have_any", [])),
+            tuple(self.filter_keywords.get("exclude", [])),
+        )
+        if self._matcher is None or signature != self._matcher_signature:
+            self._matcher = KeywordMatcher(signature[0], signature[1], self.CATEGORIES)
+            self._matcher_signature = signature
+        return self._matcher
+
+    def _match_content(self, text: str) -> ContentMatch:
+        """한 번의 스캔으로 관련성, 매칭 키워드, 카테고리를 판정합니다."""
+        return self._get_matcher().scan(text)
+
     def _is_relevant_content(self, text: str) -> bool:
         """콘텐츠가 설정된 키워드와 관련이 있는지 확인합니다."""
-        text_lower = text.lower()
-        if any(word.lower() in text_lower for word in self.filter_keywords.get("exclude", [])):
-            return False
-        if any(word.lower() in text_lower for word in self.filter_keywords.get("must_have_any", [])):
-            return True
-        return False
+        return self._match_content(text).relevant
 
     def _categorize_content(self, text: str) -> str:
         """콘텐츠의 카테고리를 분류합니다."""
-        text_lower = text.lower()
-        categories = {
-            "AI & Machine Learning": ["gpt", "claude", "llm", "ai", "machine learning"],
-            "CSS & Design": ["css", "style", "animation", "design", "ui", "ux"],
-            "Frontend Frameworks": ["react", "vue", "svelte", "angular", "next.js"],
-            "JavaScript & TypeScript": ["javascript", "typescript", "node.js", "deno", "bun"],
-        }
-        for category, keywords in categories.items():
-            if any(keyword in text_lower for keyword in keywords):
-                return category
-        return "General Web Development"
\ No newline at end of file
+        return self._match_content(text).category
@@ -0,0 +1,143 @@
+import hashlib
+import re
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from scrapper.items import CollectedItem
+from scrapper.seen_ledger import canonicalize_url
+
+_TOKEN_PATTERN = re.compile(r"[0-9a-z가-힣]+")
+_BIT_POSITIONS = np.arange(64, dtype=np.uint64)
+_POPCOUNT_TABLE = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+# 토큰이 너무 적은 제목은 SimHash가 불안정하므로 URL로만 비교합니다.
+MIN_TOKENS_FOR_SIMHASH = 3
+
+
+@lru_cache(maxsize=65536)
+def _token_hash(token: str) -> int:
+    return int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def _shingles(title: str) -> List[str]:
+    """제목을 단어와 인접 단어쌍(bigram)으로 나눕니다."""
+    words = _TOKEN_PATTERN.findall(title.lower())
+    return words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+
+def simhash_titles(titles: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    제목 목록의 64비트 SimHash 지문을 한 번에(벡터화) 계산합니다.
+    반환값: (지문 배열 uint64, 제목별 단어 수)
+    """
+    rows: List[int] = []
+    hashes: List[int] = []
+    word_counts = np.zeros(len(titles), dtype=np.int64)
+    for row, title in enumerate(titles):
+        shingles = _shingles(title)
+        word_counts[row] = len(_TOKEN_PATTERN.findall(title.lower()))
+        rows.extend([row] * len(shingles))
+        hashes.extend(_token_hash(shingle) for shingle in shingles)
+
+    votes = np.zeros((len(titles), 64), dtype=np.int32)
+    if hashes:
+        bits = (np.array(hashes, dtype=np.uint64)[:, None] >> _BIT_POSITIONS) & np.uint64(1)
+        np.add.at(votes, np.array(rows), bits.astype(np.int32) * 2 - 1)
+    fingerprints = ((votes > 0).astype(np.uint64) << _BIT_POSITIONS).sum(axis=1, dtype=np.uint64)
+    return fingerprints, word_counts
+
+
+def hamming_distances(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """두 uint64 배열의 원소별 해밍 거리를 계산합니다."""
+    xor = np.bitwise_xor(a, b)
+    return _POPCOUNT_TABLE[xor.view(np.uint8)].reshape(-1, 8).sum(axis=1)
+
+
+def _candidate_pairs(fingerprints: np.ndarray, eligible: np.ndarray, max_distance: int) -> np.ndarray:
+    """
+    지문을 max_distance+1개의 밴드로 나누어, 한 밴드라도 같은 쌍만 후보로 고릅니다.
+    비둘기집 원리에 따라 해밍 거리가 max_distance 이하인 쌍은 반드시 후보에 포함됩니다.
+    """
+    indices = np.flatnonzero(eligible)
+    bands = max_distance + 1
+    width = 64 // bands
+    mask = np.uint64((1 << width) - 1)
+    pairs = set()
+    for band in range(bands):
+        values = (fingerprints[indices] >> np.uint64(band * width)) & mask
+        order = np.argsort(values, kind="stable")
+        sorted_values = values[order]
+        boundaries = np.flatnonzero(np.diff(sorted_values)) + 1
+        for group in np.split(indices[order], boundaries):
+            if len(group) < 2:
+                continue
+            for i, first in enumerate(group):
+                for second in group[i + 1:]:
+                    pairs.add((int(first), int(second)))
+    return np.array(sorted(pairs), dtype=np.int64).reshape(-1, 2)
+
+
+def cluster_near_duplicates(data: Dict[str, List[CollectedItem]], max_distance: int = 3) -> Dict[str, List[CollectedItem]]:
+    """
+    소스 간 중복 항목을 묶어 대표 항목 하나만 남깁니다.
+    - 정규화된 URL이 같거나, 제목 SimHash의 해밍 거리가 max_distance 이하이면 같은 항목으로 봅니다.
+    - 대표는 점수(score/stars)가 가장 높은 항목이며, 묶인 항목들의 출처(sources),
+      점수 합(merged_score), 중복 수(duplicate_count)를 대표 항목에 기록합니다.
+    """
+    entries = [
+        (source, CollectedItem.coerce(item, source))
+        for source, items in data.items() if isinstance(items, list) for item in items
+    ]
+    if not entries:
+        return data
+
+    parent = list(range(len(entries)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def union(i: int, j: int) -> None:
+        root_i, root_j = find(i), find(j)
+        if root_i != root_j:
+            parent[max(root_i, root_j)] = min(root_i, root_j)
+
+    # 1. URL 동일성
+    first_by_url: Dict[str, int] = {}
+    for index, (_, item) in enumerate(entries):
+        if item.url:
+            union(first_by_url.setdefault(canonicalize_url(item.url), index), index)
+
+    # 2. 제목 SimHash 근접성
+    titles = [item.title for _, item in entries]
+    fingerprints, word_counts = simhash_titles(titles)
+    pairs = _candidate_pairs(fingerprints, word_counts >= MIN_TOKENS_FOR_SIMHASH, max_distance)
+    if len(pairs):
+        distances = hamming_distances(fingerprints[pairs[:, 0]], fingerprints[pairs[:, 1]])
+        for first, second in pairs[distances <= max_distance]:
+            union(int(first), int(second))
+
+    clusters: Dict[int, List[int]] = {}
+    for index in range(len(entries)):
+        clusters.setdefault(find(index), []).append(index)
+
+    keep: Dict[int, CollectedItem] = {}
+    for members in clusters.values():
+        best = max(members, key=lambda i: entries[i][1].score)
+        representative = entries[best][1]
+        if len(members) > 1:
+            representative = representative.replace(
+                sources=sorted({entries[i][1].source or entries[i][0] for i in members}),
+                merged_score=sum(entries[i][1].score for i in members),
+                duplicate_count=len(members) - 1,
+            )
+        keep[best] = representative
+
+    deduped = {source: [] if isinstance(items, list) else items for source, items in data.items()}
+    for index, (source, _) in enumerate(entries):
+        if index in keep:
+            deduped[source].append(keep[index])
+    return deduped
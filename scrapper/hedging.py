@@ -0,0 +1,102 @@
+import asyncio
+import math
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+
+from scrapper.utils.logger import logger
+
+
+class LatencyHistogram:
+    """
+    제공자 하나의 최근 응답 시간(초)을 window개까지 보관하는 이동 히스토그램입니다.
+    표본이 min_samples개 미만이면 hedge_delay()는 initial_delay를 반환합니다.
+    """
+
+    def __init__(self, window: int = 100, percentile: float = 0.95, min_samples: int = 10,
+                 initial_delay: float = 8.0, min_delay: float = 1.0, max_delay: float = 30.0):
+        self.samples: Deque[float] = deque(maxlen=window)
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "LatencyHistogram":
+        hedging_config = config.get("HEDGING_CONFIG", {})
+        return cls(
+            window=hedging_config.get("window", 100),
+            percentile=hedging_config.get("percentile", 0.95),
+            min_samples=hedging_config.get("min_samples", 10),
+            initial_delay=hedging_config.get("initial_delay", 8.0),
+            min_delay=hedging_config.get("min_delay", 1.0),
+            max_delay=hedging_config.get("max_delay", 30.0),
+        )
+
+    def record(self, elapsed: float) -> None:
+        self.samples.append(elapsed)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """최근 표본의 q 분위수 (nearest-rank). 표본이 없으면 None"""
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        return ordered[min(max(math.ceil(q * len(ordered)) - 1, 0), len(ordered) - 1)]
+
+    def hedge_delay(self) -> float:
+        """다음 제공자를 추가로 호출하기 전에 기다릴 시간 (percentile 분위수를 min/max로 제한)"""
+        if len(self.samples) < self.min_samples:
+            return self.initial_delay
+        return min(max(self.quantile(self.percentile), self.min_delay), self.max_delay)
+
+
+async def hedged_call(calls: List[Tuple[str, Callable[[], Awaitable[Optional[Any]]]]],
+                      histograms: Dict[str, LatencyHistogram]) -> Optional[Any]:
+    """
+    calls를 우선순위대로 호출하고 처음 성공한(비어 있지 않은) 결과를 반환합니다. 모두 실패하면 None입니다.
+    - 먼저 보낸 호출이 그 제공자의 hedge_delay() 안에 응답하지 않으면 다음 제공자를 함께 호출합니다.
+    - 호출이 실패(빈 결과 또는 예외)하면 기다리지 않고 다음 제공자를 호출합니다.
+    - 하나가 성공하면 나머지 호출은 취소합니다.
+    - 성공한 호출의 응답 시간을 히스토그램에 기록합니다. 취소된 호출은 그때까지 걸린 시간을 하한값으로 기록하여,
+      느린 제공자의 분위수가 낮게 잡히지 않도록 합니다.
+    """
+    queue = list(calls)
+    pending: Dict[asyncio.Task, Tuple[str, float]] = {}
+    deadline = 0.0  # 이 시각이 지나면 다음 제공자를 호출합니다.
+
+    def launch() -> None:
+        nonlocal deadline
+        name, call = queue.pop(0)
+        if pending:
+            logger.info(f"  ⏱️ 응답 지연, {name} 동시 호출")
+        pending[asyncio.create_task(call(), name=f"hedge:{name}")] = (name, time.perf_counter())
+        # 히스토그램이 없는 제공자는 실패할 때까지 기다립니다.
+        deadline = time.monotonic() + histograms[name].hedge_delay() if name in histograms else math.inf
+
+    try:
+        while queue or pending:
+            if queue and (not pending or time.monotonic() >= deadline):
+                launch()
+            timeout = max(deadline - time.monotonic(), 0) if queue and deadline != math.inf else None
+            done, _ = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                name, started = pending.pop(task)
+                try:
+                    result = task.result()
+                except Exception as e:
+                    logger.warning(f"  ⚠️ {name} 호출 실패: {e}")
+                    result = None
+                if result:
+                    if name in histograms:
+                        histograms[name].record(time.perf_counter() - started)
+                    return result
+                deadline = 0.0  # 실패했으므로 다음 제공자를 바로 호출합니다.
+        return None
+    finally:
+        for task, (name, started) in pending.items():
+            task.cancel()
+            if name in histograms:
+                histograms[name].record(time.perf_counter() - started)
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
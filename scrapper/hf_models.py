@@ -0,0 +1,164 @@
+import asyncio
+import gc
+import resource
+import sys
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from scrapper.llm_clients import HuggingFaceClient
+from scrapper.utils.logger import logger
+
+
+def current_rss_mb() -> float:
+    """현재 프로세스의 상주 메모리(MB). /proc이 없으면 최대 RSS로 대신합니다."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * resource.getpagesize() / (1024 * 1024)
+    except (OSError, IndexError, ValueError):
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss 단위는 macOS에서 바이트, Linux 등에서는 KB입니다.
+        return max_rss / (1024 * 1024) if sys.platform == "darwin" else max_rss / 1024
+
+
+class _Resident:
+    def __init__(self, client: HuggingFaceClient):
+        self.client = client
+        self.in_use = 0
+        self.last_used = 0.0
+        self.rss_mb = 0.0  # 마지막 로드 때 늘어난 RSS
+        self.load_seconds = 0.0
+        self.loads = 0
+        self.unloads = 0
+
+
+class HuggingFaceModelManager:
+    """
+    로컬 Hugging Face 파이프라인을 처음 쓸 때 로드하고, 메모리 상한 안에서 LRU로 상주시킵니다.
+    - 로드 전후 RSS 차이를 모델의 메모리 사용량으로 기록하고, 상주 모델 합계가 max_memory_mb를 넘으면
+      가장 오래 쓰지 않은 모델부터 내립니다. 실행 중인 모델은 내리지 않습니다.
+    - idle_seconds 동안 쓰지 않은 모델은 다음 호출 때 내립니다.
+    - 로드는 한 번에 하나씩, 스레드 풀에서 실행합니다.
+    """
+
+    def __init__(self, max_memory_mb: Optional[float] = None, idle_seconds: Optional[float] = None):
+        self.max_memory_mb = max_memory_mb
+        self.idle_seconds = idle_seconds
+        self.models: Dict[str, _Resident] = {}
+        # 관리자는 실행(asyncio.run)마다 재사용되므로 잠금은 이벤트 루프별로 만듭니다.
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._load_lock: Optional[asyncio.Lock] = None
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "HuggingFaceModelManager":
+        hf_config = config.get("HF_MODELS_CONFIG", {})
+        return cls(max_memory_mb=hf_config.get("max_memory_mb"), idle_seconds=hf_config.get("idle_seconds"))
+
+    def register(self, name: str, client: HuggingFaceClient) -> None:
+        self.models[name] = _Resident(client)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.models
+
+    def preload(self, names: Iterable[str]) -> None:
+        """지정한 모델을 미리 로드합니다. (동기, 초기화 시 사용)"""
+        for name in names:
+            if name in self.models and not self.models[name].client.loaded:
+                self._make_room(name)
+                self._load(name)
+
+    async def run(self, name: str, *args: Any, **kwargs: Any) -> Any:
+        """모델을 (필요하면 로드해서) 실행하고 원본 출력을 반환합니다."""
+        resident = self.models[name]
+        resident.in_use += 1
+        try:
+            self.unload_idle()
+            if not resident.client.loaded:
+                async with self._get_load_lock():
+                    if not resident.client.loaded:
+                        self._make_room(name)
+                        await asyncio.get_running_loop().run_in_executor(None, self._load, name)
+                        self._enforce_ceiling(keep=name)
+            resident.last_used = time.monotonic()
+            return await resident.client.run(*args, **kwargs)
+        finally:
+            resident.in_use -= 1
+            resident.last_used = time.monotonic()
+
+    def _get_load_lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._load_lock = asyncio.Lock()
+        return self._load_lock
+
+    def _load(self, name: str) -> None:
+        resident = self.models[name]
+        rss_before = current_rss_mb()
+        started = time.perf_counter()
+        resident.client.load()
+        resident.load_seconds = time.perf_counter() - started
+        resident.rss_mb = max(current_rss_mb() - rss_before, 0.0)
+        resident.loads += 1
+        resident.last_used = time.monotonic()
+        logger.info(f"🤗 {name} 모델 로드: {resident.load_seconds:.1f}초, RSS +{resident.rss_mb:.0f}MB")
+
+    def resident_memory_mb(self) -> float:
+        return sum(r.rss_mb for r in self.models.values() if r.client.loaded)
+
+    def _make_room(self, name: str) -> None:
+        """이전에 측정한 크기를 기준으로, name을 로드해도 상한을 넘지 않도록 다른 모델을 내립니다."""
+        if self.max_memory_mb is not None:
+            self._evict_until(self.max_memory_mb - self.models[name].rss_mb, keep=name)
+
+    def _enforce_ceiling(self, keep: str) -> None:
+        if self.max_memory_mb is not None:
+            self._evict_until(self.max_memory_mb, keep=keep)
+
+    def _evict_until(self, limit_mb: float, keep: str) -> None:
+        candidates = sorted(
+            (r for n, r in self.models.items() if n != keep and r.client.loaded and not r.in_use),
+            key=lambda r: r.last_used,
+        )
+        for resident in candidates:
+            if self.resident_memory_mb() <= limit_mb:
+                break
+            self._unload(resident)
+
+    def unload_idle(self) -> None:
+        if self.idle_seconds is None:
+            return
+        now = time.monotonic()
+        for resident in self.models.values():
+            if resident.client.loaded and not resident.in_use and now - resident.last_used > self.idle_seconds:
+                self._unload(resident)
+
+    def _unload(self, resident: _Resident) -> None:
+        name = next(n for n, r in self.models.items() if r is resident)
+        resident.client.unload()
+        resident.unloads += 1
+        gc.collect()
+        logger.info(f"🤗 {name} 모델 내림 (약 {resident.rss_mb:.0f}MB)")
+
+    def report(self) -> List[Dict[str, Any]]:
+        """모델별 상주 여부, 로드 횟수/시간, RSS 증가량을 반환합니다."""
+        return [
+            {
+                "name": name,
+                "model": resident.client.model,
+                "loaded": resident.client.loaded,
+                "loads": resident.loads,
+                "unloads": resident.unloads,
+                "load_seconds": round(resident.load_seconds, 2),
+                "rss_mb": round(resident.rss_mb, 1),
+            }
+            for name, resident in self.models.items()
+        ]
+
+    def log_report(self) -> None:
+        for row in self.report():
+            if row["loads"]:
+                state = "상주" if row["loaded"] else "내림"
+                logger.info(
+                    f"🤗 {row['name']} ({row['model']}): {state}, 로드 {row['loads']}회 "
+                    f"(마지막 {row['load_seconds']}초, RSS +{row['rss_mb']}MB), 내림 {row['unloads']}회"
+                )
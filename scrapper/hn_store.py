@@ -0,0 +1,63 @@
+import json
+import os
+import sqlite3
+import time
+from typing import Dict, Iterable, Optional
+
+
+class HNItemStore:
+    """
+    Hacker News 아이템 JSON을 스토리 id 기준으로 보관하는 SQLite 저장소입니다.
+    - 가져온 시각(fetched_at)을 함께 기록하여, TTL 이내의 아이템은 다시 요청하지 않습니다.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS items ("
+                " id INTEGER PRIMARY KEY,"
+                " data TEXT NOT NULL,"
+                " fetched_at REAL NOT NULL)"
+            )
+        return self._conn
+
+    def get_fresh(self, item_ids: Iterable[int], ttl: float) -> Dict[int, Dict]:
+        """TTL 이내에 가져온 아이템만 {id: 데이터} 형태로 반환합니다."""
+        item_ids = list(item_ids)
+        if not item_ids:
+            return {}
+        placeholders = ",".join("?" * len(item_ids))
+        rows = self._connect().execute(
+            f"SELECT id, data FROM items WHERE fetched_at >= ? AND id IN ({placeholders})",
+            [time.time() - ttl, *item_ids],
+        )
+        return {item_id: json.loads(data) for item_id, data in rows}
+
+    def put_many(self, items: Dict[int, Dict]) -> None:
+        """새로 가져온 아이템들을 현재 시각으로 저장(덮어쓰기)합니다."""
+        if not items:
+            return
+        now = time.time()
+        conn = self._connect()
+        conn.executemany(
+            "INSERT OR REPLACE INTO items (id, data, fetched_at) VALUES (?, ?, ?)",
+            [(item_id, json.dumps(data), now) for item_id, data in items.items()],
+        )
+        conn.commit()
+
+    def prune(self, max_age: float) -> None:
+        """오래된 아이템을 삭제하여 저장소 크기를 제한합니다."""
+        conn = self._connect()
+        conn.execute("DELETE FROM items WHERE fetched_at < ?", (time.time() - max_age,))
+        conn.commit()
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
@@ -0,0 +1,191 @@
+import hashlib
+import json
+import os
+import time
+from typing import Any, Dict, Mapping, Optional
+from urllib.parse import urlencode
+
+from scrapper.utils.logger import logger
+
+
+def parse_cache_control(value: Optional[str]) -> Dict[str, Optional[str]]:
+    """Cache-Control 헤더를 {지시어: 값} 딕셔너리로 파싱합니다."""
+    directives: Dict[str, Optional[str]] = {}
+    if not value:
+        return directives
+    for part in value.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        name, _, arg = part.partition("=")
+        directives[name.strip().lower()] = arg.strip().strip('"') or None
+    return directives
+
+
+class HttpCache:
+    """
+    조건부 GET(ETag / Last-Modified)을 지원하는 디스크 기반 HTTP 응답 캐시입니다.
+    - URL + 쿼리 파라미터를 키로 본문과 검증자(validator)를 저장합니다.
+    - Cache-Control(max-age, no-cache, no-store)을 따르고, 없으면 기본 TTL을 사용합니다.
+    - 전체 본문 크기가 상한을 넘으면 가장 오래 사용되지 않은 항목부터 제거합니다(LRU).
+    """
+
+    INDEX_FILE = "index.json"
+
+    def __init__(self, cache_dir: str, max_size_bytes: int = 50 * 1024 * 1024, default_ttl: int = 600):
+        self.cache_dir = cache_dir
+        self.max_size_bytes = max_size_bytes
+        self.default_ttl = default_ttl
+        self._index: Dict[str, Dict[str, Any]] = self._load_index()
+        self._dirty = False
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], cache_name: str = "http_cache") -> Optional["HttpCache"]:
+        """
+        HTTP_CACHE_CONFIG 설정으로 캐시를 생성합니다. 비활성화 상태면 None을 반환합니다.
+        캐시마다 index.json을 따로 두도록 cache_dir(기본값 OUTPUT_DIR) 아래 cache_name 디렉터리를 사용합니다.
+        """
+        cache_config = config.get("HTTP_CACHE_CONFIG", {})
+        if not cache_config.get("enabled"):
+            return None
+        cache_dir = os.path.join(cache_config.get("cache_dir") or config.get("OUTPUT_DIR", "outputs"), cache_name)
+        return cls(
+            cache_dir=cache_dir,
+            max_size_bytes=int(cache_config.get("max_size_mb", 50) * 1024 * 1024),
+            default_ttl=cache_config.get("default_ttl", 600),
+        )
+
+    # --- 조회 ---
+
+    @staticmethod
+    def make_key(url: str, params: Optional[Mapping[str, Any]] = None) -> str:
+        """URL과 파라미터로 캐시 키를 만듭니다. 파라미터 순서는 키에 영향을 주지 않습니다."""
+        raw = url
+        if params:
+            raw += "?" + urlencode(sorted((str(k), str(v)) for k, v in params.items()))
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def lookup(self, url: str, params: Optional[Mapping[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """캐시 항목을 찾고, 있으면 마지막 사용 시각을 갱신합니다."""
+        entry = self._index.get(self.make_key(url, params))
+        if entry:
+            entry["last_access"] = time.time()
+            self._dirty = True
+        return entry
+
+    def is_fresh(self, entry: Dict[str, Any]) -> bool:
+        """만료 전이라 서버에 묻지 않고 바로 사용할 수 있는 항목인지 확인합니다."""
+        return entry.get("expires_at", 0) > time.time()
+
+    def conditional_headers(self, entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """재검증 요청에 붙일 If-None-Match / If-Modified-Since 헤더를 만듭니다."""
+        headers: Dict[str, str] = {}
+        if not entry:
+            return headers
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def read_body(self, entry: Dict[str, Any]) -> Optional[str]:
+        """디스크에서 캐시된 본문을 읽습니다. 파일이 사라졌다면 항목을 제거합니다."""
+        try:
+            with open(self._body_path(entry["key"]), "r", encoding="utf-8") as f:
+                return f.read()
+        except OSError:
+            self._remove(entry["key"])
+            return None
+
+    # --- 저장 ---
+
+    def store(self, url: str, params: Optional[Mapping[str, Any]], headers: Mapping[str, str],
+              body: str, ttl: Optional[int] = None) -> None:
+        """200 응답을 저장합니다. ttl을 주면 응답 헤더보다 우선합니다."""
+        cache_control = parse_cache_control(headers.get("Cache-Control"))
+        if "no-store" in cache_control:
+            return
+
+        key = self.make_key(url, params)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(self._body_path(key), "w", encoding="utf-8") as f:
+                f.write(body)
+        except OSError as e:
+            logger.warning(f"HTTP 캐시 본문 저장 실패 ({url}): {e}")
+            return
+
+        now = time.time()
+        self._index[key] = {
+            "key": key,
+            "url": url,
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+            "expires_at": now + self._ttl_for(cache_control, ttl),
+            "size": len(body.encode("utf-8")),
+            "last_access": now,
+        }
+        self._dirty = True
+        self._evict()
+
+    def revalidate(self, entry: Dict[str, Any], headers: Mapping[str, str], ttl: Optional[int] = None) -> None:
+        """304 응답을 받은 항목의 만료 시각과 검증자를 갱신합니다."""
+        entry["expires_at"] = time.time() + self._ttl_for(parse_cache_control(headers.get("Cache-Control")), ttl)
+        if headers.get("ETag"):
+            entry["etag"] = headers["ETag"]
+        if headers.get("Last-Modified"):
+            entry["last_modified"] = headers["Last-Modified"]
+        self._dirty = True
+
+    def save(self) -> None:
+        """변경된 인덱스를 디스크에 기록합니다."""
+        if not self._dirty:
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(os.path.join(self.cache_dir, self.INDEX_FILE), "w", encoding="utf-8") as f:
+                json.dump(self._index, f)
+            self._dirty = False
+        except OSError as e:
+            logger.warning(f"HTTP 캐시 인덱스 저장 실패: {e}")
+
+    # --- 내부 헬퍼 ---
+
+    def _ttl_for(self, cache_control: Dict[str, Optional[str]], ttl: Optional[int]) -> float:
+        if ttl is not None:
+            return ttl
+        if "no-cache" in cache_control:
+            return 0
+        max_age = cache_control.get("max-age")
+        if max_age and max_age.isdigit():
+            return int(max_age)
+        return self.default_ttl
+
+    def _evict(self) -> None:
+        """전체 크기가 상한 이하가 될 때까지 LRU 순서로 항목을 제거합니다."""
+        total = sum(entry["size"] for entry in self._index.values())
+        if total <= self.max_size_bytes:
+            return
+        for entry in sorted(self._index.values(), key=lambda e: e["last_access"]):
+            if total <= self.max_size_bytes:
+                break
+            total -= entry["size"]
+            self._remove(entry["key"])
+
+    def _remove(self, key: str) -> None:
+        self._index.pop(key, None)
+        self._dirty = True
+        try:
+            os.remove(self._body_path(key))
+        except OSError:
+            pass
+
+    def _body_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.body")
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(os.path.join(self.cache_dir, self.INDEX_FILE), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
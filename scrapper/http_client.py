@@ -0,0 +1,101 @@
+import asyncio
+from typing import Any, Dict, Optional
+
+import aiohttp
+
+from scrapper.utils.logger import logger
+
+
+class HttpClientManager:
+    """
+    수집기, X Embed 수집기, 한도 확인이 함께 쓰는 장수명 aiohttp 세션 관리자입니다.
+    - 튜닝된 TCPConnector(전체/호스트별 연결 수, DNS 캐시, keep-alive)로 연결을 재사용합니다.
+    - 소스별 기본 헤더와 타임아웃을 HTTP_CLIENT_CONFIG["sources"]에서 가져옵니다.
+    - 세션은 이벤트 루프에 묶이므로, 루프가 바뀌면 새로 만들고 실행이 끝나면 close()로 정리합니다.
+    """
+
+    def __init__(self, config: Dict[str, Any]):
+        http_config = config.get("HTTP_CLIENT_CONFIG", {})
+        self.limit = http_config.get("limit", 100)
+        self.limit_per_host = http_config.get("limit_per_host", 10)
+        self.ttl_dns_cache = http_config.get("ttl_dns_cache", 300)
+        self.keepalive_timeout = http_config.get("keepalive_timeout", 30)
+        self.default_timeout = http_config.get("default_timeout", 10)
+        self.user_agent = http_config.get("user_agent", config.get("APP_NAME", "WebDevTrendsAgent"))
+        self.sources = http_config.get("sources", {})
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        """현재 이벤트 루프에서 쓸 공유 세션을 반환합니다."""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            await self._close_stale_session()
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                ttl_dns_cache=self.ttl_dns_cache,
+                keepalive_timeout=self.keepalive_timeout,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.default_timeout),
+                headers={"User-Agent": self.user_agent},
+            )
+            self._loop = loop
+        return self._session
+
+    async def _close_stale_session(self) -> None:
+        """이전 이벤트 루프에서 만든 세션을 닫습니다. (close()를 호출하지 않고 루프가 바뀐 경우)"""
+        session, old_loop = self._session, self._loop
+        self._session = None
+        if session is None or session.closed:
+            return
+        if old_loop is None or old_loop.is_closed():
+            # 닫힌 루프의 커넥터는 기다릴 작업 없이 바로 정리됩니다.
+            await session.close()
+        else:
+            old_loop.call_soon_threadsafe(lambda: old_loop.create_task(session.close()))
+
+    def headers_for(self, source: Optional[str]) -> Dict[str, str]:
+        """소스별 기본 요청 헤더를 반환합니다."""
+        return dict(self.sources.get(source, {}).get("headers", {}))
+
+    def timeout_for(self, source: Optional[str]) -> aiohttp.ClientTimeout:
+        """소스별 요청 타임아웃을 반환합니다."""
+        return aiohttp.ClientTimeout(total=self.sources.get(source, {}).get("timeout", self.default_timeout))
+
+    async def close(self) -> None:
+        """세션과 커넥션 풀을 닫습니다. 각 실행(asyncio.run)이 끝날 때 호출합니다."""
+        if self._session is not None and not self._session.closed:
+            try:
+                await self._session.close()
+            except Exception as e:
+                logger.warning(f"HTTP 세션 종료 중 오류: {e}")
+        self._session = None
+        self._loop = None
+
+    async def __aenter__(self) -> "HttpClientManager":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+
+_shared_client: Optional[HttpClientManager] = None
+
+
+def get_http_client(config: Dict[str, Any]) -> HttpClientManager:
+    """
+    프로세스 전역에서 공유하는 HttpClientManager를 반환합니다.
+    HTTP_REPLAY_CONFIG["mode"]가 "record" 또는 "replay"면 녹화/재생 클라이언트를 사용합니다.
+    """
+    global _shared_client
+    if _shared_client is None:
+        replay_config = config.get("HTTP_REPLAY_CONFIG", {})
+        if replay_config.get("mode"):
+            from scrapper.replay import ReplayHttpClient
+            _shared_client = ReplayHttpClient(config, replay_config["mode"], replay_config["cassette"])
+        else:
+            _shared_client = HttpClientManager(config)
+    return _shared_client
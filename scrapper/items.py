@@ -0,0 +1,138 @@
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+import orjson
+
+# 소스마다 달랐던 키를 하나의 스키마 필드로 모읍니다.
+_ALIASES = {"link": "url", "name": "title", "stars": "score"}
+
+
+class CollectedItem:
+    """
+    모든 소스의 수집 항목을 하나의 스키마로 담는 레코드입니다.
+    - __slots__를 사용하므로 항목마다 dict를 두지 않아 아카이브 규모에서 메모리가 줄어듭니다.
+    - title/url/score는 소스별 name/link/stars를 정규화한 값이며, 각 단계는 키를 더듬지 않고 속성으로 읽습니다.
+    - 스키마에 없는 값은 extra에 보관합니다.
+    - 아직 dict를 기대하는 코드(플러그인, 테스트 등)를 위해 읽기 전용 get()/[]를 제공하며, 예전 키 이름도 받습니다.
+    """
+
+    __slots__ = (
+        "title", "url", "score", "source", "category", "description", "language",
+        "published_at", "collected_at", "sources", "merged_score", "duplicate_count", "extra",
+    )
+
+    def __init__(self, title: str = "", url: str = "", score: float = 0, source: str = "", category: str = "",
+                 description: str = "", language: str = "", published_at: Optional[float] = None,
+                 collected_at: Optional[float] = None, sources: Optional[List[str]] = None,
+                 merged_score: Optional[float] = None, duplicate_count: int = 0,
+                 extra: Optional[Dict[str, Any]] = None):
+        self.title = title
+        self.url = url
+        self.score = score
+        self.source = source
+        self.category = category
+        self.description = description
+        self.language = language
+        self.published_at = published_at
+        self.collected_at = time.time() if collected_at is None else collected_at
+        self.sources = sources
+        self.merged_score = merged_score
+        self.duplicate_count = duplicate_count
+        self.extra = extra
+
+    @classmethod
+    def from_dict(cls, raw: Dict[str, Any], default_source: str = "") -> "CollectedItem":
+        """소스별 dict(link/name/stars 등)를 정규화된 항목으로 변환합니다."""
+        fields: Dict[str, Any] = {}
+        extra: Dict[str, Any] = {}
+        for key, value in raw.items():
+            field = _ALIASES.get(key, key)
+            if field in cls.__slots__ and field != "extra":
+                # url과 link가 모두 있으면 url을 우선합니다.
+                if field not in fields or key == field:
+                    fields[field] = value
+            else:
+                extra[key] = value
+        fields.setdefault("source", default_source)
+        for field in ("title", "url", "source", "category", "description", "language"):
+            if fields.get(field) is None:
+                fields[field] = ""
+        fields["score"] = fields.get("score") or 0
+        fields["duplicate_count"] = fields.get("duplicate_count") or 0
+        return cls(**fields, extra=extra or None)
+
+    @classmethod
+    def coerce(cls, item: Any, default_source: str = "") -> "CollectedItem":
+        return item if isinstance(item, cls) else cls.from_dict(item, default_source)
+
+    @property
+    def signal(self) -> float:
+        """순위화에 쓰는 인기도 (중복 병합 점수가 있으면 그 값)"""
+        return float(self.score if self.merged_score is None else self.merged_score)
+
+    def replace(self, **changes: Any) -> "CollectedItem":
+        """일부 필드만 바꾼 복사본을 반환합니다."""
+        values = {field: getattr(self, field) for field in self.__slots__}
+        values.update(changes)
+        return CollectedItem(**values)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """직렬화용 dict. 비어 있는 선택 필드는 생략합니다."""
+        data = {"title": self.title, "url": self.url, "score": self.score, "source": self.source,
+                "category": self.category, "collected_at": self.collected_at}
+        for field in ("description", "language", "published_at", "sources", "merged_score"):
+            value = getattr(self, field)
+            if value:
+                data[field] = value
+        if self.duplicate_count:
+            data["duplicate_count"] = self.duplicate_count
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    def get(self, key: str, default: Any = None) -> Any:
+        field = _ALIASES.get(key, key)
+        if field in self.__slots__ and field != "extra":
+            value = getattr(self, field)
+            return default if value is None else value
+        return (self.extra or {}).get(key, default)
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, CollectedItem):
+            return NotImplemented
+        return all(getattr(self, field) == getattr(other, field) for field in self.__slots__ if field != "collected_at")
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"CollectedItem(title={self.title!r}, url={self.url!r}, source={self.source!r}, score={self.score!r})"
+
+
+_MISSING = object()
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, CollectedItem):
+        return value.to_dict()
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    return str(value)
+
+
+def dumps(value: Any) -> bytes:
+    """CollectedItem이 섞인 값을 orjson으로 직렬화합니다. (체크포인트/캐시용)"""
+    return orjson.dumps(value, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+def loads(data: bytes) -> Any:
+    return orjson.loads(data)
+
+
+def items_from_dicts(items: Iterable[Dict[str, Any]], default_source: str = "") -> List[CollectedItem]:
+    return [CollectedItem.coerce(item, default_source) for item in items]
@@ -0,0 +1,193 @@
+import asyncio
+import time
+from collections import deque
+from datetime import date
+from typing import Any, Container, Deque, Dict, List, Optional
+
+import aiohttp
+
+from scrapper.http_client import HttpClientManager
+from scrapper.llm_clients import GeminiClient, LLMClient, LLMError
+from scrapper.utils.logger import logger
+
+_RPM_WINDOW = 60.0
+
+
+def _is_transport_error(error: LLMError) -> bool:
+    """응답을 받지 못한 실패(시간 초과, 연결 오류)인지 확인합니다."""
+    return isinstance(error.__cause__, (asyncio.TimeoutError, aiohttp.ClientError))
+
+
+class _KeyState:
+    def __init__(self, name: str, client: GeminiClient):
+        self.name = name
+        self.client = client
+        self.recent: Deque[float] = deque()  # 최근 1분간 요청 시작 시각
+        self.in_flight = 0
+        self.requests = 0
+        self.rate_limited = 0
+        self.cooldown_until = 0.0
+        self.usage_today = 0  # quota_manager가 없을 때만 사용
+        self.usage_date = date.today()
+
+
+class GeminiKeyPool(LLMClient):
+    """
+    API_KEYS의 Gemini 키 여러 개를 하나의 클라이언트처럼 쓰는 키 풀입니다.
+    - 요청마다 남은 분당(RPM)/일일(RPD) 여유가 가장 큰 키로 보냅니다. 진행 중인 요청도 사용량으로 셉니다.
+    - 일일 사용량은 AIQuotaManager의 usage_today/limit을 함께 쓰고, 성공한 요청은 update_usage로 기록합니다.
+      사용량은 날짜가 바뀌면 0으로 되돌아가므로, 오래 도는 스케줄러 프로세스에서도 키가 소진된 채 남지 않습니다.
+    - 429를 받은 키는 cooldown_seconds 동안 쉬게 하고 다른 키로 다시 보냅니다. 모든 키가 쉬는 중이면
+      max_wait_seconds까지 기다리며, 모든 키의 일일 한도가 소진된 경우에만 LLMError(429)를 냅니다.
+    - 시간 초과나 연결 오류가 난 키는 이번 요청에서 빼고 다른 키로 다시 보냅니다. 모든 키가 실패하면 마지막 오류를 냅니다.
+    """
+
+    provider = "gemini"
+
+    def __init__(self, keys: Dict[str, str], model: str, http_client: HttpClientManager,
+                 quota_manager: Optional[Any] = None, rpm_limit: int = 15, daily_limit: int = 1500,
+                 cooldown_seconds: float = 60, max_wait_seconds: float = 120):
+        super().__init__(model)
+        self.keys = {name: _KeyState(name, GeminiClient(key, model, http_client)) for name, key in keys.items() if key}
+        if not self.keys:
+            raise ValueError("키 풀에 사용할 Gemini API 키가 없습니다.")
+        self.quota_manager = quota_manager
+        self.rpm_limit = rpm_limit
+        self.daily_limit = daily_limit
+        self.cooldown_seconds = cooldown_seconds
+        self.max_wait_seconds = max_wait_seconds
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], model: str, http_client: HttpClientManager,
+                    quota_manager: Optional[Any] = None) -> Optional["GeminiKeyPool"]:
+        """KEY_POOL_CONFIG가 꺼져 있거나 사용할 키가 없으면 None을 반환합니다. (에이전트별 키를 그대로 사용)"""
+        pool_config = config.get("KEY_POOL_CONFIG", {})
+        keys = {name: key for name, key in config.get("API_KEYS", {}).items() if key}
+        if not pool_config.get("enabled") or not keys:
+            return None
+        return cls(
+            keys, model, http_client, quota_manager=quota_manager,
+            rpm_limit=pool_config.get("rpm_limit", 15),
+            daily_limit=pool_config.get("daily_limit", 1500),
+            cooldown_seconds=pool_config.get("cooldown_seconds", 60),
+            max_wait_seconds=pool_config.get("max_wait_seconds", 120),
+        )
+
+    async def generate(self, prompt: str, generation_config: Optional[Dict[str, Any]] = None) -> str:
+        deadline = time.monotonic() + self.max_wait_seconds
+        failed: Dict[str, LLMError] = {}  # 이번 요청에서 전송 오류가 난 키
+        while True:
+            state = self._acquire(exclude=failed)
+            if state is None:
+                if failed and all(name in failed or not self._is_valid(key) for name, key in self.keys.items()):
+                    raise list(failed.values())[-1]
+                await self._wait_for_headroom(deadline)
+                continue
+            try:
+                text = await state.client.generate(prompt, generation_config)
+            except LLMError as e:
+                if e.status == 429:
+                    state.rate_limited += 1
+                    state.cooldown_until = time.monotonic() + self.cooldown_seconds
+                    logger.warning(f"🔁 Gemini 키 '{state.name}' 한도 초과(429), 다른 키로 재시도합니다.")
+                    continue
+                if _is_transport_error(e):
+                    failed[state.name] = e
+                    logger.warning(f"🔁 Gemini 키 '{state.name}' 요청 실패({e}), 다른 키로 재시도합니다.")
+                    continue
+                raise
+            finally:
+                state.in_flight -= 1
+            self._record_usage(state)
+            return text
+
+    def _acquire(self, exclude: Container[str] = ()) -> Optional[_KeyState]:
+        """여유가 가장 큰 키를 골라 진행 중으로 표시합니다. 지금 보낼 수 있는 키가 없으면 None입니다."""
+        now = time.monotonic()
+        best, best_headroom = None, 0.0
+        for state in self.keys.values():
+            if state.name in exclude:
+                continue
+            headroom = self._headroom(state, now)
+            if headroom > best_headroom:
+                best, best_headroom = state, headroom
+        if best is not None:
+            best.recent.append(now)
+            best.in_flight += 1
+            best.requests += 1
+        return best
+
+    def _headroom(self, state: _KeyState, now: float) -> float:
+        """남은 분당/일일 한도 비율 중 작은 값 (0이면 지금 사용할 수 없음)"""
+        if now < state.cooldown_until or not self._is_valid(state):
+            return 0.0
+        while state.recent and now - state.recent[0] >= _RPM_WINDOW:
+            state.recent.popleft()
+        used_today, limit = self._daily_usage(state)
+        # recent에는 진행 중인 요청도 포함되어 있고, 일일 사용량은 성공 후에 기록되므로 진행 중인 요청을 더합니다.
+        rpm_left = (self.rpm_limit - len(state.recent)) / self.rpm_limit
+        daily_left = (limit - used_today - state.in_flight) / limit if limit else 0.0
+        return max(min(rpm_left, daily_left), 0.0)
+
+    async def _wait_for_headroom(self, deadline: float) -> None:
+        now = time.monotonic()
+        if all(self._daily_usage(state)[0] >= self._daily_usage(state)[1] or not self._is_valid(state)
+               for state in self.keys.values()):
+            raise LLMError(self.provider, "모든 Gemini 키의 일일 한도가 소진되었습니다.", 429)
+        wake_times = [state.cooldown_until for state in self.keys.values() if state.cooldown_until > now]
+        wake_times += [state.recent[0] + _RPM_WINDOW for state in self.keys.values() if state.recent]
+        wake_at = min(wake_times, default=now + 1.0)
+        if wake_at > deadline:
+            raise LLMError(self.provider, f"{self.max_wait_seconds}초 동안 사용 가능한 Gemini 키가 없었습니다.", 429)
+        await asyncio.sleep(max(wake_at - now, 0.01))
+
+    def _quota_status(self, state: _KeyState) -> Optional[Dict[str, Any]]:
+        if self.quota_manager is None:
+            return None
+        return self.quota_manager.quota_status.get("gemini", {}).get(state.name)
+
+    def _is_valid(self, state: _KeyState) -> bool:
+        """한도 확인에서 무효로 판정된 키는 제외합니다. (아직 확인하지 않은 키는 사용)"""
+        status = self._quota_status(state)
+        return not (status and status.get("last_checked") and not status.get("api_key_valid"))
+
+    def _daily_usage(self, state: _KeyState):
+        if self._quota_status(state) is not None:
+            return self.quota_manager.get_gemini_usage(state.name)
+        if state.usage_date != date.today():
+            state.usage_today, state.usage_date = 0, date.today()
+        return state.usage_today, self.daily_limit
+
+    def _record_usage(self, state: _KeyState) -> None:
+        if self._quota_status(state) is not None:
+            self.quota_manager.update_usage("gemini", state.name)
+        else:
+            self._daily_usage(state)
+            state.usage_today += 1
+
+    def report(self) -> List[Dict[str, Any]]:
+        """키별 요청 수, 429 횟수, 현재 분당 사용량, 일일 사용률을 반환합니다."""
+        now = time.monotonic()
+        rows = []
+        for state in self.keys.values():
+            self._headroom(state, now)  # 분당 창 정리
+            used_today, limit = self._daily_usage(state)
+            rows.append({
+                "key": state.name,
+                "requests": state.requests,
+                "rate_limited": state.rate_limited,
+                "rpm_used": len(state.recent),
+                "rpm_limit": self.rpm_limit,
+                "usage_today": used_today,
+                "daily_limit": limit,
+                "utilization": round(used_today / limit, 3) if limit else 1.0,
+            })
+        return rows
+
+    def log_report(self) -> None:
+        for row in self.report():
+            logger.info(
+                f"🔑 Gemini 키 {row['key']}: 요청 {row['requests']}회 (429 {row['rate_limited']}회), "
+                f"분당 {row['rpm_used']}/{row['rpm_limit']}, 오늘 {row['usage_today']}/{row['daily_limit']} "
+                f"({row['utilization']:.0%})"
+            )
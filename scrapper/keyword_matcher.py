@@ -0,0 +1,110 @@
+from collections import deque
+from typing import Dict, Iterable, List, NamedTuple, Set, Tuple
+
+
+class ContentMatch(NamedTuple):
+    """한 번의 스캔으로 얻은 관련성 판정, 매칭 키워드, 카테고리"""
+    relevant: bool
+    matched_keywords: Set[str]
+    category: str
+
+
+def _is_word_char(char: str) -> bool:
+    """단어 경계 판정에 쓰는 영숫자 문자인지 확인합니다. 한글은 조사가 붙으므로 경계로 보지 않습니다."""
+    return char.isascii() and char.isalnum()
+
+
+class KeywordMatcher:
+    """
+    Aho-Corasick 오토마톤 기반의 다중 키워드 매처입니다.
+    - 포함/제외/카테고리 키워드를 하나의 오토마톤으로 컴파일해 텍스트를 한 번만 훑습니다.
+    - 포함/카테고리 키워드는 영숫자 단어 경계를 확인하므로 "ai"가 "email"에 매칭되지 않습니다.
+    - 제외 키워드는 기존처럼 부분 문자열로 매칭합니다. (예: "crypto"는 "cryptocurrency"도 제외)
+    - 영어 복수형(끝의 "s")은 같은 단어로 취급합니다. (예: "llms" → "llm")
+    """
+
+    DEFAULT_CATEGORY = "General Web Development"
+
+    def __init__(self, must_have_any: Iterable[str], exclude: Iterable[str] = (),
+                 categories: Dict[str, List[str]] = None):
+        self.categories = categories or {}
+        self._category_order = {name: i for i, name in enumerate(self.categories)}
+        # 노드별 전이(goto), 실패 링크, 출력(키워드, 역할) 목록
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[Tuple[str, str]]] = [[]]
+
+        for word in must_have_any:
+            self._add(word, "include")
+        for word in exclude:
+            self._add(word, "exclude")
+        for category, words in self.categories.items():
+            for word in words:
+                self._add(word, category)
+        self._build_failure_links()
+
+    def _add(self, keyword: str, role: str) -> None:
+        keyword = keyword.lower().strip()
+        if not keyword:
+            return
+        node = 0
+        for char in keyword:
+            if char not in self._goto[node]:
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._goto[node][char] = len(self._goto) - 1
+            node = self._goto[node][char]
+        self._output[node].append((keyword, role))
+
+    def _build_failure_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0)
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+    def _iter_matches(self, text: str) -> Iterable[Tuple[str, str]]:
+        """(키워드, 역할) 매칭을 순서대로 반환합니다. 제외 키워드가 아니면 단어 경계를 만족해야 합니다."""
+        node = 0
+        length = len(text)
+        for end, char in enumerate(text):
+            while node and char not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(char, 0)
+            for keyword, role in self._output[node]:
+                if role == "exclude":
+                    yield keyword, role
+                    continue
+                start = end - len(keyword) + 1
+                if _is_word_char(keyword[0]) and start > 0 and _is_word_char(text[start - 1]):
+                    continue
+                if _is_word_char(keyword[-1]) and end + 1 < length and _is_word_char(text[end + 1]):
+                    # 복수형 "s" 한 글자까지만 허용합니다.
+                    plural_end = end + 2
+                    if text[end + 1] != "s" or (plural_end < length and _is_word_char(text[plural_end])):
+                        continue
+                yield keyword, role
+
+    def scan(self, text: str) -> ContentMatch:
+        """텍스트를 한 번 스캔하여 관련성, 매칭된 포함 키워드, 카테고리를 함께 반환합니다."""
+        matched: Set[str] = set()
+        excluded = False
+        best_category = None
+        for keyword, role in self._iter_matches(text.lower()):
+            if role == "include":
+                matched.add(keyword)
+            elif role == "exclude":
+                excluded = True
+            elif best_category is None or self._category_order[role] < self._category_order[best_category]:
+                best_category = role
+        return ContentMatch(
+            relevant=bool(matched) and not excluded,
+            matched_keywords=matched,
+            category=best_category or self.DEFAULT_CATEGORY,
+        )
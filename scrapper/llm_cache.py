@@ -0,0 +1,145 @@
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from scrapper.utils.logger import logger
+
+
+def normalize_prompt(prompt: str) -> str:
+    """들여쓰기와 연속 공백, 빈 줄 차이만 있는 프롬프트가 같은 키가 되도록 정규화합니다."""
+    lines = (re.sub(r"[ \t]+", " ", line).strip() for line in prompt.strip().splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+def make_cache_key(provider: str, model: str, prompt: str, generation_config: Optional[Dict[str, Any]] = None) -> str:
+    """(제공자, 모델, 생성 설정, 정규화된 프롬프트)의 SHA-256 해시를 캐시 키로 사용합니다."""
+    payload = json.dumps(
+        {"provider": provider, "model": model, "config": generation_config or {}, "prompt": normalize_prompt(prompt)},
+        sort_keys=True, ensure_ascii=False, default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMCache:
+    """
+    모든 에이전트가 함께 쓰는 내용 기반(content-addressed) LLM 응답 캐시입니다. (SQLite)
+    - ttl이 지난 응답은 사용하지 않고, 항목 수가 max_entries를 넘으면 가장 오래 사용되지 않은 것부터 지웁니다.
+    - bypass가 켜져 있으면 캐시를 읽지 않고 항상 새로 생성하되, 결과는 저장하여 캐시를 갱신합니다.
+    - 적중/실패/저장/제거 횟수를 stats에 기록합니다.
+    """
+
+    def __init__(self, db_path: str, ttl_seconds: float = 7 * 86400, max_entries: int = 2000, bypass: bool = False):
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.bypass = bypass
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0, "writes": 0, "evictions": 0}
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> Optional["LLMCache"]:
+        """LLM_CACHE_CONFIG 설정으로 캐시를 생성합니다. 비활성화 상태면 None을 반환합니다."""
+        cache_config = config.get("LLM_CACHE_CONFIG", {})
+        if not cache_config.get("enabled"):
+            return None
+        bypass_env = os.getenv("LLM_CACHE_BYPASS", "").lower() in ("1", "true", "yes")
+        return cls(
+            db_path=cache_config.get("db_path") or os.path.join(config.get("OUTPUT_DIR", "outputs"), "llm_cache.sqlite3"),
+            ttl_seconds=cache_config.get("ttl_hours", 168) * 3600,
+            max_entries=cache_config.get("max_entries", 2000),
+            bypass=cache_config.get("bypass", False) or bypass_env,
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " key TEXT PRIMARY KEY,"
+                " provider TEXT NOT NULL,"
+                " model TEXT NOT NULL,"
+                " response TEXT NOT NULL,"
+                " created_at REAL NOT NULL,"
+                " last_access REAL NOT NULL)"
+            )
+        return self._conn
+
+    def get(self, provider: str, model: str, prompt: str, generation_config: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        """만료되지 않은 캐시 응답을 반환합니다. 없거나 bypass 상태면 None을 반환합니다."""
+        if self.bypass:
+            self.stats["misses"] += 1
+            return None
+        key = make_cache_key(provider, model, prompt, generation_config)
+        conn = self._connect()
+        row = conn.execute("SELECT response, created_at FROM responses WHERE key = ?", (key,)).fetchone()
+        now = time.time()
+        if row is None or now - row[1] > self.ttl_seconds:
+            self.stats["misses"] += 1
+            return None
+        conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+        conn.commit()
+        self.stats["hits"] += 1
+        return row[0]
+
+    def put(self, provider: str, model: str, prompt: str, response: str, generation_config: Optional[Dict[str, Any]] = None) -> None:
+        """응답을 저장하고, 항목 수 상한을 넘으면 오래 사용되지 않은 항목을 지웁니다."""
+        now = time.time()
+        conn = self._connect()
+        conn.execute(
+            "INSERT OR REPLACE INTO responses (key, provider, model, response, created_at, last_access) VALUES (?, ?, ?, ?, ?, ?)",
+            (make_cache_key(provider, model, prompt, generation_config), provider, model, response, now, now),
+        )
+        self.stats["writes"] += 1
+        overflow = conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0] - self.max_entries
+        if overflow > 0:
+            conn.execute(
+                "DELETE FROM responses WHERE key IN (SELECT key FROM responses ORDER BY last_access ASC LIMIT ?)", (overflow,)
+            )
+            self.stats["evictions"] += overflow
+        conn.commit()
+
+    async def get_or_generate(self, provider: str, model: str, prompt: str, generate: Callable[[], Awaitable[str]],
+                              generation_config: Optional[Dict[str, Any]] = None,
+                              validate: Optional[Callable[[str], bool]] = None) -> str:
+        """
+        캐시된 응답이 있으면 반환하고, 없으면 generate()로 만들어 저장합니다.
+        validate를 주면 검사를 통과한 응답만 저장합니다. (예: JSON 파싱 가능 여부)
+        """
+        cached = self.get(provider, model, prompt, generation_config)
+        if cached is not None:
+            return cached
+        response = await generate()
+        if response and (validate is None or validate(response)):
+            self.put(provider, model, prompt, response, generation_config)
+        return response
+
+    def log_stats(self) -> None:
+        lookups = self.stats["hits"] + self.stats["misses"]
+        hit_rate = self.stats["hits"] / lookups * 100 if lookups else 0.0
+        logger.info(
+            f"🗃️ LLM 캐시: 적중 {self.stats['hits']}회, 실패 {self.stats['misses']}회 (적중률 {hit_rate:.0f}%), "
+            f"저장 {self.stats['writes']}회, 제거 {self.stats['evictions']}회"
+        )
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+_shared_cache: Optional[LLMCache] = None
+_shared_cache_loaded = False
+
+
+def get_llm_cache(config: Dict[str, Any]) -> Optional[LLMCache]:
+    """모든 에이전트가 함께 쓰는 프로세스 전역 LLMCache를 반환합니다. 비활성화 상태면 None입니다."""
+    global _shared_cache, _shared_cache_loaded
+    if not _shared_cache_loaded:
+        _shared_cache = LLMCache.from_config(config)
+        _shared_cache_loaded = True
+    return _shared_cache
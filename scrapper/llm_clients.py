@@ -0,0 +1,160 @@
+import asyncio
+from typing import Any, Dict, Optional
+
+import aiohttp
+from anthropic import AsyncAnthropic
+
+from scrapper.http_client import HttpClientManager
+
+GEMINI_API_URL = "https://generativelanguage.googleapis.com/v1beta"
+
+
+class LLMError(Exception):
+    """LLM 제공자 호출 실패. status는 HTTP 상태 코드(알 수 없으면 None)입니다."""
+
+    def __init__(self, provider: str, message: str, status: Optional[int] = None):
+        super().__init__(f"{provider} 호출 실패 ({status}): {message}" if status else f"{provider} 호출 실패: {message}")
+        self.provider = provider
+        self.status = status
+
+
+class LLMClient:
+    """
+    키, 모델, 전송 수단을 인스턴스마다 묶어 두는 LLM 클라이언트의 기본 클래스입니다.
+    전역 설정(genai.configure 등)을 건드리지 않으므로, 서로 다른 키를 쓰는 클라이언트를 여러 코루틴에서 동시에 써도 안전합니다.
+    """
+
+    provider: str = ""
+
+    def __init__(self, model: str):
+        self.model = model
+
+    async def generate(self, prompt: str, generation_config: Optional[Dict[str, Any]] = None) -> str:
+        raise NotImplementedError
+
+
+def _camel_case(key: str) -> str:
+    head, *rest = key.split("_")
+    return head + "".join(part.title() for part in rest)
+
+
+class GeminiClient(LLMClient):
+    """
+    Gemini REST API(generateContent)를 공유 HTTP 세션으로 호출합니다.
+    - API 키는 요청 헤더(x-goog-api-key)로만 전달하므로 클라이언트끼리 서로 영향을 주지 않습니다.
+    - generation_config는 SDK와 같은 snake_case 키(response_mime_type 등)를 받습니다.
+    - 생성 요청에는 한도 확인용 "gemini"보다 긴 "gemini_generate" 타임아웃을 쓰고, 시간 초과나 연결 오류는
+      LLMError(status=None)로 감싸서 키 풀이 다른 키로 다시 보낼 수 있게 합니다.
+    """
+
+    provider = "gemini"
+
+    def __init__(self, api_key: str, model: str, http_client: HttpClientManager, base_url: str = GEMINI_API_URL):
+        super().__init__(model)
+        if not api_key:
+            raise ValueError("Gemini API 키가 없습니다.")
+        self.api_key = api_key
+        self.http_client = http_client
+        self.base_url = base_url
+
+    async def generate(self, prompt: str, generation_config: Optional[Dict[str, Any]] = None) -> str:
+        body: Dict[str, Any] = {"contents": [{"role": "user", "parts": [{"text": prompt}]}]}
+        if generation_config:
+            body["generationConfig"] = {_camel_case(key): value for key, value in generation_config.items()}
+
+        session = await self.http_client.get_session()
+        try:
+            async with session.post(
+                f"{self.base_url}/models/{self.model}:generateContent",
+                json=body,
+                headers={**self.http_client.headers_for("gemini"), "x-goog-api-key": self.api_key},
+                timeout=self.http_client.timeout_for("gemini_generate"),
+            ) as response:
+                try:
+                    data = await response.json(content_type=None)
+                except ValueError:
+                    data = {}
+                if response.status != 200:
+                    message = (data.get("error") or {}).get("message", "") if isinstance(data, dict) else ""
+                    raise LLMError(self.provider, message or response.reason or "", response.status)
+        except asyncio.TimeoutError as e:
+            raise LLMError(self.provider, "응답 시간 초과") from e
+        except aiohttp.ClientError as e:
+            raise LLMError(self.provider, str(e) or type(e).__name__) from e
+
+        candidates = data.get("candidates") or []
+        if not candidates:
+            reason = (data.get("promptFeedback") or {}).get("blockReason", "응답 후보 없음")
+            raise LLMError(self.provider, reason)
+        parts = (candidates[0].get("content") or {}).get("parts") or []
+        return "".join(part.get("text", "") for part in parts)
+
+
+class ClaudeClient(LLMClient):
+    """인스턴스마다 자체 AsyncAnthropic 클라이언트를 갖는 Claude 클라이언트입니다."""
+
+    provider = "claude"
+
+    def __init__(self, api_key: str, model: str, max_tokens: int = 1000):
+        super().__init__(model)
+        self.max_tokens = max_tokens
+        self.client = AsyncAnthropic(api_key=api_key)
+
+    async def generate(self, prompt: str, generation_config: Optional[Dict[str, Any]] = None) -> str:
+        options = {"max_tokens": self.max_tokens, **(generation_config or {})}
+        try:
+            message = await self.client.messages.create(
+                model=self.model, messages=[{"role": "user", "content": prompt}], **options
+            )
+        except Exception as e:
+            raise LLMError(self.provider, str(e), getattr(e, "status_code", None)) from e
+        return message.content[0].text
+
+
+class HuggingFaceClient(LLMClient):
+    """
+    로컬 transformers 파이프라인 하나를 감쌉니다.
+    - 추론은 이벤트 루프를 막지 않도록 스레드 풀에서 실행합니다.
+    - 같은 파이프라인을 동시에 호출하지 않도록 인스턴스별 잠금을 둡니다.
+    """
+
+    provider = "huggingface"
+
+    def __init__(self, task: str, model: str, device: int = -1):
+        super().__init__(model)
+        self.task = task
+        self.device = device
+        self.pipeline = None
+        # 클라이언트는 실행(asyncio.run)마다 재사용되므로 잠금은 이벤트 루프별로 만듭니다.
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock: Optional[asyncio.Lock] = None
+
+    @property
+    def loaded(self) -> bool:
+        return self.pipeline is not None
+
+    def load(self) -> None:
+        from transformers import pipeline
+
+        if self.pipeline is None:
+            self.pipeline = pipeline(self.task, model=self.model, device=self.device)
+
+    def unload(self) -> None:
+        """파이프라인 참조를 놓습니다. 다음 run()에서 다시 로드합니다."""
+        self.pipeline = None
+
+    def _get_lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    async def run(self, *args: Any, **kwargs: Any) -> Any:
+        """파이프라인을 실행하고 원본 출력을 반환합니다."""
+        async with self._get_lock():
+            loop = asyncio.get_running_loop()
+            if self.pipeline is None:
+                await loop.run_in_executor(None, self.load)
+            return await loop.run_in_executor(None, lambda: self.pipeline(*args, **kwargs))
+
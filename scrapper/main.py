@@ -2,10 +2,12 @@ import asyncio
 import schedule
 import time
 from datetime import datetime
+from typing import Optional
 
 from configs.config import CONFIG
 from scrapper.multi_agent_system import NewMultiAgentOrchestrator
 from scrapper.ai_quota_manager import AIQuotaManager
+from scrapper.http_client import get_http_client
 from scrapper.utils.logger import logger
 
 class WebDevTrendsAgent:
@@ -13,18 +15,23 @@ class WebDevTrendsAgent:
     
     def __init__(self):
         self.config = CONFIG
-        self.orchestrator = NewMultiAgentOrchestrator(self.config)
-        self.quota_manager = AIQuotaManager(self.config)
+        self.http_client = get_http_client(self.config)
+        self.quota_manager = AIQuotaManager(self.config, http_client=self.http_client)
+        self.orchestrator = NewMultiAgentOrchestrator(
+            self.config, http_client=self.http_client, quota_manager=self.quota_manager
+        )
         
-    async def run_analysis(self):
-        """데이터 분석 및 리포팅을 실행합니다."""
+    async def run_analysis(self, resume_run_id: Optional[str] = None):
+        """데이터 분석 및 리포팅을 실행합니다. resume_run_id를 주면 해당 실행의 체크포인트부터 재개합니다."""
         logger.info("="*60)
         logger.info("🚀 최신 FE 트렌드 분석 및 코드 리뷰 시작")
         logger.info(f"⏰ 시작 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         logger.info("="*60)
         
         try:
-            await self.orchestrator.run_weekly_analysis()
+            await self.orchestrator.run_weekly_analysis(resume_run_id=resume_run_id)
+            # 키 풀이 기록한 키별 일일 사용량을 저장합니다.
+            self.quota_manager.save_cached_quota()
             logger.info("="*60)
             logger.info("✅ 모든 에이전트 작업 완료!")
             logger.info("="*60)
@@ -32,6 +39,9 @@ class WebDevTrendsAgent:
         except Exception as e:
             logger.critical(f"❌ 메인 에이전트 실행 중 심각한 오류 발생: {e}", exc_info=True)
             return False
+        finally:
+            # 세션은 이번 이벤트 루프에 묶여 있으므로 실행이 끝나면 정리합니다.
+            await self.http_client.close()
 
     def setup_schedule(self):
         """설정에 따라 작업을 스케줄링합니다."""
@@ -62,7 +72,10 @@ class WebDevTrendsAgent:
 
     async def check_quotas(self):
         """API 서비스들의 현재 사용량 한도를 확인하고 출력합니다."""
-        await self.quota_manager.check_all_quotas()
+        try:
+            await self.quota_manager.check_all_quotas()
+        finally:
+            await self.http_client.close()
         summary = self.quota_manager.get_quota_summary()
         print("\n" + summary)
         input("\n계속하려면 엔터를 누르세요...")
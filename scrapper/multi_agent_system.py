@@ -4,12 +4,49 @@ import json
 import re
 from datetime import datetime
 from typing import List, Dict, Any, Optional
-import google.generativeai as genai
 
+from scrapper.agent_graph import AgentGraph, Stage
+from scrapper.ai_quota_manager import AIQuotaManager
+from scrapper.checkpoint import CheckpointStore
 from scrapper.collectors import DataCollector
+from scrapper.http_client import HttpClientManager, get_http_client
+from scrapper.key_pool import GeminiKeyPool
+from scrapper.items import CollectedItem, items_from_dicts
+from scrapper.dedup import cluster_near_duplicates
 from scrapper.email_reporter import EmailReporter
+from scrapper.llm_cache import LLMCache, get_llm_cache
+from scrapper.llm_clients import GeminiClient, LLMClient
+from scrapper.ranking import SelectionHistory, build_query_weights, rank_candidates
+from scrapper.seen_ledger import SeenLedger, canonicalize_url
+from scrapper.token_budget import chunk_lines, estimate_tokens
 from scrapper.utils.logger import logger
 
+GEMINI_MODEL = 'gemini-1.5-flash'
+JSON_OUTPUT = {"response_mime_type": "application/json"}
+
+
+def _is_json(text: str) -> bool:
+    try:
+        json.loads(text)
+        return True
+    except ValueError:
+        return False
+
+
+async def generate_text(client: LLMClient, prompt: str, llm_cache: Optional[LLMCache],
+                        generation_config: Optional[Dict] = None) -> str:
+    """
+    LLM 응답 텍스트를 반환합니다. 같은 (제공자, 모델, 생성 설정, 프롬프트)의 응답은 LLM 캐시에서 재사용합니다.
+    JSON 출력을 요청한 경우 파싱 가능한 응답만 캐시합니다.
+    """
+    if llm_cache is None:
+        return await client.generate(prompt, generation_config)
+    validate = _is_json if generation_config == JSON_OUTPUT else None
+    return await llm_cache.get_or_generate(
+        client.provider, client.model, prompt, lambda: client.generate(prompt, generation_config), generation_config, validate
+    )
+
+
 class AgentOutput:
     """에이전트 간의 데이터 전달을 위한 통합 데이터 객체"""
     def __init__(self, start_time: datetime):
@@ -18,35 +55,66 @@ class AgentOutput:
         self.intelligent_filtered_data: Optional[Dict] = None
         self.analysis_result: Optional[Dict] = None
         self.email_html: Optional[str] = None
+        self.email_sent: bool = False
+        self.filter_candidates: Optional[List[str]] = None  # LLM 필터 프롬프트에 올린 항목 URL
         self.code_review_report: Optional[str] = None
 
 class CollectorAgent:
     """Agent 1: 웹에서 정보를 수집하고, AI를 사용해 1차적으로 필터링합니다."""
-    def __init__(self, config: Dict):
+    def __init__(self, config: Dict, http_client: Optional[HttpClientManager] = None, llm: Optional[LLMClient] = None):
         self.config = config
-        self.collector = DataCollector(config)
+        self.collector = DataCollector(config, http_client=http_client)
+        self.prerank_config = config.get("PRERANK_CONFIG", {})
+        self.selection_history = SelectionHistory(
+            self.prerank_config.get("history_path") or os.path.join(config.get("OUTPUT_DIR", "outputs"), "selection_history.json"),
+            self.prerank_config.get("max_history", 500),
+        )
         self.gemini_key = config["API_KEYS"]["collector"]
-        if not self.gemini_key:
+        if llm is None and not self.gemini_key:
             raise ValueError("CollectorAgent의 Gemini API 키가 설정되지 않았습니다.")
-        genai.configure(api_key=self.gemini_key)
-        self.model = genai.GenerativeModel('gemini-1.5-flash')
+        # 키 풀(llm)이 없으면 에이전트 자신의 키를 묶은 클라이언트를 사용합니다. (전역 genai.configure를 쓰지 않음)
+        self.llm = llm or GeminiClient(self.gemini_key, GEMINI_MODEL, http_client or get_http_client(config))
+        self.llm_cache = get_llm_cache(config)
 
     async def run(self, output: AgentOutput):
-        logger.info("\n🤖 Agent 1 (Collector): 데이터 수집 및 지능형 필터링 시작...")
-        
-        # 1. 원시 데이터 수집
-        raw_data = await self.collector.collect_all()
-        output.raw_collected_data = raw_data
+        """수집과 필터링을 이어서 실행합니다. (오케스트레이터는 두 단계를 따로 실행하고 체크포인트합니다.)"""
+        await self.collect(output)
+        return await self.filter(output)
+
+    async def collect(self, output: AgentOutput):
+        """원시 데이터를 수집합니다. 먼저 끝난 소스부터 중복을 제거하고 점수순으로 정렬합니다."""
+        logger.info("\n🤖 Agent 1 (Collector): 데이터 수집 시작...")
+        raw_data: Dict[str, List[CollectedItem]] = {}
+        seen_urls: set = set()
+        async for source, items in self.collector.stream_all():
+            raw_data[source] = self._dedupe_and_rank(items, seen_urls)
+        output.raw_collected_data = dict(sorted(raw_data.items()))
+        return output
+
+    async def filter(self, output: AgentOutput):
+        """수집된 원시 데이터를 병합/사전 순위화한 뒤 AI로 필터링합니다."""
+        logger.info("\n🤖 Agent 1 (Collector): 지능형 필터링 시작...")
+        raw_data = output.raw_collected_data or {}
+
+        # 1. 소스 간 유사 중복 항목 병합 (프롬프트 크기 축소)
+        dedup_config = self.config.get("DEDUP_CONFIG", {})
+        candidates = raw_data
+        if dedup_config.get("enabled"):
+            candidates = cluster_near_duplicates(raw_data, dedup_config.get("max_hamming_distance", 3))
+
+        # 2. 로컬 BM25 사전 순위화 (상위 top_k개만 LLM에 전달)
+        if self.prerank_config.get("enabled"):
+            candidates = self._prerank(candidates)
         
-        # 2. AI를 이용한 지능형 필터링
-        prompt = self._create_filter_prompt(raw_data)
+        # 3. AI를 이용한 지능형 필터링
+        prompt_items = self._prompt_items(candidates)
+        output.filter_candidates = [item.url for item in prompt_items if item.url]
+        prompt = self._create_filter_prompt(prompt_items)
         try:
-            response = await self.model.generate_content_async(
-                prompt,
-                generation_config=genai.types.GenerationConfig(response_mime_type="application/json")
-            )
-            filtered_data = json.loads(response.text)
+            response_text = await generate_text(self.llm, prompt, self.llm_cache, JSON_OUTPUT)
+            filtered_data = json.loads(response_text)
             output.intelligent_filtered_data = filtered_data
+            self.selection_history.add(item.get("title", "") for item in filtered_data.get("relevant_items", []))
             logger.info(f"✅ Agent 1 (Collector): {len(filtered_data.get('relevant_items', []))}개의 유의미한 정보 필터링 완료.")
         except Exception as e:
             logger.error(f"❌ Agent 1 (Collector): AI 필터링 중 오류 발생 - {e}", exc_info=True)
@@ -54,17 +122,54 @@ class CollectorAgent:
             
         return output
 
-    def _create_filter_prompt(self, data: Dict) -> str:
-        """AI 필터링을 위한 프롬프트를 생성합니다."""
-        content_lines = []
+    def _prerank(self, data: Dict) -> Dict:
+        """필터 키워드와 과거 선별 이력을 질의로 모든 후보를 BM25 점수화하여 상위 top_k개만 남깁니다."""
+        query_weights = build_query_weights(
+            self.config["FILTER_KEYWORDS"]["must_have_any"],
+            self.selection_history.titles,
+            self.prerank_config.get("history_weight", 0.5),
+        )
+        ranked = rank_candidates(
+            data,
+            query_weights,
+            top_k=self.prerank_config.get("top_k", 40),
+            max_per_source=self.prerank_config.get("max_per_source"),
+            signal_weight=self.prerank_config.get("signal_weight", 0.2),
+        )
+        before = sum(len(items) for items in data.values() if isinstance(items, list))
+        after = sum(len(items) for items in ranked.values() if isinstance(items, list))
+        logger.info(f"📊 사전 순위화: 후보 {before}개 → {after}개")
+        return ranked
+
+    @staticmethod
+    def _dedupe_and_rank(items: List[CollectedItem], seen_urls: set) -> List[CollectedItem]:
+        """이미 다른 소스에서 받은 URL을 제거하고, 점수 높은 순으로 정렬합니다."""
+        unique_items = []
+        for item in items:
+            url_key = canonicalize_url(item.url) if item.url else None
+            if url_key and url_key in seen_urls:
+                continue
+            if url_key:
+                seen_urls.add(url_key)
+            unique_items.append(item)
+        # 점수가 없는 항목(RSS 등)은 원래 순서를 유지합니다.
+        unique_items.sort(key=lambda x: x.score, reverse=True)
+        return unique_items
+
+    @staticmethod
+    def _prompt_items(data: Dict) -> List[CollectedItem]:
+        """필터 프롬프트에 올릴 항목 (각 소스별 상위 15개, 제목이 있는 항목만)"""
+        prompt_items = []
         for source, items in data.items():
             if isinstance(items, list):
-                for item in items[:15]: # 각 소스별 상위 15개만 고려
-                    title = item.get('title', item.get('name', ''))
-                    url = item.get('url', item.get('link', '#'))
-                    source_name = item.get('source', source)
-                    if title:
-                        content_lines.append(f"- {title} (출처: {source_name}, URL: {url})")
+                for item in items[:15]:
+                    if item.title:
+                        prompt_items.append(item if item.source else item.replace(source=source))
+        return prompt_items
+
+    def _create_filter_prompt(self, items: List[CollectedItem]) -> str:
+        """AI 필터링을 위한 프롬프트를 생성합니다."""
+        content_lines = [f"- {item.title} (출처: {item.source}, URL: {item.url or '#'})" for item in items]
         
         return f"""
         당신은 프론트엔드 기술 큐레이터입니다. 아래는 웹에서 수집된 최신 기술 아티클 및 포스트 목록입니다.
@@ -92,13 +197,19 @@ class CollectorAgent:
 
 class AnalyzerAgent:
     """Agent 2: 정제된 정보를 분석하고, 키워드를 제안/정리합니다."""
-    def __init__(self, config: Dict):
+    def __init__(self, config: Dict, http_client: Optional[HttpClientManager] = None, llm: Optional[LLMClient] = None):
         self.config = config
         self.gemini_key = config["API_KEYS"]["analyzer"]
-        if not self.gemini_key:
+        if llm is None and not self.gemini_key:
             raise ValueError("AnalyzerAgent의 Gemini API 키가 설정되지 않았습니다.")
-        genai.configure(api_key=self.gemini_key)
-        self.model = genai.GenerativeModel('gemini-1.5-flash')
+        self.llm = llm or GeminiClient(self.gemini_key, GEMINI_MODEL, http_client or get_http_client(config))
+        self.llm_cache = get_llm_cache(config)
+        budget_config = config.get("TOKEN_BUDGET_CONFIG", {})
+        self.max_prompt_tokens = budget_config.get("analyzer_max_prompt_tokens", 8000)
+        self.max_concurrency = budget_config.get("max_concurrency", 4)
+        # 에이전트는 실행(asyncio.run)마다 재사용되므로 세마포어는 이벤트 루프별로 만듭니다.
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
 
     async def run(self, output: AgentOutput):
         logger.info("\n🧠 Agent 2 (Analyzer): 심층 분석 및 키워드 정리 시작...")
@@ -108,15 +219,15 @@ class AnalyzerAgent:
             return output
 
         current_keywords = self.config["FILTER_KEYWORDS"]["must_have_any"]
-        # 프롬프트 생성 메서드를 호출합니다.
-        prompt = self._create_analysis_prompt(output.intelligent_filtered_data, current_keywords)
+        lines = [self._format_item(item) for item in output.intelligent_filtered_data.get('relevant_items', [])]
         
         try:
-            response = await self.model.generate_content_async(
-                prompt,
-                generation_config=genai.types.GenerationConfig(response_mime_type="application/json")
-            )
-            output.analysis_result = json.loads(response.text)
+            # 프롬프트가 토큰 예산 안이면 한 번에, 넘으면 아티클을 나눠 병렬 분석(map) 후 종합(reduce)합니다.
+            prompt = self._create_analysis_prompt("\n".join(lines), current_keywords)
+            if estimate_tokens(prompt) <= self.max_prompt_tokens:
+                output.analysis_result = await self._generate_json(prompt)
+            else:
+                output.analysis_result = await self._map_reduce(lines, current_keywords)
             logger.info("✅ Agent 2 (Analyzer): AI 심층 분석 및 키워드 정리 완료.")
         except Exception as e:
             logger.error(f"❌ Agent 2 (Analyzer): AI 분석 중 오류 발생 - {e}", exc_info=True)
@@ -124,9 +235,99 @@ class AnalyzerAgent:
 
         return output
 
-    def _create_analysis_prompt(self, data: Dict, current_keywords: List[str]) -> str:
+    def _concurrency_limit(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def _generate_json(self, prompt: str) -> Dict:
+        async with self._concurrency_limit():
+            response_text = await generate_text(self.llm, prompt, self.llm_cache, JSON_OUTPUT)
+        return json.loads(response_text)
+
+    async def _map_reduce(self, lines: List[str], current_keywords: List[str]) -> Dict:
+        """아티클 목록을 예산에 맞게 나눠 동시에 분석하고, 결과를 하나의 분석 결과로 합칩니다."""
+        overhead = estimate_tokens(self._create_analysis_prompt("", current_keywords))
+        chunks = chunk_lines(lines, self.max_prompt_tokens - overhead)
+        logger.info(f"  🧩 프롬프트가 예산({self.max_prompt_tokens} 토큰)을 넘어 {len(chunks)}개 묶음으로 나눠 분석합니다.")
+        partials = await asyncio.gather(
+            *(self._generate_json(self._create_analysis_prompt(chunk, current_keywords)) for chunk in chunks)
+        )
+
+        result: Dict[str, Any] = {
+            "detailed_articles": [],
+            "technical_report": {"new_html_tags": [], "notable_css_properties": [], "css_tricks": []},
+            "keyword_suggestions": {"suggested_keywords": [], "deprecated_keywords": []},
+        }
+        summaries = []
+        for partial in partials:
+            result["detailed_articles"].extend(partial.get("detailed_articles", []))
+            for section in ("technical_report", "keyword_suggestions"):
+                for field, values in (partial.get(section) or {}).items():
+                    merged = result[section].setdefault(field, [])
+                    merged.extend(value for value in values if value not in merged)
+            if partial.get("executive_summary"):
+                summaries.append(partial["executive_summary"])
+
+        result.update(await self._reduce(summaries, result["keyword_suggestions"], current_keywords))
+        return result
+
+    async def _reduce(self, summaries: List[str], keyword_candidates: Dict, current_keywords: List[str]) -> Dict:
+        """묶음별 요약을 종합 요약 하나로 합칩니다. 요약이 예산을 넘으면 묶어서 여러 단계로 합칩니다."""
+        overhead = estimate_tokens(self._create_reduce_prompt("", keyword_candidates, current_keywords))
+        budget = self.max_prompt_tokens - overhead
+        while len(summaries) > 1 and estimate_tokens("\n\n".join(summaries)) > budget:
+            groups = chunk_lines(summaries, budget)
+            if len(groups) >= len(summaries):
+                break
+            partials = await asyncio.gather(
+                *(self._generate_json(self._create_reduce_prompt(group, {}, current_keywords)) for group in groups)
+            )
+            summaries = [partial.get("executive_summary", "") for partial in partials]
+        reduced = await self._generate_json(
+            self._create_reduce_prompt("\n\n".join(summaries), keyword_candidates, current_keywords)
+        )
+        result = {"executive_summary": reduced.get("executive_summary", "")}
+        if reduced.get("keyword_suggestions"):
+            result["keyword_suggestions"] = reduced["keyword_suggestions"]
+        return result
+
+    @staticmethod
+    def _format_item(item: Dict) -> str:
+        return f"- {item['title']} (URL: {item['url']}, 출처: {item['source']})"
+
+    def _create_reduce_prompt(self, summaries: str, keyword_candidates: Dict, current_keywords: List[str]) -> str:
+        """묶음별 분석 요약을 종합 요약과 최종 키워드 제안으로 합치는 프롬프트"""
+        return f"""
+        당신은 20년차 시니어 프론트엔드 개발자이자 기술 트렌드 분석가입니다.
+        이번 주 기술 자료를 여러 묶음으로 나눠 분석한 요약들입니다.
+
+        **묶음별 요약:**
+        ---
+        {summaries}
+        ---
+
+        **현재 키워드:** {", ".join(current_keywords)}
+        **묶음별 키워드 제안:** {json.dumps(keyword_candidates, ensure_ascii=False)}
+
+        **요청 사항 (반드시 JSON 형식으로 출력):**
+        1.  묶음별 요약의 구체적인 기술 이름과 그 중요성을 모두 살려 2~3 문단의 종합 요약(executive_summary)을 한국어로 작성해주세요.
+        2.  묶음별 키워드 제안이 있다면 중복과 모순을 정리하여 keyword_suggestions로 돌려주세요.
+
+        **출력 형식:**
+        {{
+          "executive_summary": "...",
+          "keyword_suggestions": {{
+            "suggested_keywords": [],
+            "deprecated_keywords": []
+          }}
+        }}
+        """
+
+    def _create_analysis_prompt(self, content: str, current_keywords: List[str]) -> str:
         """아티클 심층 분석 및 구체적인 종합 요약 생성을 위한 프롬프트"""
-        content = "\n".join([f"- {item['title']} (URL: {item['url']}, 출처: {item['source']})" for item in data.get('relevant_items', [])])
         keywords_str = ", ".join(current_keywords)
         
         return f"""
@@ -176,14 +377,15 @@ class AnalyzerAgent:
 
 class EmailerAgent:
     """Agent 3: 분석 리포트와 원본 데이터를 기반으로, 풍부한 HTML 이메일을 생성하고 발송합니다."""
-    def __init__(self, config: Dict):
+    def __init__(self, config: Dict, http_client: Optional[HttpClientManager] = None, llm: Optional[LLMClient] = None):
         self.config = config
         self.reporter = EmailReporter(config)
+        self.seen_ledger = SeenLedger.from_config(config)
         self.gemini_key = config["API_KEYS"]["emailer"]
-        if not self.gemini_key:
+        if llm is None and not self.gemini_key:
             raise ValueError("EmailerAgent의 Gemini API 키가 설정되지 않았습니다.")
-        genai.configure(api_key=self.gemini_key)
-        self.model = genai.GenerativeModel('gemini-1.5-flash')
+        self.llm = llm or GeminiClient(self.gemini_key, GEMINI_MODEL, http_client or get_http_client(config))
+        self.llm_cache = get_llm_cache(config)
 
     async def run(self, output: AgentOutput):
         """이메일 생성 및 발송 작업을 실행합니다."""
@@ -192,23 +394,37 @@ class EmailerAgent:
             logger.warning("⚠️ Agent 3 (Emailer): 분석 데이터 오류로 이메일 생성을 건너뜁니다.")
             return output
             
-        prompt = self._create_email_prompt(
-            output.analysis_result,
-            output.intelligent_filtered_data 
-        )
         try:
-            response = await self.model.generate_content_async(prompt)
-            html_content = self._clean_html_response(response.text)
+            # 재개한 실행에서 이미 만든 본문이 있으면 다시 생성하지 않고 발송만 재시도합니다.
+            if not output.email_html:
+                prompt = self._create_email_prompt(
+                    output.analysis_result,
+                    output.intelligent_filtered_data 
+                )
+                response_text = await generate_text(self.llm, prompt, self.llm_cache)
+                output.email_html = self._clean_html_response(response_text)
             
-            output.email_html = html_content
             subject = self.config["EMAIL_CONFIG"]["subject_template"].format(date=datetime.now().strftime("%Y-%m-%d"))
-            self.reporter.send_custom_html(html_content, subject)
-            logger.info("✅ Agent 3 (Emailer): 이메일 전송 완료.")
+            if self.reporter.send_custom_html(output.email_html, subject):
+                output.email_sent = True
+                logger.info("✅ Agent 3 (Emailer): 이메일 전송 완료.")
+                self._mark_reported(output)
         except Exception as e:
             logger.error(f"❌ Agent 3 (Emailer): 이메일 생성/전송 중 오류 발생 - {e}", exc_info=True)
 
         return output
 
+    def _mark_reported(self, output: AgentOutput):
+        """
+        발송이 끝난 뒤에야 이번 실행의 필터 후보와 발송 항목을 수집 장부에 기록합니다.
+        실패한 실행의 항목은 기록되지 않으므로 다음 실행(또는 --resume)에서 다시 전달됩니다.
+        """
+        if not self.seen_ledger:
+            return
+        self.seen_ledger.mark_offered(output.filter_candidates or [])
+        filtered_data = output.intelligent_filtered_data or {}
+        self.seen_ledger.mark_reported(item.get("url") for item in filtered_data.get("relevant_items", []))
+
     def _create_email_prompt(self, analysis: Dict, filtered_data: Optional[Dict]) -> str:
         """분석된 데이터를 기반으로 반응형 이메일 템플릿을 채우는 프롬프트"""
         
@@ -257,12 +473,12 @@ class EmailerAgent:
 
 class CodeReviewerAgent:
     """Agent 4: 프로젝트 코드를 분석하고 개선점을 제안합니다."""
-    def __init__(self, config: Dict):
+    def __init__(self, config: Dict, http_client: Optional[HttpClientManager] = None, llm: Optional[LLMClient] = None):
         self.gemini_key = config["API_KEYS"]["code_reviewer"]
-        if not self.gemini_key:
+        if llm is None and not self.gemini_key:
             raise ValueError("CodeReviewerAgent의 Gemini API 키가 설정되지 않았습니다.")
-        genai.configure(api_key=self.gemini_key)
-        self.model = genai.GenerativeModel('gemini-1.5-flash')
+        self.llm = llm or GeminiClient(self.gemini_key, GEMINI_MODEL, http_client or get_http_client(config))
+        self.llm_cache = get_llm_cache(config)
         self.project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
     async def run(self, output: AgentOutput):
@@ -271,8 +487,7 @@ class CodeReviewerAgent:
         code_content = self._read_project_code()
         prompt = self._create_code_review_prompt(code_content)
         try:
-            response = await self.model.generate_content_async(prompt)
-            output.code_review_report = response.text
+            output.code_review_report = await generate_text(self.llm, prompt, self.llm_cache)
             
             report_path = os.path.join(self.project_root, "outputs", f"code_review_{datetime.now().strftime('%Y%m%d')}.md")
             os.makedirs(os.path.dirname(report_path), exist_ok=True)
@@ -324,45 +539,128 @@ class CodeReviewerAgent:
 
 class NewMultiAgentOrchestrator:
     """4개의 AI 에이전트 작업을 조율하는 오케스트레이터"""
-    def __init__(self, config: Dict):
+    def __init__(self, config: Dict, http_client: Optional[HttpClientManager] = None,
+                 quota_manager: Optional[AIQuotaManager] = None):
         self.config = config
-        self.collector = CollectorAgent(config)
-        self.analyzer = AnalyzerAgent(config)
-        self.emailer = EmailerAgent(config)
-        self.code_reviewer = CodeReviewerAgent(config)
+        # KEY_POOL_CONFIG가 켜져 있으면 네 에이전트가 모든 Gemini 키의 한도를 함께 씁니다.
+        self.key_pool = GeminiKeyPool.from_config(
+            config, GEMINI_MODEL, http_client or get_http_client(config), quota_manager=quota_manager
+        )
+        self.collector = CollectorAgent(config, http_client=http_client, llm=self.key_pool)
+        self.analyzer = AnalyzerAgent(config, http_client=http_client, llm=self.key_pool)
+        self.emailer = EmailerAgent(config, http_client=http_client, llm=self.key_pool)
+        self.code_reviewer = CodeReviewerAgent(config, http_client=http_client, llm=self.key_pool)
+        self.last_run_status: Dict[str, Dict[str, Any]] = {}
+        self.checkpoints = CheckpointStore.from_config(config)
+        self.run_id: Optional[str] = None
         self.config_path = os.path.join(
             os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
             "configs",
             "config.py"
         )
     
-    async def run_weekly_analysis(self):
-        """에이전트 시스템의 전체 분석 및 리포팅 플로우를 실행합니다."""
+    def build_graph(self) -> AgentGraph:
+        """
+        에이전트 실행 그래프를 구성합니다. 각 단계는 AgentOutput에서 읽고 쓰는 필드를 선언하며,
+        코드 리뷰는 다른 에이전트의 결과에 의존하지 않으므로 수집 단계부터 함께 실행됩니다.
+        """
+        timeouts = self.config.get("ORCHESTRATOR_CONFIG", {}).get("stage_timeouts", {})
+        return AgentGraph([
+            Stage("collect", self.collector.collect, outputs=("raw_collected_data",), timeout=timeouts.get("collect")),
+            Stage("filter", self.collector.filter, inputs=("raw_collected_data",),
+                  outputs=("filter_candidates", "intelligent_filtered_data"), timeout=timeouts.get("filter")),
+            Stage("analyze", self.analyzer.run, inputs=("intelligent_filtered_data",), outputs=("analysis_result",),
+                  timeout=timeouts.get("analyze")),
+            Stage("email", self.emailer.run, inputs=("analysis_result", "intelligent_filtered_data", "filter_candidates"),
+                  outputs=("email_html", "email_sent"), timeout=timeouts.get("email")),
+            Stage("update_keywords", self._update_keywords_stage, inputs=("analysis_result",)),
+            Stage("code_review", self.code_reviewer.run, outputs=("code_review_report",),
+                  timeout=timeouts.get("code_review")),
+        ])
+
+    async def run_weekly_analysis(self, resume_run_id: Optional[str] = None):
+        """
+        에이전트 시스템의 전체 분석 및 리포팅 플로우를 실행합니다.
+        resume_run_id를 주면 그 실행의 체크포인트를 복원하고, 완료되지 않은 첫 단계부터 다시 실행합니다.
+        """
         logger.info("\n" + "="*60)
         logger.info("🚀 멀티 에이전트 시스템 v4.2 가동!")
         
         output = AgentOutput(start_time=datetime.now())
+        graph = self.build_graph()
+        completed = self._restore(resume_run_id, output, graph) if resume_run_id else set()
+        if not resume_run_id and self.checkpoints:
+            self.run_id = self.checkpoints.new_run_id()
+        if self.run_id:
+            logger.info(f"   - 실행 ID: {self.run_id}")
         
-        # 에이전트 순차 실행
-        output = await self.collector.run(output)
-        output = await self.analyzer.run(output)
-        output = await self.emailer.run(output)
-
-        # 키워드 자동 업데이트
-        if output.analysis_result and "suggested_keywords" in output.analysis_result:
-            self.update_keywords(
-                output.analysis_result.get("suggested_keywords", []),
-                output.analysis_result.get("deprecated_keywords", [])
-            )
-            
-        # 코드 리뷰 에이전트 실행
-        await self.code_reviewer.run(output)
+        # 선언된 입력/출력에 따라 독립적인 에이전트는 동시에 실행합니다.
+        self.last_run_status = await graph.run(
+            output, completed=completed, on_complete=lambda stage: self._save_checkpoint(stage, output)
+        )
+
+        llm_cache = get_llm_cache(self.config)
+        if llm_cache:
+            llm_cache.log_stats()
+        if self.key_pool:
+            self.key_pool.log_report()
         
         end_time = datetime.now()
         logger.info("\n" + "="*60)
         logger.info("✅ 모든 에이전트 작업 완료!")
         logger.info(f"   - 총 소요 시간: {end_time - output.start_time}")
         logger.info("="*60)
+        return output
+
+    def _restore(self, run_id: str, output: AgentOutput, graph: AgentGraph) -> set:
+        """
+        체크포인트를 output에 되돌리고, 다시 실행하지 않아도 되는 단계 이름을 반환합니다.
+        선행 단계가 모두 유효한 단계의 필드만 복원하므로, 미완료 단계의 중간 결과(예: 발송 실패한 이메일 본문)는
+        재사용하되 다시 실행되는 단계의 오래된 후행 결과는 쓰지 않습니다.
+        """
+        if not self.checkpoints:
+            raise ValueError("CHECKPOINT_CONFIG가 비활성화되어 있어 재개할 수 없습니다.")
+        self.run_id = self.checkpoints.latest_run_id() if run_id == "latest" else run_id
+        if not self.run_id:
+            raise FileNotFoundError("재개할 체크포인트가 없습니다.")
+        checkpoints = self.checkpoints.load(self.run_id)
+        completed = graph.resumable(stage for stage, checkpoint in checkpoints.items() if checkpoint["complete"])
+        for stage, checkpoint in checkpoints.items():
+            if stage in graph.dependencies and all(d in completed for d in graph.dependencies[stage]):
+                for field, value in checkpoint["fields"].items():
+                    setattr(output, field, value)
+        if output.raw_collected_data:
+            output.raw_collected_data = {
+                source: items_from_dicts(items, source) if isinstance(items, list) else items
+                for source, items in output.raw_collected_data.items()
+            }
+        logger.info(f"♻️ 실행 {self.run_id} 재개: 완료된 단계 {sorted(completed) or '없음'}")
+        return completed
+
+    def _save_checkpoint(self, stage: Stage, output: AgentOutput) -> None:
+        """
+        단계가 끝나면 출력 필드를 저장합니다. 에이전트가 오류를 결과에 담아 반환했거나
+        이메일이 발송되지 않았다면 미완료로 저장하여, 재개할 때 그 단계부터 다시 실행합니다.
+        """
+        if not self.checkpoints or not self.run_id:
+            return
+        fields = {field: getattr(output, field) for field in stage.outputs}
+        if stage.name == "email":
+            complete = output.email_sent
+        else:
+            complete = all(value is not None and not (isinstance(value, dict) and "error" in value)
+                           for value in fields.values())
+        self.checkpoints.save(self.run_id, stage.name, fields, complete=complete)
+
+    async def _update_keywords_stage(self, output: AgentOutput):
+        """분석 결과의 keyword_suggestions로 필터 키워드를 자동 업데이트합니다."""
+        if not output.analysis_result or "error" in output.analysis_result:
+            return
+        suggestions = output.analysis_result.get("keyword_suggestions") or {}
+        self.update_keywords(
+            suggestions.get("suggested_keywords", []),
+            suggestions.get("deprecated_keywords", [])
+        )
 
     def update_keywords(self, new_keywords: List[str], deprecated_keywords: List[str]):
         """
@@ -414,7 +712,10 @@ class NewMultiAgentOrchestrator:
 
             with open(self.config_path, "w", encoding="utf-8") as f:
                 f.write(final_content)
-            
+
+            # 실행 중인 프로세스의 설정도 갱신하여 DataCollector의 키워드 매처가 다시 빌드되도록 합니다.
+            self.config["FILTER_KEYWORDS"]["must_have_any"][:] = sorted_keywords
+
             logger.info("✅ 설정 파일의 키워드를 성공적으로 업데이트했습니다.")
 
         except Exception as e:
@@ -0,0 +1,82 @@
+import asyncio
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from scrapper.utils.logger import logger
+
+
+def _timed_call(func: Callable[..., Any], *args: Any) -> Tuple[Any, float]:
+    """작업 스레드/프로세스 안에서 함수를 실행하고 (결과, 실행 시간)을 반환합니다."""
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+class ParseExecutor:
+    """
+    feedparser, BeautifulSoup 같은 CPU 바운드 파싱 작업을 이벤트 루프 밖에서 실행합니다.
+    - use_processes=True면 프로세스 풀을 사용합니다. 이때 함수와 인자, 결과는 pickle 가능해야 합니다.
+    - 작업 이름별로 실행 횟수, 파싱 시간(원래 루프를 막았을 시간), 대기 시간을 기록합니다.
+      풀은 프로세스 전체에서 공유하므로, 수집 실행마다 reset_stats()로 통계를 비우고 시작합니다.
+    """
+
+    def __init__(self, max_workers: int = 4, use_processes: bool = False):
+        self.max_workers = max_workers
+        self.use_processes = use_processes
+        self._executor: Optional[Executor] = None
+        self.stats: Dict[str, Dict[str, float]] = {}
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            pool_class = ProcessPoolExecutor if self.use_processes else ThreadPoolExecutor
+            self._executor = pool_class(max_workers=self.max_workers)
+        return self._executor
+
+    async def run(self, name: str, func: Callable[..., Any], *args: Any) -> Any:
+        """파싱 함수를 풀에 제출하고 결과를 기다립니다."""
+        loop = asyncio.get_running_loop()
+        submitted = time.perf_counter()
+        result, parse_seconds = await loop.run_in_executor(self._get_executor(), _timed_call, func, *args)
+        self._record(name, parse_seconds, time.perf_counter() - submitted - parse_seconds)
+        return result
+
+    def _record(self, name: str, parse_seconds: float, wait_seconds: float) -> None:
+        stat = self.stats.setdefault(name, {"count": 0, "parse_seconds": 0.0, "max_parse_seconds": 0.0, "wait_seconds": 0.0})
+        stat["count"] += 1
+        stat["parse_seconds"] += parse_seconds
+        stat["max_parse_seconds"] = max(stat["max_parse_seconds"], parse_seconds)
+        stat["wait_seconds"] += wait_seconds
+
+    def reset_stats(self) -> None:
+        """다음 수집 실행의 통계를 새로 모으도록 누적값을 비웁니다."""
+        self.stats = {}
+
+    def log_stats(self) -> None:
+        """작업별 파싱 시간 통계를 로그로 남깁니다."""
+        for name, stat in self.stats.items():
+            logger.info(
+                f"🧮 파싱 통계 [{name}]: {int(stat['count'])}회, "
+                f"총 {stat['parse_seconds']:.3f}초 (최대 {stat['max_parse_seconds']:.3f}초), "
+                f"풀 대기 {stat['wait_seconds']:.3f}초"
+            )
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+_shared_executor: Optional[ParseExecutor] = None
+
+
+def get_parse_executor(config: Dict[str, Any]) -> ParseExecutor:
+    """모든 수집기가 함께 쓰는 프로세스 전역 ParseExecutor를 반환합니다."""
+    global _shared_executor
+    if _shared_executor is None:
+        executor_config = config.get("PARSE_EXECUTOR_CONFIG", {})
+        _shared_executor = ParseExecutor(
+            max_workers=executor_config.get("max_workers", 4),
+            use_processes=executor_config.get("use_processes", False),
+        )
+    return _shared_executor
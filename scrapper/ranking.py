@@ -0,0 +1,139 @@
+import json
+import os
+import re
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from scrapper.items import CollectedItem
+from scrapper.utils.logger import logger
+
+_TOKEN_PATTERN = re.compile(r"[0-9a-z가-힣]+(?:[.+#][0-9a-z]+)*")
+
+
+def tokenize(text: str) -> List[str]:
+    """텍스트를 단어와 인접 단어쌍(bigram)으로 나눕니다. 'next.js', 'c++' 같은 표기는 한 단어로 봅니다."""
+    words = _TOKEN_PATTERN.findall(text.lower())
+    return words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+
+class BM25Ranker:
+    """
+    수집 항목을 질의(필터 키워드 + 과거 선별 제목)에 대해 BM25로 점수화합니다.
+    문서-단어 행렬은 (문서, 단어, 빈도) COO 배열로만 유지하고, 점수는 np.bincount로 한 번에 합산합니다.
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+
+    def score(self, documents: List[str], query_weights: Dict[str, float]) -> np.ndarray:
+        """문서별 BM25 점수 배열을 반환합니다."""
+        vocabulary: Dict[str, int] = {}
+        rows: List[int] = []
+        cols: List[int] = []
+        lengths = np.zeros(len(documents), dtype=np.float64)
+        for row, document in enumerate(documents):
+            tokens = tokenize(document)
+            lengths[row] = len(tokens)
+            for token in tokens:
+                rows.append(row)
+                cols.append(vocabulary.setdefault(token, len(vocabulary)))
+        if not rows:
+            return np.zeros(len(documents))
+
+        # 같은 (문서, 단어) 쌍을 합쳐 빈도를 구합니다.
+        pairs, tf = np.unique(np.array(rows, dtype=np.int64) * len(vocabulary) + np.array(cols, dtype=np.int64), return_counts=True)
+        doc_ids, term_ids = np.divmod(pairs, len(vocabulary))
+
+        query = np.zeros(len(vocabulary))
+        for term, weight in query_weights.items():
+            if term in vocabulary:
+                query[vocabulary[term]] = weight
+
+        df = np.bincount(term_ids, minlength=len(vocabulary))
+        idf = np.log1p((len(documents) - df + 0.5) / (df + 0.5))
+        avg_length = lengths.mean() or 1.0
+        norm = self.k1 * (1 - self.b + self.b * lengths[doc_ids] / avg_length)
+        weights = idf[term_ids] * tf * (self.k1 + 1) / (tf + norm) * query[term_ids]
+        return np.bincount(doc_ids, weights=weights, minlength=len(documents))
+
+
+class SelectionHistory:
+    """LLM 필터가 과거에 선별한 항목 제목을 JSON 파일로 보관합니다. 최근 max_entries개만 유지합니다."""
+
+    def __init__(self, path: str, max_entries: int = 500):
+        self.path = path
+        self.max_entries = max_entries
+        self.titles: List[str] = self._load()
+
+    def _load(self) -> List[str]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return []
+
+    def add(self, titles: Iterable[str]) -> None:
+        self.titles = (self.titles + [title for title in titles if title])[-self.max_entries:]
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(self.path, "w", encoding="utf-8") as f:
+                json.dump(self.titles, f, ensure_ascii=False)
+        except OSError as e:
+            logger.warning(f"선별 이력 저장 실패: {e}")
+
+
+def build_query_weights(keywords: Iterable[str], history_titles: Iterable[str], history_weight: float = 0.5) -> Dict[str, float]:
+    """필터 키워드는 가중치 1, 과거 선별 제목의 단어는 등장 빈도에 비례해 최대 history_weight를 줍니다."""
+    weights: Dict[str, float] = {}
+    for keyword in keywords:
+        for token in tokenize(keyword):
+            weights[token] = 1.0
+
+    history_counts: Dict[str, int] = {}
+    for title in history_titles:
+        for token in set(tokenize(title)):
+            history_counts[token] = history_counts.get(token, 0) + 1
+    if history_counts:
+        top = max(history_counts.values())
+        for token, count in history_counts.items():
+            weights[token] = weights.get(token, 0.0) + history_weight * count / top
+    return weights
+
+
+def rank_candidates(data: Dict[str, Any], query_weights: Dict[str, float], top_k: int = 40,
+                    max_per_source: Optional[int] = None, signal_weight: float = 0.2,
+                    ranker: Optional[BM25Ranker] = None) -> Dict[str, Any]:
+    """
+    모든 소스의 항목을 한꺼번에 점수화해 상위 top_k개만 남깁니다.
+    - 점수 = 정규화된 BM25 * (1 + signal_weight * 정규화된 log(점수/별 수)), 관련성이 없으면 인기도와 무관하게 0
+    - max_per_source를 주면 한 소스가 후보를 독차지하지 않도록 소스별 개수를 제한합니다.
+    - 소스별 목록 구조는 유지하며, 목록 안에서는 점수 순으로 정렬합니다.
+    """
+    entries: List[Tuple[str, CollectedItem]] = [
+        (source, CollectedItem.coerce(item, source))
+        for source, items in data.items() if isinstance(items, list) for item in items
+    ]
+    ranked = {source: [] if isinstance(items, list) else items for source, items in data.items()}
+    if not entries:
+        return ranked
+
+    relevance = (ranker or BM25Ranker()).score(
+        [f"{item.title} {item.description} {item.category}" for _, item in entries], query_weights
+    )
+    signal = np.log1p(np.array([max(item.signal, 0.0) for _, item in entries]))
+    scores = relevance / (relevance.max() or 1.0) * (1 + signal_weight * signal / (signal.max() or 1.0))
+
+    per_source: Dict[str, int] = {}
+    kept = 0
+    for index in np.argsort(-scores, kind="stable"):
+        source, item = entries[index]
+        if max_per_source is not None and per_source.get(source, 0) >= max_per_source:
+            continue
+        ranked[source].append(item)
+        per_source[source] = per_source.get(source, 0) + 1
+        kept += 1
+        if kept >= top_k:
+            break
+    return ranked
@@ -0,0 +1,155 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncIterator, Dict, Mapping, Optional
+from urllib.parse import urlparse
+
+from scrapper.utils.logger import logger
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After 헤더(초 또는 HTTP 날짜)를 대기 시간(초)으로 변환합니다."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class HostLimiter:
+    """
+    단일 호스트에 대한 동시 요청 수 제한과 토큰 버킷 속도 제한을 적용합니다.
+    - max_concurrency: 동시에 진행 중인 요청의 최대 개수
+    - rate / burst: 초당 허용 요청 수와 순간적으로 몰아 쓸 수 있는 토큰 수
+    - 서버가 Retry-After나 X-RateLimit-Remaining: 0을 보내면 지정된 시각까지 요청을 멈춥니다.
+    - X-RateLimit-Remaining/Reset이 오면 남은 요청을 reset 시각까지 고르게 나눠 쓰도록 속도를 낮춥니다.
+    """
+
+    def __init__(self, host: str, max_concurrency: int = 8, rate: float = 10.0, burst: Optional[float] = None):
+        self.host = host
+        self.max_concurrency = max_concurrency
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self.tokens = self.burst
+        self.blocked_until = 0.0
+        # 서버가 알려준 남은 한도 창: window_reset(에포크 초)까지 window_rate 이하로 요청합니다.
+        self.window_rate: Optional[float] = None
+        self.window_reset = 0.0
+        self._last_refill = time.monotonic()
+        # asyncio 기본 객체는 이벤트 루프에 묶이므로 루프가 바뀌면 새로 만듭니다.
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._pacing_lock: Optional[asyncio.Lock] = None
+
+    def _ensure_primitives(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._pacing_lock = asyncio.Lock()
+
+    def _current_rate(self) -> float:
+        if self.window_rate is not None and time.time() < self.window_reset:
+            return min(self.rate, self.window_rate)
+        return self.rate
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self._last_refill) * self._current_rate())
+        self._last_refill = now
+
+    async def _acquire_token(self) -> None:
+        """토큰이 생길 때까지(그리고 차단 시각이 지날 때까지) 기다린 뒤 하나를 소비합니다."""
+        async with self._pacing_lock:
+            while True:
+                blocked_for = self.blocked_until - time.time()
+                if blocked_for > 0:
+                    await asyncio.sleep(blocked_for)
+                    continue
+                self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self._current_rate())
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """동시 실행 슬롯과 토큰을 확보한 상태로 요청을 수행합니다."""
+        self._ensure_primitives()
+        async with self._semaphore:
+            await self._acquire_token()
+            yield
+
+    def observe(self, status: int, headers: Mapping[str, str]) -> None:
+        """응답 헤더의 Retry-After / X-RateLimit-* 값을 반영해 이후 요청 시각을 조정합니다."""
+        retry_after = parse_retry_after(headers.get("Retry-After"))
+        if retry_after is not None and status in (403, 429, 503):
+            self._block_for(retry_after)
+            return
+
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+        if remaining is not None and reset is not None:
+            try:
+                remaining_count, reset_at = int(remaining), float(reset)
+            except ValueError:
+                remaining_count = None
+            if remaining_count == 0:
+                self._block_until(reset_at)
+                return
+            if remaining_count is not None:
+                self._pace_window(remaining_count, reset_at)
+        if status == 429:
+            # 서버가 대기 시간을 알려주지 않으면 토큰 버킷 한 주기만큼 쉽니다.
+            self._block_for(self.burst / self.rate)
+
+    def _pace_window(self, remaining: int, reset_at: float) -> None:
+        """reset 시각까지 남은 한도를 다 쓰지 않도록 속도를 낮추고, 한 번에 몰아 쓸 토큰도 남은 한도로 줄입니다."""
+        window = reset_at - time.time()
+        if window <= 0:
+            return
+        self.window_rate = remaining / window
+        self.window_reset = reset_at
+        self.tokens = min(self.tokens, float(remaining))
+
+    def _block_for(self, seconds: float) -> None:
+        self._block_until(time.time() + seconds)
+
+    def _block_until(self, timestamp: float) -> None:
+        if timestamp > self.blocked_until:
+            self.blocked_until = timestamp
+            logger.warning(f"⏳ {self.host} 요청 한도 도달: {max(0.0, timestamp - time.time()):.0f}초 동안 대기합니다.")
+
+
+class RateLimiter:
+    """
+    호스트별 HostLimiter를 관리하는 공유 레지스트리입니다.
+    RATE_LIMIT_CONFIG의 "hosts"에 호스트별 설정을, "default"에 기본값을 둡니다.
+    """
+
+    def __init__(self, limits_config: Optional[Dict[str, Any]] = None):
+        limits_config = limits_config or {}
+        self.default = limits_config.get("default", {})
+        self.host_configs = limits_config.get("hosts", {})
+        self._limiters: Dict[str, HostLimiter] = {}
+
+    def for_url(self, url: str) -> HostLimiter:
+        """URL의 호스트에 해당하는 리미터를 반환합니다."""
+        host = urlparse(url).hostname or ""
+        if host not in self._limiters:
+            settings = {**self.default, **self.host_configs.get(host, {})}
+            self._limiters[host] = HostLimiter(host, **settings)
+        return self._limiters[host]
+
+    def limit(self, url: str):
+        """`async with limiter.limit(url):` 형태로 요청 구간을 감쌉니다."""
+        return self.for_url(url).slot()
+
+    def observe(self, url: str, status: int, headers: Mapping[str, str]) -> None:
+        """응답 정보를 해당 호스트의 리미터에 전달합니다."""
+        self.for_url(url).observe(status, headers)
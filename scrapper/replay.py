@@ -0,0 +1,176 @@
+import json
+import os
+from typing import Any, Dict, List, Mapping, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import aiohttp
+from multidict import CIMultiDict
+
+from scrapper.http_client import HttpClientManager
+from scrapper.utils.logger import logger
+
+
+def interaction_key(method: str, url: str, params: Optional[Mapping[str, Any]] = None) -> str:
+    """요청 메서드, URL, 쿼리 파라미터로 카세트 키를 만듭니다. 파라미터 순서는 키에 영향을 주지 않습니다."""
+    parts = urlsplit(str(url))
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    query.extend((key, str(value)) for key, value in (params or {}).items())
+    return f"{method.upper()} {urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(sorted(query)), ''))}"
+
+
+class ReplayResponse:
+    """본문을 모두 읽어 둔 aiohttp 응답 대용 객체입니다. 수집기와 asyncprawcore가 쓰는 속성만 제공합니다."""
+
+    def __init__(self, status: int, headers: Mapping[str, str], body: str, url: str = ""):
+        self.status = status
+        self.headers = CIMultiDict(headers)
+        self.body = body
+        self.url = url
+
+    async def text(self, *args: Any, **kwargs: Any) -> str:
+        return self.body
+
+    async def read(self) -> bytes:
+        return self.body.encode("utf-8")
+
+    async def json(self, *args: Any, **kwargs: Any) -> Any:
+        return json.loads(self.body)
+
+    def release(self) -> None:
+        pass
+
+    async def __aenter__(self) -> "ReplayResponse":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        return None
+
+
+class Cassette:
+    """
+    녹화된 HTTP 상호작용 모음입니다. 같은 키로 여러 번 녹화되면 재생할 때 순서대로 돌려주고,
+    마지막 응답은 이후 요청에도 계속 사용합니다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.interactions: Dict[str, List[Dict[str, Any]]] = {}
+        self._cursor: Dict[str, int] = {}
+
+    @classmethod
+    def load(cls, path: str) -> "Cassette":
+        cassette = cls(path)
+        with open(path, "r", encoding="utf-8") as f:
+            cassette.interactions = json.load(f)
+        return cassette
+
+    def record(self, key: str, status: int, headers: Mapping[str, str], body: str) -> None:
+        self.interactions.setdefault(key, []).append({"status": status, "headers": dict(headers), "body": body})
+
+    def play(self, key: str) -> Optional[Dict[str, Any]]:
+        recorded = self.interactions.get(key)
+        if not recorded:
+            return None
+        index = self._cursor.get(key, 0)
+        self._cursor[key] = index + 1
+        return recorded[min(index, len(recorded) - 1)]
+
+    def save(self) -> None:
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(self.interactions, f, ensure_ascii=False, indent=1)
+
+
+class _CassetteSession:
+    """get()/request()를 제공하는 세션 대용 객체의 공통 부분입니다. asyncprawcore가 확인하는 headers/closed도 제공합니다."""
+
+    def __init__(self, cassette: Cassette):
+        self.cassette = cassette
+        self.headers: CIMultiDict = CIMultiDict()
+        self.closed = False
+
+    def get(self, url: str, **kwargs: Any) -> "_PendingResponse":
+        return self.request("GET", url, **kwargs)
+
+    def request(self, method: str, url: str, **kwargs: Any) -> "_PendingResponse":
+        return _PendingResponse(self._respond(method, str(url), kwargs))
+
+    async def _respond(self, method: str, url: str, kwargs: Dict[str, Any]) -> ReplayResponse:
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class _PendingResponse:
+    """`async with session.get(...) as response:` 형태를 지원하기 위한 래퍼입니다."""
+
+    def __init__(self, coro: Any):
+        self._coro = coro
+
+    async def __aenter__(self) -> ReplayResponse:
+        return await self._coro
+
+    async def __aexit__(self, *exc: Any) -> None:
+        return None
+
+
+class RecordingSession(_CassetteSession):
+    """실제 세션으로 요청을 보내고 응답을 카세트에 기록합니다."""
+
+    def __init__(self, cassette: Cassette, session: aiohttp.ClientSession):
+        super().__init__(cassette)
+        self._session = session
+        self.headers = session.headers
+
+    async def _respond(self, method: str, url: str, kwargs: Dict[str, Any]) -> ReplayResponse:
+        async with self._session.request(method, url, **kwargs) as response:
+            body = await response.text()
+            headers = {key: value for key, value in response.headers.items() if key.lower() != "content-encoding"}
+            self.cassette.record(interaction_key(method, url, kwargs.get("params")), response.status, headers, body)
+            return ReplayResponse(response.status, headers, body, url)
+
+
+class ReplaySession(_CassetteSession):
+    """카세트에 기록된 응답만 돌려줍니다. 기록되지 않은 요청은 404로 응답합니다."""
+
+    async def _respond(self, method: str, url: str, kwargs: Dict[str, Any]) -> ReplayResponse:
+        key = interaction_key(method, url, kwargs.get("params"))
+        recorded = self.cassette.play(key)
+        if recorded is None:
+            logger.warning(f"재생 카세트에 없는 요청: {key}")
+            return ReplayResponse(404, {}, "", url)
+        return ReplayResponse(recorded["status"], recorded["headers"], recorded["body"], url)
+
+
+class ReplayHttpClient(HttpClientManager):
+    """
+    DataCollector의 HTTP 트래픽을 녹화(record)하거나 녹화본으로 재생(replay)하는 HTTP 클라이언트입니다.
+    HTTP_REPLAY_CONFIG = {"mode": "record" | "replay", "cassette": "<경로>"}로 켜며,
+    녹화 모드에서는 close() 시점에 카세트를 저장합니다.
+    """
+
+    def __init__(self, config: Dict[str, Any], mode: str, cassette_path: str):
+        super().__init__(config)
+        if mode not in ("record", "replay"):
+            raise ValueError(f"알 수 없는 재생 모드: {mode}")
+        self.mode = mode
+        self.cassette = Cassette.load(cassette_path) if mode == "replay" else Cassette(cassette_path)
+        self._wrapped: Optional[_CassetteSession] = None
+
+    async def get_session(self) -> Any:
+        if self.mode == "replay":
+            if self._wrapped is None:
+                self._wrapped = ReplaySession(self.cassette)
+            return self._wrapped
+        session = await super().get_session()
+        if self._wrapped is None or getattr(self._wrapped, "_session", None) is not session:
+            self._wrapped = RecordingSession(self.cassette, session)
+        return self._wrapped
+
+    async def close(self) -> None:
+        if self.mode == "record":
+            self.cassette.save()
+            logger.info(f"📼 HTTP 상호작용 {sum(map(len, self.cassette.interactions.values()))}건 녹화: {self.cassette.path}")
+        self._wrapped = None
+        await super().close()
@@ -0,0 +1,125 @@
+import json
+import os
+import random
+import time
+from typing import Any, Dict, Optional
+
+from scrapper.utils.logger import logger
+
+
+class RetryPolicy:
+    """
+    지터가 있는 지수 백오프 재시도 정책입니다.
+    - max_attempts: 첫 시도를 포함한 최대 시도 횟수
+    - retry_budget: 한 번의 수집 실행에서 이 소스가 쓸 수 있는 재시도 총량
+    """
+
+    def __init__(self, max_attempts: int = 3, base_delay: float = 0.5, max_delay: float = 8.0, retry_budget: int = 20):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_budget = retry_budget
+
+    def delay(self, attempt: int) -> float:
+        """attempt번째 재시도 전 대기 시간(full jitter)을 반환합니다."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+
+class RetryPolicies:
+    """RETRY_CONFIG에서 소스별 재시도 정책과 실행 단위 재시도 예산을 관리합니다."""
+
+    def __init__(self, retry_config: Optional[Dict[str, Any]] = None):
+        retry_config = retry_config or {}
+        self.default = retry_config.get("default", {})
+        self.source_configs = retry_config.get("sources", {})
+        self._policies: Dict[Optional[str], RetryPolicy] = {}
+        self._spent: Dict[Optional[str], int] = {}
+
+    def for_source(self, source: Optional[str]) -> RetryPolicy:
+        if source not in self._policies:
+            self._policies[source] = RetryPolicy(**{**self.default, **self.source_configs.get(source, {})})
+        return self._policies[source]
+
+    def try_spend(self, source: Optional[str]) -> bool:
+        """재시도 예산이 남아 있으면 하나를 소비하고 True를 반환합니다."""
+        if self._spent.get(source, 0) >= self.for_source(source).retry_budget:
+            return False
+        self._spent[source] = self._spent.get(source, 0) + 1
+        return True
+
+    def reset_budgets(self) -> None:
+        """새 수집 실행을 시작할 때 재시도 예산을 초기화합니다."""
+        self._spent.clear()
+
+
+class CircuitBreaker:
+    """
+    여러 실행에 걸쳐 연속으로 실패한 소스(또는 피드)를 건너뛰는 영속 서킷 브레이커입니다.
+    - closed: 정상 요청
+    - open: failure_threshold번 연속 실행에서 실패하면 cooldown 동안 요청하지 않음
+    - half_open: cooldown이 지나면 한 번의 실행 동안 다시 시도하고, 성공하면 closed로 돌아감
+    실행 중에는 결과만 모으고, commit_run()에서 실행 단위로 상태를 갱신해 파일에 저장합니다.
+    """
+
+    def __init__(self, state_path: str, failure_threshold: int = 3, cooldown_seconds: float = 86400):
+        self.state_path = state_path
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self.states: Dict[str, Dict[str, Any]] = self._load()
+        self._run_results: Dict[str, bool] = {}
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> Optional["CircuitBreaker"]:
+        """CIRCUIT_BREAKER_CONFIG 설정으로 브레이커를 생성합니다. 비활성화 상태면 None을 반환합니다."""
+        breaker_config = config.get("CIRCUIT_BREAKER_CONFIG", {})
+        if not breaker_config.get("enabled"):
+            return None
+        return cls(
+            state_path=breaker_config.get("state_path") or os.path.join(config.get("OUTPUT_DIR", "outputs"), "circuit_breakers.json"),
+            failure_threshold=breaker_config.get("failure_threshold", 3),
+            cooldown_seconds=breaker_config.get("cooldown_hours", 24) * 3600,
+        )
+
+    def allow(self, key: str) -> bool:
+        """이번 실행에서 해당 키로 요청해도 되는지 확인합니다."""
+        state = self.states.get(key)
+        if not state or state["state"] == "closed":
+            return True
+        if state["state"] == "open" and time.time() >= state["open_until"]:
+            state["state"] = "half_open"
+            logger.info(f"🔌 {key}: 서킷 half-open, 이번 실행에서 다시 시도합니다.")
+        return state["state"] == "half_open"
+
+    def record(self, key: str, success: bool) -> None:
+        """요청 결과를 기록합니다. 한 실행에서 한 번이라도 성공하면 그 실행은 성공으로 봅니다."""
+        self._run_results[key] = self._run_results.get(key, False) or success
+
+    def commit_run(self) -> None:
+        """이번 실행의 결과로 각 키의 상태를 갱신하고 저장합니다."""
+        now = time.time()
+        for key, success in self._run_results.items():
+            state = self.states.setdefault(key, {"state": "closed", "failures": 0, "open_until": 0})
+            if success:
+                state.update(state="closed", failures=0, open_until=0)
+                continue
+            state["failures"] += 1
+            if state["state"] == "half_open" or state["failures"] >= self.failure_threshold:
+                state.update(state="open", open_until=now + self.cooldown_seconds)
+                logger.warning(f"🔌 {key}: {state['failures']}회 연속 실행 실패로 서킷을 엽니다.")
+        self._run_results.clear()
+        self._save()
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self) -> None:
+        try:
+            os.makedirs(os.path.dirname(self.state_path) or ".", exist_ok=True)
+            with open(self.state_path, "w", encoding="utf-8") as f:
+                json.dump(self.states, f, indent=2)
+        except OSError as e:
+            logger.warning(f"서킷 브레이커 상태 저장 실패: {e}")
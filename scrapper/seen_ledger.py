@@ -0,0 +1,158 @@
+import os
+import re
+import sqlite3
+import time
+from typing import Any, Dict, Iterable, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from scrapper.items import CollectedItem
+
+# 추적용 쿼리 파라미터 (utm_* 접두사는 별도로 제거)
+TRACKING_PARAMS = {
+    "fbclid", "gclid", "dclid", "msclkid", "mc_cid", "mc_eid", "igshid",
+    "ref", "ref_src", "ref_url", "_hsenc", "_hsmi", "share_id", "spm",
+}
+
+_REDDIT_POST_PATH = re.compile(r"^/(?:r/[^/]+/)?comments/([a-z0-9]+)", re.IGNORECASE)
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    같은 콘텐츠를 가리키는 URL들이 같은 키가 되도록 정규화합니다.
+    - 스킴은 https로, 호스트는 소문자로 통일하고 www. 접두사와 #fragment를 제거합니다.
+    - utm_* 등 추적 파라미터를 제거하고 나머지 쿼리는 정렬합니다.
+    - Reddit 퍼머링크는 https://reddit.com/comments/<id>, HN은 item?id=<id>만 남깁니다.
+    """
+    parts = urlsplit(url.strip())
+    host = (parts.hostname or "").lower()
+    for prefix in ("www.", "old.", "new.", "np.", "m."):
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+            break
+
+    if host == "redd.it":
+        return f"https://reddit.com/comments/{parts.path.strip('/').lower()}"
+    if host == "reddit.com":
+        match = _REDDIT_POST_PATH.match(parts.path)
+        if match:
+            return f"https://reddit.com/comments/{match.group(1).lower()}"
+    if host == "news.ycombinator.com" and parts.path == "/item":
+        item_id = dict(parse_qsl(parts.query)).get("id", "")
+        return f"https://news.ycombinator.com/item?id={item_id}"
+
+    query = urlencode(sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_") and key.lower() not in TRACKING_PARAMS
+    ))
+    path = parts.path.rstrip("/") if parts.path not in ("", "/") else ""
+    return urlunsplit(("https", host, path, query, ""))
+
+
+def item_url(item: Any) -> Optional[str]:
+    """항목의 URL을 꺼냅니다. dict(LLM 응답 등)는 url/link 키를 차례로 확인합니다."""
+    if isinstance(item, CollectedItem):
+        return item.url or None
+    return item.get("url") or item.get("link")
+
+
+class SeenLedger:
+    """
+    이미 필터에 올렸거나 리포트한 항목을 정규화된 URL 기준으로 기억하는 SQLite 장부입니다.
+    - 수집만 된 항목은 기록하지 않습니다. 리포트가 발송된 뒤에야 그 실행의 필터 후보(mark_offered)와
+      발송 항목(mark_reported)을 기록하므로, 실패한 실행이나 순위화/절단으로 빠진 항목은 다음 실행에 다시 전달됩니다.
+    - 필터 후보였던 항목은 resurface_after_days 뒤에, 리포트된 항목은 report_cooldown_days 뒤에 다시 전달합니다.
+    """
+
+    def __init__(self, db_path: str, resurface_after_days: float = 30, report_cooldown_days: float = 90):
+        self.db_path = db_path
+        self.resurface_after = resurface_after_days * 86400
+        self.report_cooldown = report_cooldown_days * 86400
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> Optional["SeenLedger"]:
+        """SEEN_LEDGER_CONFIG 설정으로 장부를 생성합니다. 비활성화 상태면 None을 반환합니다."""
+        ledger_config = config.get("SEEN_LEDGER_CONFIG", {})
+        if not ledger_config.get("enabled"):
+            return None
+        return cls(
+            db_path=ledger_config.get("db_path") or os.path.join(config.get("OUTPUT_DIR", "outputs"), "seen_items.sqlite3"),
+            resurface_after_days=ledger_config.get("resurface_after_days", 30),
+            report_cooldown_days=ledger_config.get("report_cooldown_days", 90),
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS seen ("
+                " url_key TEXT PRIMARY KEY,"
+                " first_seen REAL NOT NULL,"
+                " last_seen REAL NOT NULL,"
+                " last_reported REAL)"
+            )
+        return self._conn
+
+    def filter_new(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """처음 보는 항목과 다시 떠오른 항목만 남깁니다. 장부는 바꾸지 않습니다."""
+        now = time.time()
+        keyed = []
+        for item in items:
+            url = item_url(item)
+            keyed.append((item, canonicalize_url(url) if url else None))
+        rows = self._fetch_rows(list({key for _, key in keyed if key}))
+
+        forwarded = []
+        for item, key in keyed:
+            row = rows.get(key) if key else None
+            if key is None or row is None or self._is_resurfacing(row, now):
+                forwarded.append(item)
+        return forwarded
+
+    def mark_offered(self, urls: Iterable[str]) -> None:
+        """리포트가 발송된 실행에서 LLM 필터 후보로 올린 항목의 last_seen 시각을 기록합니다."""
+        now = time.time()
+        keys = {canonicalize_url(url) for url in urls if url}
+        conn = self._connect()
+        conn.executemany(
+            "INSERT INTO seen (url_key, first_seen, last_seen) VALUES (?, ?, ?) "
+            "ON CONFLICT(url_key) DO UPDATE SET last_seen = excluded.last_seen",
+            [(key, now, now) for key in keys],
+        )
+        conn.commit()
+
+    def mark_reported(self, urls: Iterable[str]) -> None:
+        """리포트(이메일)로 발송된 항목의 last_reported 시각을 기록합니다."""
+        now = time.time()
+        keys = {canonicalize_url(url) for url in urls if url}
+        conn = self._connect()
+        conn.executemany(
+            "INSERT INTO seen (url_key, first_seen, last_seen, last_reported) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT(url_key) DO UPDATE SET last_reported = excluded.last_reported",
+            [(key, now, now, now) for key in keys],
+        )
+        conn.commit()
+
+    def _is_resurfacing(self, row: Dict[str, Optional[float]], now: float) -> bool:
+        if row["last_reported"] and now - row["last_reported"] < self.report_cooldown:
+            return False
+        return now - row["last_seen"] > self.resurface_after
+
+    def _fetch_rows(self, keys: List[str]) -> Dict[str, Dict[str, Optional[float]]]:
+        rows: Dict[str, Dict[str, Optional[float]]] = {}
+        conn = self._connect()
+        # SQLite 바인딩 변수 개수 제한을 피하기 위해 나눠서 조회합니다.
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            for key, last_seen, last_reported in conn.execute(
+                f"SELECT url_key, last_seen, last_reported FROM seen WHERE url_key IN ({placeholders})", chunk
+            ):
+                rows[key] = {"last_seen": last_seen, "last_reported": last_reported}
+        return rows
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
@@ -0,0 +1,146 @@
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type
+
+import aiohttp
+
+from scrapper.items import CollectedItem
+from scrapper.utils.logger import logger
+
+if TYPE_CHECKING:
+    from scrapper.collectors import DataCollector
+
+
+class Source:
+    """
+    수집 소스 플러그인의 기본 클래스입니다.
+    - name: 결과 딕셔너리의 키이자 레지스트리 이름
+    - config_key: CONFIG에서 이 소스의 설정을 읽을 키 (default_config와 병합됨)
+    - required_keys: 소스가 켜져 있을 때 비어 있으면 안 되는 설정 키
+    - rate_limits: 호스트별 동시성/속도 요구사항 (RATE_LIMIT_CONFIG에 없는 호스트에만 적용)
+    - time_budget: 소스 하나에 허용하는 최대 수집 시간(초), 설정의 "time_budget"으로 덮어쓸 수 있음
+    새 소스는 이 클래스를 상속하고 @register_source를 붙이면 DataCollector가 자동으로 수집합니다.
+    collect()는 CollectedItem 목록을 반환합니다. dict를 반환하면 DataCollector가 CollectedItem으로 변환합니다.
+    """
+
+    name: str = ""
+    config_key: Optional[str] = None
+    default_config: Dict[str, Any] = {}
+    required_keys: Tuple[str, ...] = ()
+    rate_limits: Dict[str, Dict[str, float]] = {}
+    time_budget: float = 30.0
+    enabled_by_default: bool = False
+
+    def __init__(self, collector: "DataCollector", config: Dict[str, Any]):
+        self.collector = collector
+        self.config = {**self.default_config, **(config.get(self.config_key, {}) if self.config_key else {})}
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.config.get("enabled", self.enabled_by_default))
+
+    @property
+    def budget(self) -> float:
+        return float(self.config.get("time_budget", self.time_budget))
+
+    def validate(self) -> List[str]:
+        """설정에서 켜진 소스의 필수 키 중 비어 있는 것들을 반환합니다."""
+        if not self.config.get("enabled"):
+            return []
+        return [key for key in self.required_keys if not self.config.get(key)]
+
+    async def collect(self, session: aiohttp.ClientSession) -> List[CollectedItem]:
+        raise NotImplementedError
+
+
+SOURCE_REGISTRY: Dict[str, Type[Source]] = {}
+
+
+def register_source(source_class: Type[Source]) -> Type[Source]:
+    """소스 클래스를 레지스트리에 등록하는 데코레이터입니다."""
+    if not source_class.name:
+        raise ValueError(f"{source_class.__name__}에 name이 지정되지 않았습니다.")
+    SOURCE_REGISTRY[source_class.name] = source_class
+    return source_class
+
+
+def load_plugin_modules(module_names: List[str]) -> None:
+    """COLLECTION_CONFIG["plugin_modules"]에 적힌 모듈을 불러와 소스를 등록합니다."""
+    for module_name in module_names:
+        try:
+            importlib.import_module(module_name)
+        except ImportError as e:
+            logger.warning(f"소스 플러그인 모듈 {module_name}을 불러오지 못했습니다: {e}")
+
+
+# --- 기본 소스 ---
+
+@register_source
+class RssSource(Source):
+    name = "rss"
+    time_budget = 30.0
+    enabled_by_default = True
+
+    async def collect(self, session: aiohttp.ClientSession) -> List[CollectedItem]:
+        return await self.collector._collect_rss_feeds(session)
+
+
+@register_source
+class RedditSource(Source):
+    name = "reddit"
+    config_key = "REDDIT_CONFIG"
+    required_keys = ("client_id", "client_secret", "user_agent")
+    time_budget = 45.0
+    enabled_by_default = True
+
+    async def collect(self, session: aiohttp.ClientSession) -> List[CollectedItem]:
+        return await self.collector._collect_reddit()
+
+
+@register_source
+class HackerNewsSource(Source):
+    name = "hackernews"
+    config_key = "HN_CONFIG"
+    time_budget = 45.0
+    enabled_by_default = True
+
+    async def collect(self, session: aiohttp.ClientSession) -> List[CollectedItem]:
+        return await self.collector._collect_hackernews(session)
+
+
+@register_source
+class GithubSource(Source):
+    name = "github"
+    config_key = "GITHUB_CONFIG"
+    time_budget = 60.0
+    enabled_by_default = True
+
+    async def collect(self, session: aiohttp.ClientSession) -> List[CollectedItem]:
+        return await self.collector._collect_github_trending(session)
+
+
+# --- 선택 소스 ---
+
+@register_source
+class LobstersSource(Source):
+    """Lobsters(lobste.rs)의 hottest 목록을 수집합니다. LOBSTERS_CONFIG["enabled"]로 켭니다."""
+
+    name = "lobsters"
+    config_key = "LOBSTERS_CONFIG"
+    default_config = {"url": "https://lobste.rs/hottest.json", "min_score": 5, "limit": 15}
+    rate_limits = {"lobste.rs": {"max_concurrency": 1, "rate": 1, "burst": 1}}
+    time_budget = 20.0
+
+    async def collect(self, session: aiohttp.ClientSession) -> List[CollectedItem]:
+        stories = await self.collector._fetch_json(session, self.config["url"], source=self.name) or []
+        items = []
+        for story in stories:
+            match = self.collector._match_content(story.get("title", "") + " " + " ".join(story.get("tags", [])))
+            if match.relevant and story.get("score", 0) >= self.config["min_score"]:
+                items.append(CollectedItem(
+                    title=story.get("title", ""),
+                    url=story.get("url") or story.get("comments_url", ""),
+                    score=story.get("score", 0),
+                    source="Lobsters",
+                    category=match.category,
+                ))
+        return items[:self.config["limit"]]
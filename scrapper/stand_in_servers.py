@@ -0,0 +1,167 @@
+import asyncio
+import json
+import random
+import time
+import zlib
+from typing import Any, Dict, List, NamedTuple, Optional
+from xml.sax.saxutils import escape
+
+from aiohttp import web
+
+_TOPICS = [
+    "React Server Components", "CSS container queries", "TypeScript 5 decorators", "LLM agents in the browser",
+    "Svelte runes", "Next.js caching", "Web performance budgets", "Tailwind v4 engine",
+    "Vue vapor mode", "JavaScript signals proposal", "Shadow DOM styling", "AI code generation tools",
+    "Gardening tips", "Kubernetes cost report", "Rust embedded HAL", "Quarterly earnings call",
+]
+
+
+class StandInProfile(NamedTuple):
+    """스탠드인 서비스 하나의 동작 설정입니다."""
+    latency: float = 0.0        # 응답 전 기본 지연(초)
+    jitter: float = 0.0         # 기본 지연에 더할 무작위 지연의 최댓값(초)
+    error_rate: float = 0.0     # 503으로 응답할 확률
+    items: int = 20             # 응답 하나에 담을 항목 수
+    payload_bytes: int = 0      # 항목마다 본문에 덧붙일 바이트 수
+
+
+class StandInServers:
+    """
+    RSS, Hacker News, GitHub 검색, Reddit API를 흉내 내는 로컬 aiohttp 서버입니다.
+    - 서비스별로 지연, 오류율, 항목 수, 페이로드 크기를 StandInProfile로 조절합니다.
+    - 한 포트에서 모든 서비스를 제공하며, config_for()가 수집기 설정을 이 서버로 향하게 바꿔 줍니다.
+    - 같은 seed면 같은 데이터와 같은 오류 순서를 만듭니다.
+    """
+
+    SERVICES = ("rss", "hackernews", "github", "reddit")
+
+    def __init__(self, profiles: Optional[Dict[str, StandInProfile]] = None, seed: int = 0,
+                 host: str = "127.0.0.1", port: int = 0):
+        self.profiles = {service: (profiles or {}).get(service, StandInProfile()) for service in self.SERVICES}
+        self.host = host
+        self.port = port
+        self._random = random.Random(seed)
+        self._runner: Optional[web.AppRunner] = None
+        self.request_counts: Dict[str, int] = {service: 0 for service in self.SERVICES}
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    async def start(self) -> "StandInServers":
+        app = web.Application()
+        app.router.add_get("/rss/{feed}.xml", self._rss)
+        app.router.add_get("/hn/v0/topstories.json", self._hn_top)
+        app.router.add_get("/hn/v0/item/{item_id}.json", self._hn_item)
+        app.router.add_get("/github/search/repositories", self._github_search)
+        app.router.add_post("/api/v1/access_token", self._reddit_token)
+        app.router.add_get("/r/{names}/top", self._reddit_top)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> "StandInServers":
+        return await self.start()
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.stop()
+
+    def config_for(self, config: Dict[str, Any], rss_feeds: int = 5) -> Dict[str, Any]:
+        """주어진 설정의 수집 소스가 모두 스탠드인 서버를 보도록 바꾼 설정을 반환합니다."""
+        return {
+            **config,
+            "RSS_FEEDS": [f"{self.base_url}/rss/{index}.xml" for index in range(rss_feeds)],
+            "HN_CONFIG": {**config.get("HN_CONFIG", {}), "enabled": True, "base_url": f"{self.base_url}/hn/v0"},
+            "GITHUB_CONFIG": {**config.get("GITHUB_CONFIG", {}), "enabled": True, "api_url": f"{self.base_url}/github"},
+            "REDDIT_CONFIG": {
+                **config.get("REDDIT_CONFIG", {}), "enabled": True,
+                "client_id": "stand-in", "client_secret": "stand-in", "user_agent": "stand-in/1.0",
+                "oauth_url": self.base_url, "reddit_url": self.base_url,
+            },
+        }
+
+    # --- 공통 ---
+
+    async def _respond(self, service: str, body: str, content_type: str = "application/json") -> web.Response:
+        profile = self.profiles[service]
+        self.request_counts[service] += 1
+        delay = profile.latency + (self._random.uniform(0, profile.jitter) if profile.jitter else 0)
+        if delay:
+            await asyncio.sleep(delay)
+        if profile.error_rate and self._random.random() < profile.error_rate:
+            return web.Response(status=503, text="stand-in error")
+        return web.Response(text=body, content_type=content_type)
+
+    def _title(self, service: str, index: int) -> str:
+        return f"{_TOPICS[(index + self.SERVICES.index(service) * 3) % len(_TOPICS)]} #{index}"
+
+    def _padding(self, service: str) -> str:
+        return "x" * self.profiles[service].payload_bytes
+
+    # --- 서비스별 핸들러 ---
+
+    async def _rss(self, request: web.Request) -> web.Response:
+        feed = request.match_info["feed"]
+        items = "".join(
+            f"<item><title>{escape(self._title('rss', index))}</title>"
+            f"<link>{self.base_url}/posts/{feed}/{index}</link>"
+            f"<description>{escape(self._title('rss', index + 1) + ' ' + self._padding('rss'))}</description></item>"
+            for index in range(self.profiles["rss"].items)
+        )
+        body = f'<?xml version="1.0"?><rss version="2.0"><channel><title>Stand-in feed {feed}</title>{items}</channel></rss>'
+        return await self._respond("rss", body, "application/rss+xml")
+
+    async def _hn_top(self, request: web.Request) -> web.Response:
+        return await self._respond("hackernews", json.dumps(list(range(1, self.profiles["hackernews"].items + 1))))
+
+    async def _hn_item(self, request: web.Request) -> web.Response:
+        item_id = int(request.match_info["item_id"])
+        body = {
+            "id": item_id, "type": "story", "title": self._title("hackernews", item_id),
+            "url": f"{self.base_url}/hn-story/{item_id}", "score": 40 + (item_id * 37) % 200,
+            "text": self._padding("hackernews"),
+        }
+        return await self._respond("hackernews", json.dumps(body))
+
+    async def _github_search(self, request: web.Request) -> web.Response:
+        query = request.query.get("q", "")
+        query_id = zlib.crc32(query.encode("utf-8")) % 1000
+        per_page = int(request.query.get("per_page", 30))
+        start = (int(request.query.get("page", 1)) - 1) * per_page
+        total = self.profiles["github"].items
+        items = [{
+            "name": f"repo-{query_id}-{index}",
+            "html_url": f"{self.base_url}/gh/{query_id}/{index}",
+            "stargazers_count": 1000 - index * 13,
+            "description": self._title("github", index) + " " + self._padding("github"),
+            "language": query.split()[0].partition(":")[2] if query else "",
+        } for index in range(start, min(start + per_page, total))]
+        return await self._respond("github", json.dumps({"total_count": total, "items": items}))
+
+    async def _reddit_token(self, request: web.Request) -> web.Response:
+        body = {"access_token": "stand-in-token", "token_type": "bearer", "expires_in": 3600, "scope": "*"}
+        return await self._respond("reddit", json.dumps(body))
+
+    async def _reddit_top(self, request: web.Request) -> web.Response:
+        subreddits = request.match_info["names"].split("+")
+        limit = min(int(request.query.get("limit", 25)), self.profiles["reddit"].items)
+        children: List[Dict[str, Any]] = []
+        for index in range(limit):
+            subreddit = subreddits[index % len(subreddits)]
+            post_id = f"{subreddit.lower()}{index}"
+            children.append({"kind": "t3", "data": {
+                "id": post_id, "name": f"t3_{post_id}", "title": self._title("reddit", index),
+                "selftext": self._padding("reddit"), "score": 500 - index * 7,
+                "permalink": f"/r/{subreddit}/comments/{post_id}/", "subreddit": subreddit,
+                "subreddit_name_prefixed": f"r/{subreddit}", "created_utc": time.time(),
+            }})
+        body = {"kind": "Listing", "data": {"children": children, "after": None, "before": None}}
+        return await self._respond("reddit", json.dumps(body))
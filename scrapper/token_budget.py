@@ -0,0 +1,76 @@
+import math
+import re
+from typing import List
+
+# 영문/코드는 대략 4글자당 1토큰, 한글 등 비ASCII 문자는 글자당 1토큰으로 어림합니다.
+_ASCII_CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """토크나이저 없이 프롬프트 토큰 수를 보수적으로 추정합니다."""
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return math.ceil(ascii_chars / _ASCII_CHARS_PER_TOKEN) + (len(text) - ascii_chars)
+
+
+def split_text(text: str, budget: int) -> List[str]:
+    """
+    텍스트를 budget 토큰 이하 조각으로 나눕니다. 줄 단위로 묶고, 한 줄이 budget을 넘으면 단어, 그다음 글자 단위로 자릅니다.
+    조각을 이어 붙이면 (줄바꿈/공백을 제외한) 원문이 그대로 복원되며, 버려지는 내용은 없습니다.
+    """
+    return chunk_lines(text.splitlines(), budget)
+
+
+def chunk_lines(lines: List[str], budget: int) -> List[str]:
+    """줄 목록을 budget 토큰 이하 덩어리로 순서대로 묶습니다. 빈 줄은 건너뜁니다."""
+    budget = max(budget, 1)
+    chunks: List[str] = []
+    current: List[str] = []
+    used = 0
+    for line in lines:
+        if not line.strip():
+            continue
+        for piece in _split_line(line, budget):
+            cost = estimate_tokens(piece) + 1  # 줄바꿈
+            if current and used + cost > budget:
+                chunks.append("\n".join(current))
+                current, used = [], 0
+            current.append(piece)
+            used += cost
+    if current:
+        chunks.append("\n".join(current))
+    return chunks
+
+
+def _split_line(line: str, budget: int) -> List[str]:
+    if estimate_tokens(line) < budget:
+        return [line]
+    pieces: List[str] = []
+    current = ""
+    for word in re.findall(r"\S+\s*", line):
+        while estimate_tokens(word) >= budget:
+            # 공백 없이 긴 단어(URL, 한글 문장 등)는 글자 단위로 자릅니다.
+            cut = _max_prefix(word, budget - 1)
+            if current:
+                pieces.append(current.rstrip())
+                current = ""
+            pieces.append(word[:cut])
+            word = word[cut:]
+        if current and estimate_tokens(current + word) >= budget:
+            pieces.append(current.rstrip())
+            current = ""
+        current += word
+    if current.strip():
+        pieces.append(current.rstrip())
+    return pieces
+
+
+def _max_prefix(text: str, budget: int) -> int:
+    """estimate_tokens(text[:n]) <= budget 인 가장 큰 n (최소 1)"""
+    low, high = 1, len(text)
+    while low < high:
+        mid = (low + high + 1) // 2
+        if estimate_tokens(text[:mid]) <= budget:
+            low = mid
+        else:
+            high = mid - 1
+    return low
@@ -1,73 +1,156 @@
 import asyncio
 import aiohttp
-from bs4 import BeautifulSoup
+import json
 import re
-from typing import List, Dict, Optional
+from html.parser import HTMLParser
+from typing import AsyncIterator, List, Dict, Optional
 from datetime import datetime
 
+from scrapper.http_cache import HttpCache
+from scrapper.http_client import HttpClientManager, get_http_client
+from scrapper.rate_limiter import RateLimiter
 from scrapper.utils.logger import logger
 
+
+class _BlockquoteTextParser(HTMLParser):
+    """첫 번째 <blockquote> 안의 텍스트만 모으는 스트리밍 파서입니다. 링크(<a>) 안의 텍스트는 버립니다."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts: List[str] = []
+        self._quote_depth = 0
+        self._link_depth = 0
+        self.done = False
+
+    def handle_starttag(self, tag, attrs):
+        if self.done:
+            return
+        if tag == "blockquote":
+            self._quote_depth += 1
+        elif tag == "a" and self._quote_depth:
+            self._link_depth += 1
+        elif tag == "br" and self._quote_depth:
+            self.parts.append(" ")
+
+    def handle_endtag(self, tag):
+        if self.done:
+            return
+        if tag == "blockquote" and self._quote_depth:
+            self._quote_depth -= 1
+            self.done = self._quote_depth == 0
+        elif tag == "a" and self._link_depth:
+            self._link_depth -= 1
+
+    def handle_data(self, data):
+        if self._quote_depth and not self._link_depth and not self.done:
+            self.parts.append(data)
+
+
+def extract_tweet_text(html: str) -> str:
+    """Embed HTML에서 순수 텍스트만 추출합니다. 트리를 만들지 않고 blockquote 구간만 훑습니다."""
+    parser = _BlockquoteTextParser()
+    parser.feed(html)
+    tweet_text = re.sub(r"\s+", " ", "".join(parser.parts)).strip()
+    return re.sub(r'—\s*$', '', tweet_text).strip()
+
+
 class XEmbedCollector:
-    """X(Twitter) Embed API를 활용하여 트윗을 비동기적으로 수집합니다."""
+    """
+    X(Twitter) Embed API를 활용하여 트윗을 비동기적으로 수집합니다.
+    - oEmbed 응답은 디스크 캐시(oembed_cache)에 cache_ttl 동안 보관하여 같은 트윗을 다시 요청하지 않습니다.
+    - max_concurrency개의 작업자가 URL 큐를 나눠 처리하므로 URL이 수백 개여도 요청이 한꺼번에 몰리지 않습니다.
+    - DataCollector와 함께 쓸 때는 collector.rate_limiter를 넘겨 같은 호스트별 요청 예산을 공유합니다.
+    """
 
-    def __init__(self, config: Dict):
+    def __init__(self, config: Dict, http_client: Optional[HttpClientManager] = None,
+                 rate_limiter: Optional[RateLimiter] = None):
         self.config = config.get("X_CONFIG", {})
+        self.http_client = http_client or get_http_client(config)
         self.base_url = "https://publish.twitter.com/oembed"
         self.monitor_sites = self.config.get("monitor_sites", [])
+        self.max_urls = self.config.get("max_urls", 300)
+        self.max_concurrency = self.config.get("max_concurrency", 8)
+        self.cache_ttl = self.config.get("cache_ttl", 7 * 24 * 3600)
+        self.http_cache = HttpCache.from_config(config, cache_name="oembed_cache")
+        self.rate_limiter = rate_limiter or RateLimiter(config.get("RATE_LIMIT_CONFIG"))
 
     async def collect_tweets(self, urls: List[str]) -> List[Dict]:
         """주어진 URL 목록에서 트윗 상세 정보를 비동기적으로 수집합니다."""
         logger.info(f"  🔍 {len(urls)}개의 트윗 URL에서 정보 수집 중...")
-        unique_urls = list(set(urls))
-
-        async with aiohttp.ClientSession() as session:
-            tasks = [self._get_tweet_data(session, url) for url in unique_urls[:30]] # 최대 30개로 제한
-            results = await asyncio.gather(*tasks)
-        
-        tweets = [data for data in results if data] # None이 아닌 결과만 필터링
-        
-        # 관련성 점수 계산 및 필터링
-        for tweet in tweets:
+        relevant_tweets = []
+        async for tweet in self.stream_tweets(urls):
+            # 관련성 점수 계산 및 필터링
             tweet['relevance_score'] = self._calculate_relevance(tweet['text'])
-        
-        relevant_tweets = [t for t in tweets if t['relevance_score'] > 0.3]
+            if tweet['relevance_score'] > 0.3:
+                relevant_tweets.append(tweet)
         relevant_tweets.sort(key=lambda x: x['relevance_score'], reverse=True)
-        
+
         logger.info(f"  ✅ {len(relevant_tweets)}개의 관련 트윗 수집 완료.")
         return relevant_tweets[:20] # 상위 20개 반환
 
+    async def stream_tweets(self, urls: List[str]) -> AsyncIterator[Dict]:
+        """중복을 제거한 최대 max_urls개의 URL을 제한된 동시성으로 조회하며, 끝난 순서대로 트윗을 내보냅니다."""
+        unique_urls = list(dict.fromkeys(urls))[:self.max_urls]
+        pending: asyncio.Queue = asyncio.Queue()
+        for url in unique_urls:
+            pending.put_nowait(url)
+        results: asyncio.Queue = asyncio.Queue()
+        session = await self.http_client.get_session()
+
+        async def worker():
+            while True:
+                try:
+                    url = pending.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                await results.put(await self._get_tweet_data(session, url))
+
+        workers = [asyncio.create_task(worker()) for _ in range(min(self.max_concurrency, len(unique_urls)))]
+        try:
+            for _ in unique_urls:
+                tweet = await results.get()
+                if tweet:
+                    yield tweet
+        finally:
+            for task in workers:
+                task.cancel()
+            if self.http_cache:
+                self.http_cache.save()
+
     async def _get_tweet_data(self, session: aiohttp.ClientSession, tweet_url: str) -> Optional[Dict]:
-        """Embed API를 통해 단일 트윗의 상세 정보를 가져옵니다."""
+        """Embed API를 통해 단일 트윗의 상세 정보를 가져옵니다. 캐시된 oEmbed 응답이 있으면 요청하지 않습니다."""
         params = {"url": tweet_url, "omit_script": "true", "dnt": "true", "lang": "ko"}
         try:
-            async with session.get(self.base_url, params=params, timeout=5) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    soup = BeautifulSoup(data['html'], 'html.parser')
-                    tweet_text = self._extract_text_from_html(soup)
-                    return {
-                        "url": data['url'],
-                        "author_name": data['author_name'],
-                        "text": tweet_text,
-                        "timestamp": datetime.now().isoformat()
-                    }
+            body = await self._fetch_oembed(session, params)
+            if body is None:
+                return None
+            data = json.loads(body)
+            return {
+                "url": data['url'],
+                "author_name": data['author_name'],
+                "text": extract_tweet_text(data['html']),
+                "timestamp": datetime.now().isoformat()
+            }
         except Exception:
             # 개별 트윗 실패는 로그를 남기지 않음 (너무 많을 수 있음)
-            pass
-        return None
-
-    def _extract_text_from_html(self, soup: BeautifulSoup) -> str:
-        """Embed HTML에서 순수 텍스트만 추출합니다."""
-        blockquote = soup.find('blockquote')
-        if not blockquote:
-            return ""
-        
-        # 링크와 시간 정보 제거
-        for a in blockquote.find_all('a'):
-            a.decompose()
-        
-        tweet_text = blockquote.get_text(strip=True)
-        return re.sub(r'—\s*$', '', tweet_text).strip()
+            return None
+
+    async def _fetch_oembed(self, session: aiohttp.ClientSession, params: Dict[str, str]) -> Optional[str]:
+        entry = self.http_cache.lookup(self.base_url, params) if self.http_cache else None
+        if entry and self.http_cache.is_fresh(entry):
+            body = self.http_cache.read_body(entry)
+            if body is not None:
+                return body
+
+        async with self.rate_limiter.limit(self.base_url):
+            async with session.get(self.base_url, params=params, timeout=self.http_client.timeout_for("x_embed")) as response:
+                self.rate_limiter.observe(self.base_url, response.status, response.headers)
+                if response.status != 200:
+                    return None
+                body = await response.text()
+        if self.http_cache:
+            self.http_cache.store(self.base_url, params, {}, body, ttl=self.cache_ttl)
+        return body
 
     def _calculate_relevance(self, text: str) -> float:
         """키워드 기반으로 트윗의 관련성 점수를 계산합니다."""
@@ -75,10 +158,10 @@ class XEmbedCollector:
         text_lower = text.lower()
         high_value = ['css', 'react', 'ai', 'gpt', 'vue', 'tailwind', 'next.js']
         medium_value = ['web', 'development', 'javascript', 'frontend', 'design']
-        
+
         for keyword in high_value:
             if keyword in text_lower: score += 0.3
         for keyword in medium_value:
             if keyword in text_lower: score += 0.1
-            
-        return min(score, 1.0)
\ No newline at end of file
+
+        return min(score, 1.0)
@@ -0,0 +1,85 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from scrapper.agent_graph import AgentGraph, Stage
+from scrapper.multi_agent_system import NewMultiAgentOrchestrator
+
+
+def _stage(name, events, delay=0.0, inputs=(), outputs=(), fail=False, timeout=None):
+    async def run(output):
+        events.append(f"{name}:start")
+        await asyncio.sleep(delay)
+        if fail:
+            raise RuntimeError(f"{name} 실패")
+        for field in outputs:
+            setattr(output, field, name)
+        events.append(f"{name}:end")
+    return Stage(name, run, inputs=inputs, outputs=outputs, timeout=timeout)
+
+
+@pytest.mark.asyncio
+async def test_independent_stages_run_concurrently_in_dependency_order():
+    """선언된 입력/출력 순서를 지키면서, 독립 단계(code_review)는 처음부터 동시에 실행되는지 테스트합니다."""
+    events = []
+    graph = AgentGraph([
+        _stage("collect", events, 0.05, outputs=("data",)),
+        _stage("analyze", events, 0.05, inputs=("data",), outputs=("analysis",)),
+        _stage("email", events, 0.0, inputs=("analysis", "data"), outputs=("email",)),
+        _stage("code_review", events, 0.15, outputs=("review",)),
+    ])
+    output = SimpleNamespace()
+
+    started = time.perf_counter()
+    status = await graph.run(output)
+
+    assert time.perf_counter() - started < 0.25
+    assert events.index("collect:end") < events.index("analyze:start") < events.index("analyze:end") < events.index("email:start")
+    assert events.index("code_review:start") < events.index("collect:end")
+    assert events.index("email:end") < events.index("code_review:end")
+    assert output.email == "email" and output.review == "code_review"
+    assert all(s["status"] == "ok" and s["elapsed"] >= 0 for s in status.values())
+
+
+@pytest.mark.asyncio
+async def test_failures_and_timeouts_only_affect_dependents():
+    events = []
+    graph = AgentGraph([
+        _stage("collect", events, outputs=("data",)),
+        _stage("analyze", events, inputs=("data",), outputs=("analysis",), fail=True),
+        _stage("email", events, inputs=("analysis",)),
+        _stage("code_review", events, 1.0, timeout=0.05),
+        _stage("archive", events, inputs=("data",)),
+    ])
+
+    status = await graph.run(SimpleNamespace())
+
+    assert status["collect"]["status"] == "ok" and status["archive"]["status"] == "ok"
+    assert status["analyze"]["status"] == "error"
+    assert status["email"]["status"] == "skipped" and "email:start" not in events
+    assert status["code_review"]["status"] == "timeout"
+
+
+def test_graph_rejects_cycles_and_duplicate_outputs():
+    noop = lambda output: asyncio.sleep(0)
+    with pytest.raises(ValueError):
+        AgentGraph([Stage("a", noop, inputs=("y",), outputs=("x",)), Stage("b", noop, inputs=("x",), outputs=("y",))])
+    with pytest.raises(ValueError):
+        AgentGraph([Stage("a", noop, outputs=("x",)), Stage("b", noop, outputs=("x",))])
+
+
+@pytest.mark.asyncio
+async def test_keyword_update_reads_nested_suggestions():
+    """keyword_suggestions 아래에 있는 제안 키워드로 설정을 업데이트하는지 테스트합니다."""
+    orchestrator = NewMultiAgentOrchestrator.__new__(NewMultiAgentOrchestrator)
+    calls = []
+    orchestrator.update_keywords = lambda new, deprecated: calls.append((new, deprecated))
+    output = SimpleNamespace(analysis_result={
+        "keyword_suggestions": {"suggested_keywords": ["popover"], "deprecated_keywords": ["jquery"]},
+    })
+
+    await orchestrator._update_keywords_stage(output)
+
+    assert calls == [(["popover"], ["jquery"])]
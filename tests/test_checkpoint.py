@@ -0,0 +1,104 @@
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from scrapper.checkpoint import CheckpointStore
+from scrapper.multi_agent_system import AgentOutput, NewMultiAgentOrchestrator
+
+
+def test_store_round_trips_and_prunes_old_runs(tmp_path):
+    store = CheckpointStore(str(tmp_path), keep_runs=2)
+    store.save("run-1", "collect", {"raw_collected_data": {"rss": [{"title": "한글 제목"}]}})
+    store.save("run-2", "collect", {})
+    store.save("run-2", "email", {"email_html": "<p>x</p>", "email_sent": False}, complete=False)
+
+    loaded = store.load("run-2")
+    assert loaded["email"]["fields"]["email_html"] == "<p>x</p>" and not loaded["email"]["complete"]
+    assert store.load("run-1")["collect"]["fields"]["raw_collected_data"]["rss"][0]["title"] == "한글 제목"
+
+    store.new_run_id()
+    assert store.list_runs() == ["run-2"]
+    with pytest.raises(FileNotFoundError):
+        store.load("run-1")
+
+
+class FakeAgent:
+    def __init__(self, calls, name, apply):
+        self.calls, self.name, self.apply = calls, name, apply
+
+    async def run(self, output):
+        self.calls.append(self.name)
+        self.apply(output)
+        return output
+
+
+class FakeCollector:
+    def __init__(self, calls, filter_ok=True):
+        self.calls, self.filter_ok = calls, filter_ok
+
+    async def collect(self, output):
+        self.calls.append("collect")
+        output.raw_collected_data = {"rss": [{"title": "a"}]}
+
+    async def filter(self, output):
+        self.calls.append("filter")
+        output.filter_candidates = ["https://example.com/a"]
+        output.intelligent_filtered_data = (
+            {"relevant_items": [{"title": "a"}]} if self.filter_ok else {"error": "quota", "relevant_items": []}
+        )
+
+
+def _orchestrator(tmp_path, calls, send_ok, filter_ok=True):
+    orchestrator = NewMultiAgentOrchestrator.__new__(NewMultiAgentOrchestrator)
+    orchestrator.config = {}
+    orchestrator.checkpoints = CheckpointStore(str(tmp_path))
+    orchestrator.run_id = None
+    orchestrator.key_pool = None
+    orchestrator.update_keywords = lambda new, deprecated: calls.append("update_keywords")
+
+    def email(output):
+        output.email_html = output.email_html or "<p>본문</p>"
+        output.email_sent = send_ok
+
+    orchestrator.collector = FakeCollector(calls, filter_ok)
+    orchestrator.analyzer = FakeAgent(calls, "analyze", lambda o: setattr(o, "analysis_result", {"executive_summary": "요약"}))
+    orchestrator.emailer = FakeAgent(calls, "email", email)
+    orchestrator.code_reviewer = FakeAgent(calls, "code_review", lambda o: setattr(o, "code_review_report", "ok"))
+    return orchestrator
+
+
+@pytest.mark.asyncio
+async def test_resume_restarts_from_first_incomplete_stage(tmp_path):
+    """이메일 발송이 실패한 실행을 재개하면 수집/분석은 다시 하지 않고 이메일 단계만 다시 실행하는지 테스트합니다."""
+    calls = []
+    first = _orchestrator(tmp_path, calls, send_ok=False)
+    await first.run_weekly_analysis()
+    assert first.last_run_status["email"]["status"] == "ok"
+
+    calls.clear()
+    second = _orchestrator(tmp_path, calls, send_ok=True)
+    output = await second.run_weekly_analysis(resume_run_id="latest")
+
+    assert calls == ["email"]
+    assert second.run_id == first.run_id
+    assert output.email_html == "<p>본문</p>" and output.email_sent
+    assert output.analysis_result == {"executive_summary": "요약"}
+    assert second.last_run_status["collect"]["status"] == "restored"
+
+
+@pytest.mark.asyncio
+async def test_resume_after_filter_failure_keeps_collected_data(tmp_path):
+    """필터링(LLM 한도 등)이 실패한 실행을 재개하면 다시 수집하지 않고 필터 단계부터 실행하는지 테스트합니다."""
+    calls = []
+    first = _orchestrator(tmp_path, calls, send_ok=True, filter_ok=False)
+    await first.run_weekly_analysis()
+    assert "collect" in calls
+
+    calls.clear()
+    second = _orchestrator(tmp_path, calls, send_ok=True)
+    output = await second.run_weekly_analysis(resume_run_id="latest")
+
+    assert "collect" not in calls and calls[0] == "filter"
+    assert second.last_run_status["collect"]["status"] == "restored"
+    assert output.raw_collected_data["rss"][0].title == "a"
@@ -1,6 +1,20 @@
+import asyncio
+import json
+import time
+
 import pytest
+import pytest_asyncio
 from unittest.mock import MagicMock, patch, AsyncMock
 from scrapper.collectors import DataCollector
+from scrapper.http_cache import HttpCache
+from scrapper.http_client import HttpClientManager
+from scrapper.items import CollectedItem
+from scrapper.parse_executor import ParseExecutor
+from scrapper.rate_limiter import RateLimiter
+from scrapper.resilience import CircuitBreaker
+from scrapper.seen_ledger import SeenLedger, canonicalize_url
+from scrapper.sources import SOURCE_REGISTRY, Source
+from scrapper.x_embed_collector import XEmbedCollector, extract_tweet_text
 
 # 테스트에 사용할 가짜 설정(config) 데이터
 @pytest.fixture
@@ -13,6 +27,12 @@ def mock_config():
         }
     }
 
+@pytest_asyncio.fixture
+async def http_client(mock_config):
+    """테스트가 끝나면 세션을 닫는 HTTP 클라이언트를 반환합니다."""
+    async with HttpClientManager(mock_config) as client:
+        yield client
+
 # --- DataCollector의 내부 함수 테스트 ---
 
 def test_is_relevant_content(mock_config):
@@ -38,15 +58,49 @@ def test_categorize_content(mock_config):
     assert collector._categorize_content("Understanding GPT-4 architecture") == "AI & Machine Learning"
     assert collector._categorize_content("How does Python's GIL work?") == "General Web Development"
 
+def test_keyword_matching_respects_word_boundaries(mock_config):
+    """짧은 키워드가 다른 단어의 일부에 매칭되지 않는지 테스트합니다."""
+    collector = DataCollector(mock_config)
+
+    assert collector._is_relevant_content("Send an email with Python") is False
+    assert collector._is_relevant_content("Building AI-powered search") is True
+    assert collector._categorize_content("Running LLMs locally") == "AI & Machine Learning"
+
+def test_exclude_keywords_match_as_substrings(mock_config):
+    """제외 키워드는 단어 경계 없이 부분 문자열로 매칭되는지 테스트합니다."""
+    mock_config["FILTER_KEYWORDS"]["exclude"].append("crypto")
+    collector = DataCollector(mock_config)
+
+    assert collector._is_relevant_content("React crypto wallet") is False
+    assert collector._is_relevant_content("React cryptocurrency wallet") is False
+    assert collector._is_relevant_content("React jobs board") is False
+
+def test_match_content_returns_keywords_and_category(mock_config):
+    """한 번의 스캔으로 관련성, 매칭 키워드, 카테고리를 모두 반환하는지 테스트합니다."""
+    collector = DataCollector(mock_config)
+    match = collector._match_content("React and CSS tips")
+
+    assert match.relevant is True
+    assert match.matched_keywords == {"react", "css"}
+    assert match.category == "CSS & Design"
+
+def test_matcher_rebuilds_when_keywords_change(mock_config):
+    """키워드 목록이 바뀌면 매처가 자동으로 다시 빌드되는지 테스트합니다."""
+    collector = DataCollector(mock_config)
+    assert collector._is_relevant_content("Svelte 5 runes") is False
+
+    mock_config["FILTER_KEYWORDS"]["must_have_any"].append("svelte")
+    assert collector._is_relevant_content("Svelte 5 runes") is True
+
 # --- DataCollector의 메인 기능 비동기 테스트 ---
 
 @pytest.mark.asyncio
-async def test_collect_all_successful(mock_config):
+async def test_collect_all_successful(mock_config, http_client):
     """
     모든 데이터 소스에서 성공적으로 데이터를 수집하는 시나리오를 테스트합니다.
     - 실제 네트워크 요청 대신, 미리 준비된 가짜 데이터를 반환하도록 설정(Mocking)합니다.
     """
-    collector = DataCollector(mock_config)
+    collector = DataCollector(mock_config, http_client=http_client)
 
     # 각 수집 메서드를 가짜(Mock) 비동기 함수로 대체하여 항상 정해진 값을 반환하도록 설정
     with patch.object(collector, '_collect_rss_feeds', new=AsyncMock(return_value=[{"title": "rss_item"}])) as mock_rss, \
@@ -70,12 +124,12 @@ async def test_collect_all_successful(mock_config):
         mock_github.assert_awaited_once()
 
 @pytest.mark.asyncio
-async def test_collect_all_with_failures(mock_config):
+async def test_collect_all_with_failures(mock_config, http_client):
     """하나의 소스에서 오류가 발생해도 다른 소스는 정상적으로 수집되는지 테스트합니다."""
-    collector = DataCollector(mock_config)
+    collector = DataCollector(mock_config, http_client=http_client)
     
     # Reddit 수집만 실패하도록 설정
-    with patch.object(collector, '_collect_rss_feeds', new=AsyncMock(return_value=[{"title": "rss_item"}])), \
+    with patch.object(collector, '_collect_rss_feeds', new=AsyncMock(return_value=[CollectedItem(title="rss_item")])), \
          patch.object(collector, '_collect_reddit', new=AsyncMock(side_effect=Exception("Reddit API Failed"))), \
          patch.object(collector, '_collect_hackernews', new=AsyncMock(return_value=[{"title": "hn_item"}])), \
          patch.object(collector, '_collect_github_trending', new=AsyncMock(return_value=[{"title": "github_item"}])):
@@ -86,4 +140,633 @@ async def test_collect_all_with_failures(mock_config):
         assert len(result["rss"]) == 1
         assert len(result["hackernews"]) == 1
         assert len(result["github"]) == 1
-        assert len(result["reddit"]) == 0 # 실패한 소스는 빈 리스트여야 함
\ No newline at end of file
+        assert len(result["reddit"]) == 0 # 실패한 소스는 빈 리스트여야 함
+
+# --- HTTP 캐시(조건부 GET) 테스트 ---
+
+class FakeResponse:
+    """aiohttp 응답을 흉내 내는 테스트용 객체"""
+    def __init__(self, status, body="", headers=None):
+        self.status = status
+        self.body = body
+        self.headers = headers or {}
+
+    async def text(self):
+        return self.body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakeSession:
+    """미리 정한 응답을 순서대로 돌려주고, 받은 요청 헤더를 기록합니다."""
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def get(self, url, params=None, headers=None, **kwargs):
+        self.requests.append({"url": url, "params": params, "headers": headers or {}})
+        return self.responses.pop(0)
+
+
+@pytest.fixture
+def cached_config(mock_config, tmp_path):
+    """HTTP 캐시가 활성화된 설정을 반환합니다."""
+    return {
+        **mock_config,
+        "HTTP_CACHE_CONFIG": {"enabled": True, "cache_dir": str(tmp_path / "http_cache"), "default_ttl": 600},
+    }
+
+
+@pytest.mark.asyncio
+async def test_fetch_serves_fresh_cache_without_request(cached_config):
+    """만료 전 캐시 항목은 네트워크 요청 없이 반환되는지 테스트합니다."""
+    collector = DataCollector(cached_config)
+    session = FakeSession([FakeResponse(200, '{"id": 1}', {"Cache-Control": "max-age=60"})])
+
+    assert await collector._fetch_json(session, "https://example.com/item.json") == {"id": 1}
+    assert await collector._fetch_json(session, "https://example.com/item.json") == {"id": 1}
+    assert len(session.requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_fetch_revalidates_with_etag_and_uses_304(cached_config):
+    """만료된 항목은 If-None-Match로 재검증하고 304 응답 시 캐시 본문을 쓰는지 테스트합니다."""
+    collector = DataCollector(cached_config)
+    session = FakeSession([
+        FakeResponse(200, "<rss/>", {"ETag": '"v1"', "Cache-Control": "no-cache"}),
+        FakeResponse(304),
+    ])
+
+    assert await collector._fetch_text(session, "https://example.com/feed") == "<rss/>"
+    assert await collector._fetch_text(session, "https://example.com/feed") == "<rss/>"
+    assert session.requests[1]["headers"]["If-None-Match"] == '"v1"'
+
+
+def test_http_caches_with_shared_cache_dir_keep_separate_indexes(cached_config):
+    """cache_dir를 지정해도 수집기 캐시와 oEmbed 캐시가 서로의 index.json을 덮어쓰지 않는지 테스트합니다."""
+    collector_cache = HttpCache.from_config(cached_config)
+    oembed_cache = HttpCache.from_config(cached_config, cache_name="oembed_cache")
+    assert collector_cache.cache_dir != oembed_cache.cache_dir
+
+
+def test_http_cache_evicts_least_recently_used(tmp_path):
+    """크기 상한을 넘으면 가장 오래 사용되지 않은 항목이 제거되는지 테스트합니다."""
+    cache = HttpCache(str(tmp_path), max_size_bytes=10)
+    cache.store("https://a", None, {}, "12345")
+    cache.store("https://b", None, {}, "12345")
+    cache.lookup("https://a")
+    cache.store("https://c", None, {}, "12345")
+
+    assert cache.lookup("https://a") is not None
+    assert cache.lookup("https://b") is None
+    assert cache.lookup("https://c") is not None
+
+
+# --- 호스트별 속도 제한 테스트 ---
+
+@pytest.mark.asyncio
+async def test_rate_limiter_caps_concurrency_per_host():
+    """같은 호스트로의 동시 요청 수가 max_concurrency를 넘지 않는지 테스트합니다."""
+    limiter = RateLimiter({"default": {"max_concurrency": 2, "rate": 1000, "burst": 1000}})
+    in_flight = 0
+    peak = 0
+
+    async def request():
+        nonlocal in_flight, peak
+        async with limiter.limit("https://hacker-news.firebaseio.com/v0/item/1.json"):
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+    await asyncio.gather(*(request() for _ in range(10)))
+    assert peak == 2
+
+
+def test_rate_limiter_blocks_on_exhausted_quota():
+    """X-RateLimit-Remaining이 0이면 reset 시각까지 호스트가 차단되는지 테스트합니다."""
+    limiter = RateLimiter()
+    reset_at = time.time() + 30
+    limiter.observe("https://api.github.com/search", 200, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(int(reset_at))})
+
+    assert limiter.for_url("https://api.github.com/other").blocked_until == pytest.approx(int(reset_at))
+    assert limiter.for_url("https://example.com").blocked_until == 0
+
+
+# --- Hacker News 증분 수집 테스트 ---
+
+@pytest.fixture
+def hn_config(mock_config, tmp_path):
+    """로컬 아이템 저장소를 쓰는 Hacker News 설정을 반환합니다."""
+    return {
+        **mock_config,
+        "HN_CONFIG": {
+            "enabled": True, "min_score": 0, "story_limit": 2, "batch_size": 2,
+            "item_ttl": 3600, "store_path": str(tmp_path / "hn.sqlite3"),
+        },
+    }
+
+
+def fake_hn_api(story_ids):
+    """topstories와 item 요청에 응답하는 가짜 _fetch_json을 만듭니다."""
+    async def fetch_json(session, url, params=None, source=None):
+        if url.endswith("topstories.json"):
+            return story_ids
+        story_id = int(url.rsplit("/", 1)[1].split(".")[0])
+        return {"id": story_id, "type": "story", "title": f"React tip {story_id}", "score": 100}
+    return AsyncMock(side_effect=fetch_json)
+
+
+@pytest.mark.asyncio
+async def test_hackernews_stops_after_story_limit(hn_config):
+    """story_limit개의 관련 스토리를 찾으면 나머지 아이템은 요청하지 않는지 테스트합니다."""
+    collector = DataCollector(hn_config)
+    fetch_json = fake_hn_api(list(range(1, 11)))
+
+    with patch.object(collector, "_fetch_json", new=fetch_json):
+        stories = await collector._collect_hackernews(session=None)
+
+    assert [s["title"] for s in stories] == ["React tip 1", "React tip 2"]
+    assert fetch_json.await_count == 3  # topstories + 아이템 2개
+
+
+@pytest.mark.asyncio
+async def test_hackernews_reuses_stored_items(hn_config):
+    """TTL 이내에 저장된 아이템은 다음 실행에서 다시 요청하지 않는지 테스트합니다."""
+    await_counts = []
+    for _ in range(2):
+        collector = DataCollector(hn_config)
+        fetch_json = fake_hn_api([1, 2])
+        with patch.object(collector, "_fetch_json", new=fetch_json):
+            stories = await collector._collect_hackernews(session=None)
+        assert len(stories) == 2
+        await_counts.append(fetch_json.await_count)
+        collector.hn_store.close()
+
+    assert await_counts == [3, 1]
+
+
+# --- 스트리밍 수집 테스트 ---
+
+@pytest.mark.asyncio
+async def test_stream_all_yields_sources_as_they_finish(mock_config, http_client):
+    """느린 소스를 기다리지 않고 먼저 끝난 소스부터 내보내는지 테스트합니다."""
+    collector = DataCollector(mock_config, http_client=http_client)
+
+    async def slow_reddit():
+        await asyncio.sleep(0.05)
+        return [{"title": "reddit_item"}]
+
+    with patch.object(collector, '_collect_rss_feeds', new=AsyncMock(return_value=[CollectedItem(title="rss_item")])), \
+         patch.object(collector, '_collect_reddit', new=slow_reddit), \
+         patch.object(collector, '_collect_hackernews', new=AsyncMock(return_value=[])), \
+         patch.object(collector, '_collect_github_trending', new=AsyncMock(return_value=[])):
+
+        order = [source async for source, _ in collector.stream_all()]
+
+    assert order[-1] == "reddit"
+    assert set(order) == {"rss", "reddit", "hackernews", "github"}
+
+
+# --- Reddit 묶음 수집 테스트 ---
+
+class FakePost:
+    def __init__(self, title, score, subreddit):
+        self.title = title
+        self.selftext = ""
+        self.score = score
+        self.permalink = f"/r/{subreddit}/comments/{score}/"
+        self.subreddit_name_prefixed = f"r/{subreddit}"
+
+
+class FakeReddit:
+    """asyncpraw.Reddit을 흉내 내며, 조회한 서브레딧 이름과 OAuth 토큰을 기록합니다."""
+    instances = []
+
+    def __init__(self, **kwargs):
+        self.requested = []
+        authorizer = MagicMock(access_token=None, scopes=None)
+        self._read_only_core = MagicMock(_authorizer=authorizer)
+        FakeReddit.instances.append(self)
+
+    async def subreddit(self, name):
+        self.requested.append(name)
+        self._read_only_core._authorizer.access_token = self._read_only_core._authorizer.access_token or f"token-{len(FakeReddit.instances)}"
+        subreddit = MagicMock()
+
+        async def top(time_filter, limit):
+            for i, sub in enumerate(name.split("+")):
+                yield FakePost(f"React news from {sub}", 100 - i, sub)
+        subreddit.top = top
+        return subreddit
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+@pytest.mark.asyncio
+async def test_reddit_batches_subreddits_and_reuses_token(mock_config):
+    """서브레딧을 묶어서 조회하고, OAuth 토큰을 다음 실행에 재사용하는지 테스트합니다."""
+    config = {
+        **mock_config,
+        "REDDIT_CONFIG": {
+            "enabled": True, "client_id": "id", "client_secret": "secret", "user_agent": "test",
+            "subreddits": ["webdev", "css", "reactjs"], "post_limit": 5, "time_filter": "week",
+            "multireddit_size": 2,
+        },
+    }
+    FakeReddit.instances = []
+    DataCollector._reddit_tokens.clear()
+
+    with patch("scrapper.collectors.asyncpraw.Reddit", FakeReddit):
+        posts = await DataCollector(config)._collect_reddit()
+        await DataCollector(config)._collect_reddit()
+
+    assert FakeReddit.instances[0].requested == ["webdev+css", "reactjs"]
+    assert {p["source"] for p in posts} == {"r/webdev", "r/css", "r/reactjs"}
+    assert FakeReddit.instances[1]._read_only_core._authorizer.access_token == "token-1"
+
+
+@pytest.mark.asyncio
+async def test_reddit_group_keeps_post_limit_per_subreddit(mock_config):
+    """묶음 리스팅을 큰 서브레딧이 채워도 서브레딧마다 post_limit개까지만 쓰고, 밀려난 서브레딧은 따로 조회하는지 테스트합니다."""
+    config = {
+        **mock_config,
+        "REDDIT_CONFIG": {
+            "enabled": True, "client_id": "id", "client_secret": "secret", "user_agent": "test",
+            "subreddits": ["webdev", "css"], "post_limit": 2, "time_filter": "week", "multireddit_size": 2,
+        },
+        "REPORT_CONFIG": {"max_items_per_source": 10},
+    }
+    listings = {
+        "webdev": [FakePost(f"React news {i}", 1000 - i, "webdev") for i in range(10)],
+        "css": [FakePost(f"CSS grid news {i}", 10 - i, "css") for i in range(3)],
+    }
+
+    class CrowdedReddit(FakeReddit):
+        async def subreddit(self, name):
+            self.requested.append(name)
+            merged = sorted((p for sub in name.split("+") for p in listings[sub]), key=lambda p: -p.score)
+            subreddit = MagicMock()
+
+            async def top(time_filter, limit):
+                for post in merged[:limit]:
+                    yield post
+            subreddit.top = top
+            return subreddit
+
+    with patch("scrapper.collectors.asyncpraw.Reddit", CrowdedReddit):
+        collector = DataCollector(config)
+        posts = await collector._collect_reddit()
+
+    assert [p.title for p in posts] == ["React news 0", "React news 1", "CSS grid news 0", "CSS grid news 1"]
+    assert CrowdedReddit.instances[-1].requested == ["webdev+css", "css"]
+
+
+# --- 파싱 풀 테스트 ---
+
+SAMPLE_RSS = """<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Frontend Weekly</title>
+<item><title>New CSS nesting guide</title><link>https://example.com/css</link></item>
+<item><title>Gardening tips</title><link>https://example.com/garden</link></item>
+</channel></rss>"""
+
+
+@pytest.mark.asyncio
+async def test_rss_parsing_runs_in_executor_with_timing(mock_config):
+    """RSS 파싱이 파싱 풀에서 실행되고 작업별 시간이 기록되는지 테스트합니다."""
+    collector = DataCollector(mock_config)
+    collector.parse_executor = ParseExecutor(max_workers=1)
+
+    with patch.object(collector, "_fetch_text", new=AsyncMock(return_value=SAMPLE_RSS)):
+        articles = await collector._fetch_and_parse_rss(session=None, url="https://example.com/feed")
+
+    assert articles == [CollectedItem(
+        title="New CSS nesting guide", url="https://example.com/css",
+        source="Frontend Weekly", category="CSS & Design",
+    )]
+    assert collector.parse_executor.stats["rss"]["count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_parse_stats_cover_only_the_current_run(mock_config, http_client):
+    """공유 파싱 풀의 통계가 수집 실행마다 새로 집계되는지 테스트합니다."""
+    collector = DataCollector(mock_config, http_client=http_client)
+    collector.parse_executor = ParseExecutor(max_workers=1)
+
+    async def parse_rss(*args):
+        await collector.parse_executor.run("rss", str.upper, "feed")
+        return []
+
+    with patch.object(collector, '_collect_rss_feeds', new=parse_rss), \
+         patch.object(collector, '_collect_reddit', new=AsyncMock(return_value=[])), \
+         patch.object(collector, '_collect_hackernews', new=AsyncMock(return_value=[])), \
+         patch.object(collector, '_collect_github_trending', new=AsyncMock(return_value=[])):
+        for _ in range(2):
+            await collector.collect_all()
+            assert collector.parse_executor.stats["rss"]["count"] == 1
+
+
+# --- 수집 장부 테스트 ---
+
+@pytest.mark.parametrize("url, expected", [
+    ("https://www.Example.com/post/?utm_source=x&b=2&a=1#top", "https://example.com/post?a=1&b=2"),
+    ("http://old.reddit.com/r/webdev/comments/Abc123/some_title/", "https://reddit.com/comments/abc123"),
+    ("https://redd.it/abc123", "https://reddit.com/comments/abc123"),
+    ("https://news.ycombinator.com/item?id=42&p=2", "https://news.ycombinator.com/item?id=42"),
+])
+def test_canonicalize_url(url, expected):
+    """추적 파라미터와 퍼머링크 차이를 정규화하는지 테스트합니다."""
+    assert canonicalize_url(url) == expected
+
+
+def test_seen_ledger_forwards_only_new_items(tmp_path):
+    """필터 후보로 올린 항목과 리포트된 항목은 다음 실행에서 제외되는지 테스트합니다."""
+    ledger = SeenLedger(str(tmp_path / "seen.sqlite3"))
+    first = [{"title": "A", "url": "https://example.com/a?utm_medium=rss"}, {"title": "B", "link": "https://example.com/b"}]
+
+    assert ledger.filter_new(first) == first
+    # 수집만 된 항목은 기록되지 않으므로, 리포트 전에 실패한 실행의 항목은 다시 전달됩니다.
+    assert ledger.filter_new(first) == first
+    ledger.mark_offered(["https://example.com/a", "https://example.com/b"])
+    second = ledger.filter_new([{"title": "A", "url": "https://example.com/a"}, {"title": "C", "url": "https://example.com/c"}])
+    assert [item["title"] for item in second] == ["C"]
+
+    # 오래전에 본 항목은 다시 떠오른 것으로 취급하지만, 최근 리포트된 항목은 제외합니다.
+    ledger.resurface_after = -1
+    ledger.mark_reported(["https://example.com/c"])
+    third = ledger.filter_new([{"title": "B", "link": "https://example.com/b"}, {"title": "C", "url": "https://example.com/c"}])
+    assert [item["title"] for item in third] == ["B"]
+
+
+# --- 공유 HTTP 클라이언트 테스트 ---
+
+@pytest.mark.asyncio
+async def test_fetch_uses_per_source_headers(mock_config):
+    """소스별 기본 헤더와 GitHub 인증 헤더가 요청에 붙는지 테스트합니다."""
+    config = {**mock_config, "HTTP_CLIENT_CONFIG": {"sources": {"github": {"headers": {"Accept": "application/vnd.github.v3+json"}}}}}
+    collector = DataCollector(config, http_client=HttpClientManager(config))
+    collector.github_token = "secret"
+    session = FakeSession([FakeResponse(200, "{}"), FakeResponse(200, "{}")])
+
+    await collector._fetch_json(session, "https://api.github.com/search/repositories", source="github")
+    await collector._fetch_json(session, "https://hacker-news.firebaseio.com/v0/topstories.json", source="hackernews")
+
+    assert session.requests[0]["headers"] == {"Accept": "application/vnd.github.v3+json", "Authorization": "token secret"}
+    assert session.requests[1]["headers"] == {}
+
+
+# --- 재시도/서킷 브레이커 테스트 ---
+
+@pytest.mark.asyncio
+async def test_fetch_retries_transient_errors_within_budget(mock_config):
+    """5xx 응답은 백오프 후 재시도하고, 재시도 예산을 넘으면 포기하는지 테스트합니다."""
+    config = {**mock_config, "RETRY_CONFIG": {"default": {"max_attempts": 3, "base_delay": 0, "retry_budget": 2}}}
+    collector = DataCollector(config, http_client=HttpClientManager(config))
+    session = FakeSession([FakeResponse(503), FakeResponse(200, '{"ok": true}')])
+    assert await collector._fetch_json(session, "https://example.com/a.json", source="rss") == {"ok": True}
+    assert len(session.requests) == 2
+
+    # 404는 재시도하지 않습니다.
+    session = FakeSession([FakeResponse(404)])
+    assert await collector._fetch_json(session, "https://example.com/b.json", source="rss") is None
+    assert len(session.requests) == 1
+
+    # 남은 예산은 1회뿐이므로 두 번만 시도합니다.
+    session = FakeSession([FakeResponse(500), FakeResponse(500), FakeResponse(500)])
+    assert await collector._fetch_json(session, "https://example.com/c.json", source="rss") is None
+    assert len(session.requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_skips_failing_feed_and_probes(mock_config, tmp_path, monkeypatch):
+    """연속 실패한 피드는 서킷이 열려 건너뛰고, 쿨다운 뒤 half-open으로 다시 시도하는지 테스트합니다."""
+    state_path = tmp_path / "breakers.json"
+    config = {
+        **mock_config,
+        "RETRY_CONFIG": {"default": {"max_attempts": 1}},
+        "CIRCUIT_BREAKER_CONFIG": {"enabled": True, "failure_threshold": 2, "cooldown_hours": 1, "state_path": str(state_path)},
+    }
+    url = "https://dead.example.com/feed"
+
+    for _ in range(2):
+        collector = DataCollector(config, http_client=HttpClientManager(config))
+        await collector._fetch_text(FakeSession([FakeResponse(500)]), url, source="rss", breaker_key=f"rss:{url}")
+        collector.circuit_breaker.commit_run()
+
+    # 상태가 파일에 저장되어 다음 실행에서도 서킷이 열려 있습니다.
+    collector = DataCollector(config, http_client=HttpClientManager(config))
+    session = FakeSession([])
+    assert await collector._fetch_text(session, url, source="rss", breaker_key=f"rss:{url}") is None
+    assert session.requests == []
+
+    # 쿨다운이 지나면 한 번 시도하고, 성공하면 서킷이 닫힙니다.
+    open_until = CircuitBreaker(str(state_path)).states[f"rss:{url}"]["open_until"]
+    monkeypatch.setattr(time, "time", lambda: open_until + 1)
+    collector = DataCollector(config, http_client=HttpClientManager(config))
+    session = FakeSession([FakeResponse(200, "<rss/>")])
+    assert await collector._fetch_text(session, url, source="rss", breaker_key=f"rss:{url}") == "<rss/>"
+    collector.circuit_breaker.commit_run()
+    assert CircuitBreaker(str(state_path)).states[f"rss:{url}"]["state"] == "closed"
+
+
+# --- 소스 레지스트리/마감 시간 테스트 ---
+
+@pytest.mark.asyncio
+async def test_registered_plugin_source_is_collected(mock_config, http_client, monkeypatch):
+    """레지스트리에 등록된 플러그인 소스가 핵심 루프 수정 없이 수집되는지 테스트합니다."""
+    class NpmSource(Source):
+        name = "npm"
+        config_key = "NPM_CONFIG"
+        required_keys = ("registry",)
+
+        async def collect(self, session):
+            return [{"title": "react 19.1 released", "url": "https://npmjs.com/react"}]
+
+    monkeypatch.setitem(SOURCE_REGISTRY, "npm", NpmSource)
+    empty = AsyncMock(return_value=[])
+    collector = DataCollector({**mock_config, "NPM_CONFIG": {"enabled": True, "registry": "https://registry.npmjs.org"}}, http_client=http_client)
+    with patch.object(collector, '_collect_rss_feeds', new=empty), patch.object(collector, '_collect_reddit', new=empty), \
+         patch.object(collector, '_collect_hackernews', new=empty), patch.object(collector, '_collect_github_trending', new=empty):
+        result = await collector.collect_all()
+
+    assert result["npm"][0]["title"] == "react 19.1 released"
+    assert "lobsters" not in result
+    assert collector.last_run_status["lobsters"]["status"] == "disabled"
+    assert collector.last_run_status["npm"]["status"] == "ok"
+
+    # 켜졌지만 필수 설정이 없는 소스는 건너뜁니다.
+    collector = DataCollector({**mock_config, "NPM_CONFIG": {"enabled": True}}, http_client=http_client)
+    assert [source.validate() for source in collector.sources if source.name == "npm"] == [["registry"]]
+
+
+@pytest.mark.asyncio
+async def test_stream_all_enforces_time_budgets_and_global_deadline(mock_config, http_client):
+    """시간 예산을 넘긴 소스와 전체 마감 시간을 넘긴 소스는 빈 결과와 상태로 보고되는지 테스트합니다."""
+    config = {**mock_config, "HN_CONFIG": {"time_budget": 0.05}, "COLLECTION_CONFIG": {"global_deadline": 0.2}}
+    collector = DataCollector(config, http_client=http_client)
+
+    async def hang(*args):
+        await asyncio.sleep(10)
+        return [{"title": "never"}]
+
+    with patch.object(collector, '_collect_rss_feeds', new=AsyncMock(return_value=[CollectedItem(title="rss_item")])), \
+         patch.object(collector, '_collect_reddit', new=hang), \
+         patch.object(collector, '_collect_hackernews', new=hang), \
+         patch.object(collector, '_collect_github_trending', new=AsyncMock(return_value=[])):
+        started = time.perf_counter()
+        result = await collector.collect_all()
+
+    assert time.perf_counter() - started < 1
+    assert result == {"github": [], "hackernews": [], "reddit": [], "rss": [CollectedItem(title="rss_item")]}
+    assert collector.last_run_status["hackernews"]["status"] == "timeout"
+    assert collector.last_run_status["reddit"]["status"] == "deadline_exceeded"
+    assert collector.last_run_status["rss"] == {"status": "ok", "items": 1, "elapsed": collector.last_run_status["rss"]["elapsed"]}
+
+
+@pytest.mark.asyncio
+async def test_stream_all_keeps_sources_finished_while_consumer_was_busy(mock_config, http_client):
+    """마감 시간 뒤라도 소비자가 앞선 결과를 처리하는 동안 끝난 소스의 결과는 버리지 않는지 테스트합니다."""
+    config = {**mock_config, "COLLECTION_CONFIG": {"global_deadline": 0.15}}
+    collector = DataCollector(config, http_client=http_client)
+
+    async def slow_github(*args):
+        await asyncio.sleep(0.25)
+        return [CollectedItem(title="repo")]
+
+    async def hang(*args):
+        await asyncio.sleep(10)
+
+    with patch.object(collector, '_collect_rss_feeds', new=AsyncMock(return_value=[CollectedItem(title="rss_item")])), \
+         patch.object(collector, '_collect_reddit', new=hang), \
+         patch.object(collector, '_collect_hackernews', new=hang), \
+         patch.object(collector, '_collect_github_trending', new=slow_github):
+        result = {}
+        async for source, items in collector.stream_all():
+            result[source] = items
+            if source == "rss":
+                await asyncio.sleep(0.4)
+
+    assert result["github"] == [CollectedItem(title="repo")]
+    assert result["reddit"] == [] and collector.last_run_status["reddit"]["status"] == "deadline_exceeded"
+
+
+# --- GitHub 묶음 검색 테스트 ---
+
+@pytest.mark.asyncio
+async def test_github_combines_languages_and_paginates_lazily(mock_config):
+    """언어를 OR 검색으로 묶고, 관련 리포지토리가 충분하면 다음 페이지를 요청하지 않는지 테스트합니다."""
+    config = {
+        **mock_config,
+        "GITHUB_CONFIG": {"enabled": True, "languages": ["javascript", "typescript", "css"], "languages_per_query": 2, "per_page": 2},
+        "REPORT_CONFIG": {"max_items_per_source": 3},
+    }
+    collector = DataCollector(config)
+    calls = []
+
+    async def fetch_json(session, url, params=None, source=None, ttl=None):
+        calls.append(params)
+        names = ["react-kit", "css-tricks"] if params["page"] == 1 else ["ai-tools", "spam-bot"]
+        return {"total_count": 40, "items": [
+            {"name": f"{name}-{params['page']}", "html_url": f"https://github.com/x/{name}{params['q'][:12]}",
+             "stargazers_count": 100 - params["page"], "description": "", "language": "x"} for name in names
+        ]}
+
+    with patch.object(collector, "_fetch_json", new=AsyncMock(side_effect=fetch_json)):
+        repos = await collector._collect_github_trending(None)
+
+    queries = sorted({params["q"].split(" created")[0] for params in calls})
+    assert queries == ["language:css", "language:javascript language:typescript"]
+    # 두 묶음 모두 2페이지에서 관련 리포지토리 3개를 채우고 멈춥니다.
+    assert sorted(params["page"] for params in calls) == [1, 1, 2, 2]
+    assert len(repos) == 3
+
+
+def test_rate_limiter_paces_requests_over_remaining_window():
+    """남은 한도와 reset 시각이 오면, 그 창에 맞춰 요청 속도와 버스트를 줄이는지 테스트합니다."""
+    limiter = RateLimiter({"default": {"rate": 10, "burst": 10}})
+    limiter.observe("https://api.github.com/search", 200, {"X-RateLimit-Remaining": "3", "X-RateLimit-Reset": str(time.time() + 60)})
+
+    host = limiter.for_url("https://api.github.com/search")
+    assert host.tokens == 3
+    assert host._current_rate() == pytest.approx(3 / 60, rel=0.05)
+    assert limiter.for_url("https://example.com")._current_rate() == 10
+
+
+# --- X oEmbed 수집 테스트 ---
+
+def test_extract_tweet_text_skips_links_and_trailing_dash():
+    html = ('<blockquote class="twitter-tweet"><p lang="en">New <b>CSS</b> anchor positioning<br>is here '
+            '<a href="https://t.co/x">pic.twitter.com/x</a></p>&mdash; Jane (@jane) '
+            '<a href="https://twitter.com/jane/status/1">May 1, 2024</a></blockquote><p>outside</p>')
+    assert extract_tweet_text(html) == "New CSS anchor positioning is here — Jane (@jane)"
+
+
+@pytest.mark.asyncio
+async def test_x_embed_caches_oembed_and_bounds_concurrency(cached_config, http_client):
+    """oEmbed 응답을 캐시해 재요청하지 않고, 동시 요청 수가 max_concurrency를 넘지 않는지 테스트합니다."""
+    config = {**cached_config, "X_CONFIG": {"max_concurrency": 3}}
+    collector = XEmbedCollector(config, http_client=http_client)
+    in_flight, peak, requested = 0, 0, []
+
+    class SlowResponse(FakeResponse):
+        async def __aenter__(self):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            return self
+
+        async def __aexit__(self, *exc):
+            nonlocal in_flight
+            in_flight -= 1
+
+    class CountingSession:
+        def get(self, url, params=None, **kwargs):
+            requested.append(params["url"])
+            body = json.dumps({"url": params["url"], "author_name": "a", "html": "<blockquote>React and CSS tips</blockquote>"})
+            return SlowResponse(200, body)
+
+    urls = [f"https://x.com/a/status/{i}" for i in range(20)] * 2
+    with patch.object(http_client, "get_session", new=AsyncMock(return_value=CountingSession())):
+        first = [tweet async for tweet in collector.stream_tweets(urls)]
+        second = await collector.collect_tweets(urls[:5])
+
+    assert len(first) == 20 and len(requested) == 20
+    assert peak <= 3
+    assert len(second) == 5 and len(requested) == 20
+
+
+@pytest.mark.asyncio
+async def test_x_embed_shares_collector_rate_limiter(mock_config, http_client):
+    """DataCollector의 호스트별 속도 제한기를 넘기면 oEmbed 요청도 같은 제한기를 거치는지 테스트합니다."""
+    data_collector = DataCollector(mock_config, http_client=http_client)
+    collector = XEmbedCollector(mock_config, http_client=http_client, rate_limiter=data_collector.rate_limiter)
+
+    class Session:
+        def get(self, url, params=None, **kwargs):
+            body = json.dumps({"url": params["url"], "author_name": "a", "html": "<blockquote>CSS tips</blockquote>"})
+            return FakeResponse(200, body)
+
+    with patch.object(http_client, "get_session", new=AsyncMock(return_value=Session())):
+        tweets = [tweet async for tweet in collector.stream_tweets(["https://x.com/a/status/1"])]
+
+    assert len(tweets) == 1
+    assert collector.rate_limiter is data_collector.rate_limiter
+    assert "publish.twitter.com" in data_collector.rate_limiter._limiters
+
+
+def test_http_client_closes_session_from_previous_loop():
+    """close() 없이 다른 이벤트 루프에서 세션을 요청하면 이전 세션을 닫고 새로 만드는지 테스트합니다."""
+    manager = HttpClientManager({})
+    first = asyncio.run(manager.get_session())
+    second = asyncio.run(manager.get_session())
+    assert first.closed and first is not second
+    asyncio.run(manager.close())
@@ -0,0 +1,43 @@
+import numpy as np
+
+from scrapper.dedup import cluster_near_duplicates, hamming_distances, simhash_titles
+
+
+def test_simhash_is_close_for_near_duplicate_titles():
+    """거의 같은 제목은 가깝고, 다른 제목은 먼 지문을 갖는지 테스트합니다."""
+    fingerprints, _ = simhash_titles([
+        "React 19 is now stable with new compiler and actions",
+        "React 19 is now stable with the new compiler and actions",
+        "A practical guide to CSS container queries in production",
+    ])
+    distances = hamming_distances(fingerprints[[0, 0]], fingerprints[[1, 2]])
+
+    assert distances[0] < distances[1]
+
+
+def test_hamming_distances_counts_bits():
+    a = np.array([0b1011, 0], dtype=np.uint64)
+    b = np.array([0b0001, np.iinfo(np.uint64).max], dtype=np.uint64)
+    assert hamming_distances(a, b).tolist() == [2, 64]
+
+
+def test_cluster_merges_same_story_across_sources():
+    """URL이 같거나 제목이 거의 같은 항목을 하나로 묶고 출처와 점수를 병합하는지 테스트합니다."""
+    data = {
+        "rss": [{"title": "Announcing TypeScript 5.6 beta release today", "link": "https://devblogs.example.com/ts-5-6?utm_source=rss"}],
+        "hackernews": [
+            {"title": "Announcing TypeScript 5.6 beta release today", "url": "https://devblogs.example.com/ts-5-6", "score": 300, "source": "Hacker News"},
+            {"title": "Show HN: A tiny CSS framework for dashboards", "url": "https://example.com/css", "score": 80, "source": "Hacker News"},
+        ],
+        "reddit": [{"title": "Announcing TypeScript 5.6 Beta release today!", "url": "https://reddit.com/r/typescript/comments/x1/", "score": 120, "source": "r/typescript"}],
+    }
+
+    deduped = cluster_near_duplicates(data)
+
+    assert deduped["rss"] == [] and deduped["reddit"] == []
+    representative = deduped["hackernews"][0]
+    assert representative["score"] == 300
+    assert representative["merged_score"] == 420
+    assert representative["duplicate_count"] == 2
+    assert representative["sources"] == ["Hacker News", "r/typescript", "rss"]
+    assert len(deduped["hackernews"]) == 2
@@ -0,0 +1,57 @@
+import asyncio
+
+import pytest
+
+from scrapper.hedging import LatencyHistogram, hedged_call
+
+
+def histograms(delay):
+    return {name: LatencyHistogram(initial_delay=delay) for name in ("gemini", "claude")}
+
+
+def provider(calls, name, delay, result):
+    async def call():
+        calls.append(f"{name}:start")
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            calls.append(f"{name}:cancelled")
+            raise
+        return result
+    return name, call
+
+
+@pytest.mark.asyncio
+async def test_slow_primary_is_hedged_and_cancelled():
+    """1순위가 지연 임계값 안에 답하지 않으면 2순위를 함께 호출하고, 먼저 성공한 쪽을 쓰고 나머지는 취소하는지 테스트합니다."""
+    calls = []
+    latency = histograms(0.05)
+    result = await hedged_call([provider(calls, "gemini", 1.0, "느림"), provider(calls, "claude", 0.01, "빠름")], latency)
+    assert result == "빠름"
+    assert calls == ["gemini:start", "claude:start", "gemini:cancelled"]
+    assert len(latency["claude"].samples) == 1 and latency["gemini"].samples[0] >= 0.05
+
+
+@pytest.mark.asyncio
+async def test_fast_primary_and_failure_fallback():
+    """1순위가 제때 답하면 2순위를 호출하지 않고, 실패하면 임계값을 기다리지 않고 바로 다음 제공자를 호출하는지 테스트합니다."""
+    calls = []
+    result = await hedged_call([provider(calls, "gemini", 0.01, "ok"), provider(calls, "claude", 0.01, "x")], histograms(1.0))
+    assert result == "ok" and calls == ["gemini:start"]
+
+    calls = []
+    started = asyncio.get_running_loop().time()
+    result = await hedged_call([provider(calls, "gemini", 0.01, None), provider(calls, "claude", 0.01, "대체")], histograms(5.0))
+    assert result == "대체" and asyncio.get_running_loop().time() - started < 1.0
+    assert await hedged_call([provider([], "gemini", 0, None)], histograms(1.0)) is None
+
+
+def test_hedge_delay_uses_rolling_p95():
+    latency = LatencyHistogram(window=20, min_samples=5, initial_delay=8.0, min_delay=0.5, max_delay=30.0)
+    assert latency.hedge_delay() == 8.0
+    for elapsed in [1.0] * 18 + [3.0, 10.0]:
+        latency.record(elapsed)
+    assert latency.hedge_delay() == 3.0
+    for _ in range(20):
+        latency.record(0.1)
+    assert latency.hedge_delay() == 0.5  # 오래된 표본은 창 밖으로 밀려나고, 최소값으로 제한
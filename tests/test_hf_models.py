@@ -0,0 +1,89 @@
+import asyncio
+
+import pytest
+
+from scrapper import hf_models
+from scrapper.hf_models import HuggingFaceModelManager
+from scrapper.llm_clients import HuggingFaceClient
+
+SIZES_MB = {"summarize": 1000, "classify": 1500, "sentiment": 500}
+
+
+class FakeClient(HuggingFaceClient):
+    """transformers 없이 로드/실행하고, 로드된 동안 SIZES_MB만큼 메모리를 쓰는 것으로 간주합니다."""
+    resident = set()
+
+    def __init__(self, name):
+        super().__init__("fake", name)
+        self.name = name
+
+    def load(self):
+        if self.pipeline is None:
+            FakeClient.resident.add(self.name)
+            self.pipeline = lambda text: f"{self.name}:{text}"
+
+    def unload(self):
+        FakeClient.resident.discard(self.name)
+        super().unload()
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    FakeClient.resident = set()
+    monkeypatch.setattr(hf_models, "current_rss_mb", lambda: 200 + sum(SIZES_MB[n] for n in FakeClient.resident))
+    manager = HuggingFaceModelManager(max_memory_mb=2600)
+    for name in SIZES_MB:
+        manager.register(name, FakeClient(name))
+    return manager
+
+
+@pytest.mark.asyncio
+async def test_models_load_on_first_use_and_evict_lru(manager):
+    """처음 쓸 때만 로드하고, 메모리 상한을 넘으면 가장 오래 쓰지 않은 모델을 내리는지 테스트합니다."""
+    assert FakeClient.resident == set()
+    assert await manager.run("summarize", "a") == "summarize:a"
+    assert await manager.run("sentiment", "b") == "sentiment:b"
+    await manager.run("summarize", "c")
+    assert FakeClient.resident == {"summarize", "sentiment"}
+
+    await manager.run("classify", "d")  # 1000 + 500 + 1500 > 2600 → 가장 오래 쓰지 않은 sentiment를 내림
+    assert FakeClient.resident == {"summarize", "classify"}
+
+    report = {row["name"]: row for row in manager.report()}
+    assert report["classify"]["rss_mb"] == 1500 and report["classify"]["loaded"]
+    assert report["sentiment"]["unloads"] == 1 and report["summarize"]["loads"] == 1
+
+
+@pytest.mark.asyncio
+async def test_preload_and_idle_unload(manager):
+    manager.preload(["sentiment"])
+    assert FakeClient.resident == {"sentiment"}
+
+    manager.idle_seconds = 0
+    await manager.run("summarize", "a")
+    manager.unload_idle()
+    assert FakeClient.resident == set()
+
+
+def test_concurrent_loads_in_separate_event_loops(manager):
+    """같은 관리자를 asyncio.run마다 재사용해도 로드 잠금이 이전 루프에 묶이지 않는지 테스트합니다."""
+    async def load_all():
+        return await asyncio.gather(*(manager.run(name, "x") for name in ("summarize", "sentiment")))
+
+    assert asyncio.run(load_all()) == ["summarize:x", "sentiment:x"]
+    for name in ("summarize", "sentiment"):
+        manager.models[name].client.unload()
+    assert asyncio.run(load_all()) == ["summarize:x", "sentiment:x"]
+
+
+def test_rss_fallback_converts_ru_maxrss_units(monkeypatch):
+    """/proc이 없을 때 ru_maxrss를 플랫폼 단위(macOS 바이트, Linux KB)에 맞게 MB로 바꾸는지 테스트합니다."""
+    def no_proc(*args, **kwargs):
+        raise OSError("no /proc")
+
+    monkeypatch.setattr(hf_models, "open", no_proc, raising=False)
+    monkeypatch.setattr(hf_models.resource, "getrusage", lambda who: type("Usage", (), {"ru_maxrss": 2 * 1024 * 1024})())
+    monkeypatch.setattr(hf_models.sys, "platform", "darwin")
+    assert hf_models.current_rss_mb() == 2
+    monkeypatch.setattr(hf_models.sys, "platform", "linux")
+    assert hf_models.current_rss_mb() == 2048
@@ -0,0 +1,26 @@
+import sys
+
+from scrapper.items import CollectedItem, dumps, loads
+
+
+def test_from_dict_normalizes_source_specific_keys():
+    """소스마다 다른 키(name/link/stars)를 하나의 스키마로 정규화하는지 테스트합니다."""
+    repo = CollectedItem.from_dict({"name": "vite", "link": "https://github.com/vitejs/vite", "stars": 120, "topics": ["build"]}, "github")
+
+    assert (repo.title, repo.url, repo.score, repo.source) == ("vite", "https://github.com/vitejs/vite", 120, "github")
+    assert repo.extra == {"topics": ["build"]}
+    # 아직 dict를 기대하는 코드를 위한 읽기 전용 접근
+    assert repo["stars"] == 120 and repo.get("name") == "vite" and repo.get("missing", "-") == "-"
+    assert CollectedItem.coerce(repo) is repo
+
+
+def test_slots_and_orjson_round_trip():
+    item = CollectedItem(title="CSS anchor positioning", url="https://a.test", score=42, source="Hacker News", published_at=1.5)
+    merged = item.replace(sources=["Hacker News", "rss"], merged_score=50, duplicate_count=1)
+
+    assert not hasattr(item, "__dict__")
+    assert sys.getsizeof(item) < sys.getsizeof(item.to_dict())
+    restored = loads(dumps({"hackernews": [merged]}))["hackernews"][0]
+    assert restored["merged_score"] == 50 and restored["sources"] == ["Hacker News", "rss"]
+    assert CollectedItem.from_dict(restored) == merged
+    assert merged.signal == 50 and item.signal == 42
@@ -0,0 +1,123 @@
+import asyncio
+
+import pytest
+from aiohttp import web
+
+from scrapper.ai_quota_manager import AIQuotaManager
+from scrapper.http_client import HttpClientManager
+from scrapper.key_pool import GeminiKeyPool
+from scrapper.llm_clients import GeminiClient, LLMError
+
+
+class FakeClient:
+    def __init__(self, name, calls, limited=False):
+        self.name = name
+        self.calls = calls
+        self.limited = limited
+
+    async def generate(self, prompt, generation_config=None):
+        self.calls.append(self.name)
+        if self.limited:
+            raise LLMError("gemini", "quota exceeded", 429)
+        return f"{self.name}:{prompt}"
+
+
+def make_pool(tmp_path, limited=(), **kwargs):
+    config = {
+        "OUTPUT_DIR": str(tmp_path),
+        "API_KEYS": {"collector": "k1", "analyzer": "k2", "emailer": "k3", "code_reviewer": None},
+    }
+    quota_manager = AIQuotaManager(config, http_client=HttpClientManager({}))
+    pool = GeminiKeyPool(config["API_KEYS"], "flash", HttpClientManager({}), quota_manager=quota_manager, **kwargs)
+    calls = []
+    for state in pool.keys.values():
+        state.client = FakeClient(state.name, calls, limited=state.name in limited)
+    return pool, quota_manager, calls
+
+
+@pytest.mark.asyncio
+async def test_routes_to_key_with_most_headroom(tmp_path):
+    """일일 사용량이 적은 키부터 쓰고, 분당 한도 안에서 요청을 키들에 고르게 나누는지 테스트합니다."""
+    pool, quota_manager, calls = make_pool(tmp_path, rpm_limit=4)
+    quota_manager.quota_status["gemini"]["collector"]["usage_today"] = 1450
+
+    assert await pool.generate("p") in ("analyzer:p", "emailer:p")
+    for _ in range(7):
+        await pool.generate("p")
+    assert sorted(calls) == ["analyzer"] * 4 + ["emailer"] * 4
+    assert await pool.generate("p") == "collector:p"  # 나머지 키의 분당 한도가 찼을 때만 사용
+    assert quota_manager.quota_status["gemini"]["analyzer"]["usage_today"] == 4
+    assert "code_reviewer" not in pool.keys
+
+
+@pytest.mark.asyncio
+async def test_fails_over_on_rate_limit_and_reports(tmp_path):
+    """429를 받은 키는 쉬게 하고 오류 없이 다른 키로 다시 보내는지 테스트합니다."""
+    pool, quota_manager, calls = make_pool(tmp_path, limited=("collector", "analyzer"), max_wait_seconds=0)
+
+    results = [await pool.generate(f"p{i}") for i in range(3)]
+    assert results == ["emailer:p0", "emailer:p1", "emailer:p2"]
+    report = {row["key"]: row for row in pool.report()}
+    assert report["collector"]["rate_limited"] == 1 and report["analyzer"]["rate_limited"] == 1
+    assert report["emailer"]["usage_today"] == 3 and report["emailer"]["requests"] == 3
+
+    for name in ("emailer",):
+        quota_manager.quota_status["gemini"][name]["usage_today"] = 1500
+    with pytest.raises(LLMError) as error:
+        await pool.generate("p")
+    assert error.value.status == 429
+
+
+@pytest.mark.asyncio
+async def test_daily_usage_resets_on_new_day_and_survives_restart(tmp_path):
+    """날짜가 바뀌면 키의 일일 사용량이 0으로 돌아가고, 한도 확인 없이도 오늘 사용량은 재시작 후 복원되는지 테스트합니다."""
+    pool, quota_manager, calls = make_pool(tmp_path)
+    status = quota_manager.quota_status["gemini"]["collector"]
+    status.update(usage_today=1500, usage_date="2000-01-01")
+    assert quota_manager.get_gemini_usage("collector") == (0, 1500)
+
+    await pool.generate("p")
+    quota_manager.save_cached_quota()
+    used = {name: quota_manager.get_gemini_usage(name)[0] for name in ("collector", "analyzer", "emailer")}
+    assert sum(used.values()) == 1
+
+    restarted = AIQuotaManager(quota_manager.config, http_client=HttpClientManager({}))
+    assert {name: restarted.get_gemini_usage(name)[0] for name in used} == used
+
+
+@pytest.mark.asyncio
+async def test_fails_over_on_generation_timeout(tmp_path):
+    """응답이 생성 타임아웃을 넘긴 키는 LLMError로 처리되고, 같은 요청이 다른 키로 다시 나가는지 테스트합니다."""
+    seen = []
+
+    async def generate(request):
+        key = request.headers["x-goog-api-key"]
+        seen.append(key)
+        if key == "slow":
+            await asyncio.sleep(0.5)
+        return web.json_response({"candidates": [{"content": {"parts": [{"text": key}]}}]})
+
+    app = web.Application()
+    app.router.add_post("/v1beta/models/{model}:generateContent", generate)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    base_url = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}/v1beta"
+
+    http_client = HttpClientManager({"HTTP_CLIENT_CONFIG": {"sources": {"gemini_generate": {"timeout": 0.2}}}})
+    pool = GeminiKeyPool({"collector": "slow", "analyzer": "fast"}, "flash", http_client, max_wait_seconds=0)
+    for state in pool.keys.values():
+        state.client = GeminiClient(state.client.api_key, "flash", http_client, base_url=base_url)
+    pool.keys["analyzer"].usage_today = 10  # 느린 키가 먼저 선택되도록
+    try:
+        assert await pool.generate("p") == "fast"
+        assert seen == ["slow", "fast"]
+
+        del pool.keys["analyzer"]
+        with pytest.raises(LLMError) as error:
+            await pool.generate("p")
+        assert error.value.status is None and isinstance(error.value.__cause__, asyncio.TimeoutError)
+    finally:
+        await http_client.close()
+        await runner.cleanup()
@@ -0,0 +1,68 @@
+import pytest
+
+from scrapper.llm_cache import LLMCache, make_cache_key
+
+
+def test_cache_key_ignores_prompt_whitespace_but_not_config():
+    a = make_cache_key("gemini", "m", "  요약해주세요.\n\n    내용: abc  ")
+    b = make_cache_key("gemini", "m", "요약해주세요.\n내용:   abc")
+    assert a == b
+    assert a != make_cache_key("gemini", "m", "요약해주세요.\n내용: abc", {"response_mime_type": "application/json"})
+    assert a != make_cache_key("claude", "m", "요약해주세요.\n내용: abc")
+
+
+@pytest.mark.asyncio
+async def test_get_or_generate_reuses_response_and_tracks_stats(tmp_path):
+    """같은 프롬프트는 한 번만 생성하고, 검증에 실패한 응답은 저장하지 않는지 테스트합니다."""
+    cache = LLMCache(str(tmp_path / "llm.sqlite3"))
+    calls = []
+
+    async def generate():
+        calls.append(1)
+        return '{"ok": true}'
+
+    assert await cache.get_or_generate("gemini", "m", "prompt", generate) == '{"ok": true}'
+    assert await cache.get_or_generate("gemini", "m", "prompt ", generate) == '{"ok": true}'
+    assert len(calls) == 1
+
+    async def broken():
+        return "not json"
+
+    await cache.get_or_generate("gemini", "m", "other", broken, validate=lambda text: text.startswith("{"))
+    assert cache.get("gemini", "m", "other") is None
+    assert cache.stats["hits"] == 1 and cache.stats["writes"] == 1
+
+    # 다른 프로세스가 같은 파일을 열어도 응답을 재사용합니다.
+    cache.close()
+    assert LLMCache(str(tmp_path / "llm.sqlite3")).get("gemini", "m", "prompt") == '{"ok": true}'
+
+
+def test_ttl_eviction_and_bypass(tmp_path, monkeypatch):
+    """만료, 항목 수 상한에 따른 LRU 제거, bypass 동작을 테스트합니다."""
+    clock = [1000.0]
+    monkeypatch.setattr("scrapper.llm_cache.time.time", lambda: clock[0])
+    cache = LLMCache(str(tmp_path / "llm.sqlite3"), ttl_seconds=100, max_entries=2)
+
+    cache.put("gemini", "m", "a", "A")
+    clock[0] += 1
+    cache.put("gemini", "m", "b", "B")
+    clock[0] += 1
+    assert cache.get("gemini", "m", "a") == "A"  # a를 최근 사용으로 갱신
+    clock[0] += 1
+    cache.put("gemini", "m", "c", "C")
+    assert cache.get("gemini", "m", "b") is None
+    assert cache.stats["evictions"] == 1
+
+    clock[0] += 200
+    assert cache.get("gemini", "m", "a") is None
+
+    cache.put("gemini", "m", "d", "D")
+    cache.bypass = True
+    assert cache.get("gemini", "m", "d") is None
+
+
+def test_from_config_honours_env_bypass(tmp_path, monkeypatch):
+    config = {"OUTPUT_DIR": str(tmp_path), "LLM_CACHE_CONFIG": {"enabled": True}}
+    monkeypatch.setenv("LLM_CACHE_BYPASS", "1")
+    assert LLMCache.from_config(config).bypass
+    assert LLMCache.from_config({"LLM_CACHE_CONFIG": {"enabled": False}}) is None
@@ -0,0 +1,60 @@
+import asyncio
+
+import pytest
+from aiohttp import web
+
+from scrapper.http_client import HttpClientManager
+from scrapper.llm_clients import GeminiClient, HuggingFaceClient, LLMError
+
+
+@pytest.mark.asyncio
+async def test_gemini_clients_with_different_keys_run_in_parallel():
+    """키가 다른 클라이언트를 동시에 써도 각 요청이 자기 키와 모델로 나가는지 테스트합니다."""
+    seen = []
+
+    async def generate(request):
+        body = await request.json()
+        key = request.headers["x-goog-api-key"]
+        seen.append((key, request.match_info["model"], body.get("generationConfig")))
+        await asyncio.sleep(0.01)
+        if key == "limited":
+            return web.json_response({"error": {"message": "quota exceeded"}}, status=429)
+        prompt = body["contents"][0]["parts"][0]["text"]
+        return web.json_response({"candidates": [{"content": {"parts": [{"text": f"{key}:{prompt}"}]}}]})
+
+    app = web.Application()
+    app.router.add_post("/v1beta/models/{model}:generateContent", generate)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    base_url = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}/v1beta"
+
+    http_client = HttpClientManager({})
+    try:
+        clients = [GeminiClient(key, "flash", http_client, base_url=base_url) for key in ("collector", "analyzer")]
+        results = await asyncio.gather(*(
+            client.generate(f"p{i}", {"response_mime_type": "application/json"})
+            for i in range(3) for client in clients
+        ))
+        assert sorted(results) == sorted(f"{key}:p{i}" for i in range(3) for key in ("collector", "analyzer"))
+        assert {config["responseMimeType"] for _, _, config in seen} == {"application/json"}
+
+        with pytest.raises(LLMError) as error:
+            await GeminiClient("limited", "flash", http_client, base_url=base_url).generate("p")
+        assert error.value.status == 429 and "quota exceeded" in str(error.value)
+    finally:
+        await http_client.close()
+        await runner.cleanup()
+
+
+def test_huggingface_client_can_be_reused_across_event_loops():
+    """같은 클라이언트를 asyncio.run마다 재사용하고 동시에 호출해도 잠금이 이전 루프에 묶이지 않는지 테스트합니다."""
+    client = HuggingFaceClient("fake", "fake-model")
+    client.pipeline = lambda text: text.upper()
+
+    async def run_twice():
+        return await asyncio.gather(client.run("a"), client.run("b"))
+
+    assert asyncio.run(run_twice()) == ["A", "B"]
+    assert asyncio.run(run_twice()) == ["A", "B"]
@@ -0,0 +1,41 @@
+import numpy as np
+
+from scrapper.ranking import BM25Ranker, SelectionHistory, build_query_weights, rank_candidates, tokenize
+
+
+def test_tokenize_keeps_dotted_names_and_bigrams():
+    assert tokenize("Next.js and CSS Grid") == ["next.js", "and", "css", "grid", "next.js and", "and css", "css grid"]
+
+
+def test_bm25_prefers_documents_matching_query_terms():
+    """질의 단어를 더 많이, 더 드물게 포함한 문서가 높은 점수를 받는지 테스트합니다."""
+    scores = BM25Ranker().score(
+        ["CSS container queries in practice", "Gardening tips for spring", "CSS tips", ""],
+        build_query_weights(["css", "container queries"], []),
+    )
+    assert scores[0] > scores[2] > scores[1] == 0
+    assert scores[3] == 0
+
+
+def test_rank_candidates_keeps_top_k_with_source_cap(tmp_path):
+    """상위 top_k개만 남기고, 과거 선별 이력과 소스별 상한을 반영하는지 테스트합니다."""
+    history = SelectionHistory(str(tmp_path / "history.json"))
+    history.add(["Deep dive into web components and shadow dom"])
+    data = {
+        "rss": [{"title": f"React hooks guide part {i}", "link": f"https://a.test/{i}"} for i in range(5)],
+        "hackernews": [
+            {"title": "Shadow DOM styling with web components", "url": "https://b.test/1", "score": 10},
+            {"title": "Quarterly earnings call", "url": "https://b.test/2", "score": 900},
+        ],
+        "github": [],
+        "errors": "kept as is",
+    }
+    weights = build_query_weights(["react"], SelectionHistory(str(tmp_path / "history.json")).titles)
+
+    ranked = rank_candidates(data, weights, top_k=4, max_per_source=3)
+
+    assert len(ranked["rss"]) == 3
+    assert [item["url"] for item in ranked["hackernews"]] == ["https://b.test/1"]
+    assert ranked["github"] == [] and ranked["errors"] == "kept as is"
+    assert sum(len(items) for items in ranked.values() if isinstance(items, list)) == 4
+    assert np.isfinite(BM25Ranker().score(["a"], {})).all()
@@ -0,0 +1,54 @@
+import pytest
+
+from scrapper.benchmark import benchmark_config, run_benchmark
+from scrapper.collectors import DataCollector
+from scrapper.replay import ReplayHttpClient, interaction_key
+from scrapper.stand_in_servers import StandInProfile, StandInServers
+
+BASE_CONFIG = {
+    "FILTER_KEYWORDS": {"must_have_any": ["react", "css", "typescript", "ai"], "exclude": ["job"]},
+    "REDDIT_CONFIG": {"subreddits": ["webdev", "css", "reactjs"], "post_limit": 5, "time_filter": "week", "multireddit_size": 2},
+    "HN_CONFIG": {"min_score": 0, "story_limit": 5, "batch_size": 5},
+    "GITHUB_CONFIG": {"languages": ["typescript", "css"]},
+}
+
+
+def test_interaction_key_ignores_param_order():
+    assert interaction_key("get", "https://a.test/x?b=2", {"a": 1}) == interaction_key("GET", "https://a.test/x?a=1&b=2")
+
+
+@pytest.mark.asyncio
+async def test_record_then_replay_without_servers(tmp_path):
+    """스탠드인 서버 응답을 녹화한 뒤, 서버 없이 같은 결과를 재생하는지 테스트합니다."""
+    cassette = str(tmp_path / "collect.json")
+    async with StandInServers(seed=1) as servers:
+        config = benchmark_config(BASE_CONFIG, servers, rss_feeds=2, output_dir=str(tmp_path / "live"))
+        async with ReplayHttpClient(config, "record", cassette) as http_client:
+            recorded = await DataCollector(config, http_client=http_client).collect_all()
+        live_requests = sum(servers.request_counts.values())
+
+    assert all(recorded[source] for source in ("rss", "reddit", "hackernews", "github"))
+
+    config = benchmark_config(BASE_CONFIG, servers, rss_feeds=2, output_dir=str(tmp_path / "replay"))
+    DataCollector._reddit_tokens.clear()
+    async with ReplayHttpClient(config, "replay", cassette) as http_client:
+        replayed = await DataCollector(config, http_client=http_client).collect_all()
+
+    assert {source: [item.get("title") or item.get("name") for item in items] for source, items in replayed.items()} == \
+           {source: [item.get("title") or item.get("name") for item in items] for source, items in recorded.items()}
+    assert live_requests > 0
+
+
+@pytest.mark.asyncio
+async def test_benchmark_reports_throughput_and_percentiles():
+    """오류가 섞인 스탠드인 서버를 상대로 벤치마크가 측정값을 보고하는지 테스트합니다."""
+    reports = await run_benchmark(
+        {**BASE_CONFIG, "RETRY_CONFIG": {"default": {"base_delay": 0}}},
+        runs=1, rss_feeds=3, profile=StandInProfile(latency=0.001, error_rate=0.1, items=10), port=0,
+    )
+
+    report = reports[0]
+    assert report["requests"] > 0 and report["requests_per_second"] > 0
+    assert report["peak_memory_mb"] > 0
+    assert set(report["latency"]) >= {"rss", "hackernews", "github", "reddit"}
+    assert report["latency"]["hackernews"]["p50_ms"] <= report["latency"]["hackernews"]["p99_ms"]
@@ -0,0 +1,98 @@
+import asyncio
+import json
+from datetime import datetime
+
+import pytest
+
+from scrapper.multi_agent_system import AgentOutput, AnalyzerAgent
+from scrapper.token_budget import chunk_lines, estimate_tokens, split_text
+
+
+def test_estimate_tokens_counts_korean_per_character():
+    assert estimate_tokens("abcd" * 10) == 10
+    assert estimate_tokens("한국어") == 3
+    assert estimate_tokens("") == 0
+
+
+def test_split_text_respects_budget_without_dropping_content():
+    """예산을 넘는 줄과 공백 없는 긴 단어도 잘라내되 내용은 버리지 않는지 테스트합니다."""
+    text = "\n".join([f"line {i} " + "word " * 30 for i in range(5)] + ["x" * 500, "가" * 120])
+    chunks = split_text(text, budget=40)
+
+    assert all(estimate_tokens(chunk) <= 40 for chunk in chunks)
+    assert "".join("".join(chunks).split()) == "".join(text.split())
+    assert chunk_lines(["a", "", "b"], budget=100) == ["a\nb"]
+
+
+class FakeClient:
+    provider = "gemini"
+    model = "fake"
+
+    def __init__(self):
+        self.prompts = []
+        self.active = 0
+        self.max_active = 0
+
+    async def generate(self, prompt, generation_config=None):
+        self.prompts.append(prompt)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        if "묶음별 요약" in prompt:
+            body = {"executive_summary": "종합 요약", "keyword_suggestions": {"suggested_keywords": ["css"], "deprecated_keywords": []}}
+        else:
+            titles = [line.strip()[2:].split(" (URL")[0] for line in prompt.splitlines() if line.strip().startswith("- Article")]
+            body = {
+                "detailed_articles": [{"title": title.strip()} for title in titles],
+                "technical_report": {"new_html_tags": ["dialog"], "notable_css_properties": [], "css_tricks": []},
+                "keyword_suggestions": {"suggested_keywords": ["css", "popover"], "deprecated_keywords": []},
+                "executive_summary": f"{len(titles)}개 아티클 요약",
+            }
+        return json.dumps(body, ensure_ascii=False)
+
+
+@pytest.mark.asyncio
+async def test_analyzer_map_reduces_when_prompt_exceeds_budget():
+    """예산을 넘는 입력은 묶음으로 나눠 동시에 분석하고, 모든 아티클을 빠짐없이 합치는지 테스트합니다."""
+    config = {
+        "API_KEYS": {"analyzer": "test-key"},
+        "FILTER_KEYWORDS": {"must_have_any": ["css"]},
+        "TOKEN_BUDGET_CONFIG": {"analyzer_max_prompt_tokens": 900, "max_concurrency": 3},
+    }
+    agent = AnalyzerAgent(config)
+    agent.llm = FakeClient()
+    agent.llm_cache = None
+    items = [{"title": f"Article {i}", "url": f"https://a.test/{i}", "source": "rss"} for i in range(60)]
+
+    output = AgentOutput(start_time=datetime.now())
+    output.intelligent_filtered_data = {"relevant_items": items}
+    output = await agent.run(output)
+
+    result = output.analysis_result
+    assert [article["title"] for article in result["detailed_articles"]] == [f"Article {i}" for i in range(60)]
+    assert result["technical_report"]["new_html_tags"] == ["dialog"]
+    assert result["keyword_suggestions"]["suggested_keywords"] == ["css"]
+    assert result["executive_summary"] == "종합 요약"
+    assert len(agent.llm.prompts) > 2
+    assert 1 < agent.llm.max_active <= 3
+    assert all(estimate_tokens(prompt) <= 900 for prompt in agent.llm.prompts)
+
+
+def test_analyzer_map_reduce_survives_separate_event_loops():
+    """스케줄러처럼 같은 에이전트를 asyncio.run마다 재사용해도 세마포어가 이전 루프에 묶이지 않는지 테스트합니다."""
+    config = {
+        "API_KEYS": {"analyzer": "test-key"},
+        "FILTER_KEYWORDS": {"must_have_any": ["css"]},
+        "TOKEN_BUDGET_CONFIG": {"analyzer_max_prompt_tokens": 900, "max_concurrency": 2},
+    }
+    agent = AnalyzerAgent(config)
+    agent.llm = FakeClient()
+    agent.llm_cache = None
+    items = [{"title": f"Article {i}", "url": f"https://a.test/{i}", "source": "rss"} for i in range(60)]
+
+    for _ in range(2):
+        output = AgentOutput(start_time=datetime.now())
+        output.intelligent_filtered_data = {"relevant_items": items}
+        output = asyncio.run(agent.run(output))
+        assert "error" not in output.analysis_result